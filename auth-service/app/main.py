@@ -6,6 +6,7 @@
 from fastapi import FastAPI
 # Used to manage application startup and shutdown lifecycle
 from contextlib import asynccontextmanager
+import asyncio
 # Middleware for server-side sessions (cookies, session storage)
 from starlette.middleware.sessions import SessionMiddleware
 
@@ -13,8 +14,20 @@ from starlette.middleware.sessions import SessionMiddleware
 import os
 # Loads environment variables from .env file
 from dotenv import load_dotenv
-# Function that initializes database connection / tables
-from .utils.init_data_base import init_db
+# Checks that database migrations were applied (schema is created once per deploy)
+from .utils.init_data_base import check_db_schema
+# Fast /token/verify endpoint handled before FastAPI routing
+from .middleware.token_verify_middleware import TokenVerifyMiddleware
+# Role catalog cache
+from .utils.roles_cache import load_role_catalog
+# Role versions map (stale access tokens detection)
+from .utils.role_versions import load_role_versions, refresh_role_versions_forever
+from .utils.revocation_list import load_revocations, sync_revocations_forever
+from .dependencies.data_base_connection import async_session
+# Deletes expired refresh tokens in the background
+from .services.tokens_management.sweep_tokens_service import sweep_refresh_tokens_forever
+# Stops password hashing worker processes
+from .services.passwords.passwords_service import shutdown_password_pool
 
 # Import all API routers (each router = separate feature)
 from .routers import (
@@ -23,7 +36,10 @@ from .routers import (
     read_users_route,     # get user data
     modify_user_route,    # update user data
     activity_route,       # user activity management (deactivate / activate)
-    roles_route           # user roles and permissions
+    roles_route,          # user roles and permissions
+    provision_route,      # bulk user provisioning
+    jwks_route,           # public keys for access token verification
+    metrics_route         # internal service metrics
 )
 
 # =========================
@@ -32,12 +48,33 @@ from .routers import (
 # This function runs on app startup and shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Initialize database when application starts
-    await init_db()
+    # Fail fast if migrations were not applied (one query, no DDL)
+    await check_db_schema()
+    # Load role catalog into memory (used by admin checks)
+    async with async_session() as db:
+        await load_role_catalog(db)
+        await load_role_versions(db)
+        await load_revocations(db)
+    # Keep role versions and revoked tokens in sync with other workers
+    role_versions_task = asyncio.create_task(
+        refresh_role_versions_forever(async_session)
+    )
+    revocations_task = asyncio.create_task(
+        sync_revocations_forever(async_session)
+    )
+    # Delete expired refresh tokens on an interval
+    sweeper_task = asyncio.create_task(
+        sweep_refresh_tokens_forever(async_session)
+    )
     # Application works while this yield exists
     yield
 
-    # (Optional) place cleanup logic here if needed
+    role_versions_task.cancel()
+    revocations_task.cancel()
+    sweeper_task.cancel()
+
+    # Stop password hashing process pool
+    shutdown_password_pool()
 
 
 # =========================
@@ -52,9 +89,19 @@ app = FastAPI(lifespan=lifespan)
 # Load variables from .env file into environment
 load_dotenv()
 
+# Session cookie secret (Google login state), required also when tokens use EdDSA / RS256
+SESSION_SECRET_KEY = os.getenv("SECRET_KEY")
+
+if not SESSION_SECRET_KEY:
+    raise RuntimeError("SECRET_KEY is required (signs the OAuth session cookie)")
+
 # Add session middleware
 # Used for session-based authentication or temporary user data
-app.add_middleware(SessionMiddleware, secret_key=os.getenv("SECRET_KEY"))
+app.add_middleware(SessionMiddleware, secret_key=SESSION_SECRET_KEY)
+
+# Add token verification fast path (outermost middleware)
+# Answers GET /token/verify for the gateway without routing, DI or pydantic
+app.add_middleware(TokenVerifyMiddleware)
 
 
 # =========================
@@ -67,4 +114,7 @@ app.include_router(refresh_route.router)          # /refresh/*
 app.include_router(read_users_route.router)       # /users/*
 app.include_router(modify_user_route.router)      # /modify/*
 app.include_router(activity_route.router)         # /activity/*
-app.include_router(roles_route.router)            # /roles/*
\ No newline at end of file
+app.include_router(roles_route.router)            # /roles/*
+app.include_router(provision_route.router)        # /provision/*
+app.include_router(metrics_route.router)          # /metrics/*
+app.include_router(jwks_route.router)             # /.well-known/jwks.json
\ No newline at end of file
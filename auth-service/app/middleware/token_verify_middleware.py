@@ -0,0 +1,172 @@
+# =========================
+# Fast access token verification (ASGI)
+# =========================
+
+# Imports
+# Libraries
+from collections import OrderedDict
+import jwt
+import time
+import os
+from dotenv import load_dotenv
+# Dependencies
+from ..dependencies.data_base_connection import async_session
+# Utils
+from ..utils.roles_cache import get_user_role_names
+from ..utils.role_versions import get_role_version
+from ..utils.revocation_list import is_revoked
+from ..utils.signing_keys import decode_token
+
+
+"""
+Minimal verification endpoint used by the nginx gateway (auth_request).
+
+It is handled before FastAPI routing: no dependency injection, no pydantic models,
+empty response body. Decoded claims are cached per token until the token expires.
+"""
+
+
+# =========================
+# Load environment variables
+# =========================
+load_dotenv()
+
+# Max seconds the gateway may cache a positive decision (revocations are not seen until it expires)
+AUTH_CHECK_CACHE_MAX_SECONDS = int(os.getenv("AUTH_CHECK_CACHE_MAX_SECONDS", "5"))
+# Max number of tokens kept in the in-memory claims cache
+TOKEN_CLAIMS_CACHE_SIZE = int(os.getenv("TOKEN_CLAIMS_CACHE_SIZE", "10000"))
+
+VERIFY_PATH = "/token/verify"
+
+
+# =========================
+# Claims cache
+# =========================
+# token -> (exp timestamp, user id, role version, session id,
+#           user id header value, roles header value)
+Claims = tuple[float, int, int, int | None, bytes, bytes]
+# Least recently used first; expired entries are dropped when read (_verify)
+_claims_cache: OrderedDict[str, Claims] = OrderedDict()
+
+
+def _cache_put(token: str, claims: Claims) -> None:
+    """
+    Stores claims, dropping the least recently used entry when the cache is full.
+    """
+    _claims_cache[token] = claims
+
+    while len(_claims_cache) > TOKEN_CLAIMS_CACHE_SIZE:
+        _claims_cache.popitem(last=False)
+
+
+def clear_claims_cache() -> None:
+    """
+    Drops all cached claims.
+    """
+    _claims_cache.clear()
+
+
+# =========================
+# Token verification
+# =========================
+async def _verify(token: str) -> Claims | None:
+    """
+    Returns cached or freshly decoded claims,
+    None if token is invalid, expired, revoked or issued before the user's last role change.
+    """
+    claims = _claims_cache.get(token)
+
+    if claims is None:
+        try:
+            payload = decode_token(token)
+            user_id = int(payload["sub"])
+            exp = float(payload["exp"])
+            role_version = int(payload.get("role_version", -1))
+            session_id = payload.get("sid")
+        except (jwt.PyJWTError, KeyError, TypeError, ValueError):
+            return None
+
+        # Roles come from the token, older tokens without "roles" are looked up once
+        role_names = payload.get("roles")
+        if role_names is None:
+            async with async_session() as db:
+                role_names = await get_user_role_names(user_id, db)
+
+        claims = (
+            exp,
+            user_id,
+            role_version,
+            session_id,
+            str(user_id).encode(),
+            ",".join(role_names).encode(),
+        )
+        _cache_put(token, claims)
+    else:
+        _claims_cache.move_to_end(token)
+
+    exp, user_id, role_version, session_id, _, _ = claims
+
+    if exp <= time.time():
+        _claims_cache.pop(token, None)
+        return None
+
+    # -1 -> token without role_version claim, not checked
+    if role_version != -1 and role_version < get_role_version(user_id):
+        return None
+
+    # Deactivated user or ended session
+    if is_revoked(user_id, session_id):
+        return None
+
+    return claims
+
+
+# =========================
+# ASGI middleware
+# =========================
+class TokenVerifyMiddleware:
+    """
+    Answers GET /token/verify directly:
+    - 204 + X-User-Id / X-User-Roles / X-Accel-Expires for a valid token
+    - 401 otherwise
+    Every other request is passed to the wrapped application.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != VERIFY_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        token = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, credentials = value.decode("latin-1").partition(" ")
+                if scheme.lower() == "bearer" and credentials:
+                    token = credentials
+                break
+
+        claims = await _verify(token) if token else None
+
+        if claims is None:
+            await send({
+                "type": "http.response.start",
+                "status": 401,
+                "headers": [(b"content-length", b"0")],
+            })
+        else:
+            exp, _, _, _, user_id, roles = claims
+            ttl = max(0, min(int(exp - time.time()), AUTH_CHECK_CACHE_MAX_SECONDS))
+            await send({
+                "type": "http.response.start",
+                "status": 204,
+                "headers": [
+                    (b"x-user-id", user_id),
+                    (b"x-user-roles", roles),
+                    (b"x-accel-expires", str(ttl).encode()),
+                ],
+            })
+
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,35 @@
+# =========================
+# Revocation model
+# =========================
+
+# Imports
+from sqlmodel import Field, SQLModel
+from datetime import datetime
+# Utils
+from ..utils.current_date import get_current_date
+
+
+# =========================
+# Revocation table in database
+# =========================
+class RevocationModel(SQLModel, table=True):
+    """
+    Access token revocation shared by all workers (read by utils/revocation_list).
+    Rows are only needed while access tokens issued before them can be valid,
+    the sweeper deletes older ones.
+
+    Attributes:
+    - id (int): Primary key
+    - kind (str): "user" (deactivated), "restore" (activated again) or "session" (ended refresh token)
+    - subject_id (int): User ID ("user", "restore") or session ID ("session")
+    - created_at (datetime): Date and time of the revocation (indexed, workers load new rows)
+    """
+    __tablename__ = 'revocations'
+
+    id: int = Field(default=None, primary_key=True)                 # Primary key
+    kind: str = Field(max_length=16)                                # Revocation kind
+    subject_id: int                                                 # User or session ID
+    created_at: datetime = Field(                                   # Creation date
+        default_factory=get_current_date,
+        index=True
+    )
@@ -0,0 +1,23 @@
+# =========================
+# Schema version model
+# =========================
+
+# Imports
+from sqlmodel import Field, SQLModel
+
+
+# =========================
+# Schema version table in database
+# =========================
+class SchemaVersionModel(SQLModel, table=True):
+    """
+    Single row with the version of the applied schema migrations.
+
+    Attributes:
+    - id (int): Always 1 (one row table)
+    - version (int): Number of the last applied migration
+    """
+    __tablename__ = 'schema_version'
+
+    id: int = Field(default=1, primary_key=True)    # Primary key (single row)
+    version: int = Field(default=0)                 # Last applied migration
@@ -5,6 +5,7 @@
 # Imports
 # Libraries
 from sqlmodel import Field, SQLModel  # SQLModel base and fields
+from sqlalchemy import Index  # Composite indexes
 from datetime import datetime, timedelta, timezone  # Date and time handling
 # Utils
 from ..utils.current_date import get_current_date  # Utility to get current datetime
@@ -20,23 +21,30 @@ class TokenModel(SQLModel, table=True):
     Attributes:
     - id (int): Primary key, unique identifier of the token
     - user_id (int): ID of the user associated with this token (foreign key to users table)
-    - refresh_token (str): The actual refresh token string
+    - token_hash (str): SHA-256 hex digest of the refresh token (the token itself is never stored)
     - expires_at (datetime): Expiration date and time of the token
     - created_at (datetime): Date and time when the token was created
     """
     __tablename__ = 'tokens'
-
+    __table_args__ = (
+        # Sessions of one user, newest first (login prune, sweeper per-user limit)
+        Index("ix_tokens_user_id_created_at", "user_id", "created_at"),
+        # IDs are session IDs ("sid") in the revocation list: SQLite must never reuse them
+        {"sqlite_autoincrement": True},
+    )
 
     id: int = Field(default=None, primary_key=True)         # Primary key
     user_id: int = Field(foreign_key="users.id")            # Reference to users table
 
-    refresh_token: str = Field(                             # Refresh token
-        max_length=255, 
+    token_hash: str = Field(                                # Refresh token hash
+        max_length=64,
+        unique=True,
         index=True
-    )  
+    )
 
-    expires_at: datetime = Field(                           # Expiration date
-        default_factory=lambda: get_current_date() + timedelta(days=7)
+    expires_at: datetime = Field(                           # Expiration date (indexed for the sweeper)
+        default_factory=lambda: get_current_date() + timedelta(days=7),
+        index=True
     )
 
     created_at: datetime = Field(                           # Creation date
@@ -4,6 +4,7 @@
 
 # Imports
 from sqlmodel import Field, SQLModel
+from sqlalchemy import Index
 from typing import Optional
 from datetime import datetime
 # Utils
@@ -26,8 +27,29 @@ class UserModel(SQLModel, table=True):
     - auth_provider (str): Authentication provider ("local" or "google")
     - created_at (datetime): Timestamp of user creation
     - active (bool): User status (active=True, banned/disabled=False)
+    - role_version (int): Incremented on every role change, stored in access tokens
+    - role_changed_at (datetime): Time of the last role_version change
     """
     __tablename__ = 'users'
+    __table_args__ = (
+        # Role versions changed within the access token lifetime (role_versions.py)
+        Index("ix_users_role_changed_at", "role_changed_at"),
+        # Keyset pagination order of the users listing
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Substring search (ILIKE '%term%'), PostgreSQL pg_trgm only
+        Index(
+            "ix_users_username_trgm",
+            "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Optional[int] = Field(              # Primary key
         default=None, 
@@ -63,3 +85,9 @@ class UserModel(SQLModel, table=True):
     active: bool = Field(                   # User status
         default=True
     )  
+    role_version: int = Field(              # Roles version (stale token detection)
+        default=0
+    )
+    role_changed_at: Optional[datetime] = Field(    # Last role version change
+        default=None
+    )
@@ -4,6 +4,7 @@
 
 # Imports
 from sqlmodel import Field, SQLModel
+from sqlalchemy import Index
 
 
 # =========================
@@ -19,9 +20,13 @@ class UserRoleModel(SQLModel, table=True):
     
     Notes:
     - Composite primary key: (user_id, role_id)
+    - Index (role_id, user_id): users of one role in user_id order (listing by role)
     - Each row represents one role assigned to one user
     """
     __tablename__ = 'user_roles'
+    __table_args__ = (
+        Index("ix_user_roles_role_id_user_id", "role_id", "user_id"),
+    )
 
     user_id: int = Field(
         foreign_key="users.id",  # Reference to users table
@@ -2,3 +2,5 @@ from .User import UserModel
 from .Role import RoleModel
 from .UserRole import UserRoleModel
 from .Token import TokenModel
+from .SchemaVersion import SchemaVersionModel
+from .Revocation import RevocationModel
@@ -15,7 +15,6 @@ from fastapi.security import (
     OAuth2PasswordRequestForm
 )
 from fastapi.responses import RedirectResponse
-from authlib.integrations.starlette_client import OAuth
 from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Annotated
 import os
@@ -31,6 +30,8 @@ from ..services.auth.logout_service import logout
 from ..services.auth.google_auth_service import google_auth_callback
 # Dependencies
 from ..dependencies.data_base_connection import get_db
+# Utils
+from ..utils.google_oauth import get_google_oauth
 
 
 # =========================
@@ -78,19 +79,7 @@ async def user_login_endpoint(
 # http://localhost:8000/auth/google/callback - callback redirect to frontend
 # ============================================================
 
-oauth = OAuth()
-
-CONF_URL = "https://accounts.google.com/.well-known/openid-configuration"
-
-oauth.register(
-    name="google",
-    client_id=os.getenv("GOOGLE_CLIENT_ID"),
-    client_secret=os.getenv("GOOGLE_CLIENT_SECRET"),
-    server_metadata_url=CONF_URL,
-    client_kwargs={
-        "scope": "openid email profile",
-    },
-)
+# OAuth client is created on the first Google request (authlib imported lazily)
 
 
 # ============================================================
@@ -105,6 +94,7 @@ async def get_google_login(request: Request):
     http://localhost:8000/auth/google/login
     '''
     redirect_uri = os.getenv("GOOGLE_REDIRECT_URI")
+    oauth = get_google_oauth()
     return await oauth.google.authorize_redirect(
         request,
         redirect_uri
@@ -123,7 +113,7 @@ async def google_auth_handler(
     '''
     Handle Google callback
     '''
-    tokens = await google_auth_callback(oauth, db, request)
+    tokens = await google_auth_callback(get_google_oauth(), db, request)
 
     frontend_url = os.getenv(
         "FRONTEND_URL",
@@ -0,0 +1,32 @@
+# =========================
+# Public signing keys (JWKS)
+# =========================
+
+# Imports
+from fastapi import APIRouter, Response
+# Utils
+from ..utils.signing_keys import get_jwks
+
+
+# =========================
+# Router setup
+# =========================
+router = APIRouter(
+    prefix="/.well-known",  # Standard location of public metadata
+    tags=["Public signing keys"]    # Tag for docs grouping
+)
+
+
+# =========================
+# JWKS endpoint
+# =========================
+@router.get("/jwks.json")
+async def jwks_endpoint(response: Response):
+    """
+    Returns public keys that verify access tokens (by "kid").
+    Other services cache them and verify tokens locally.
+    """
+    # Keys change only on rotation, let clients and proxies cache them
+    response.headers["Cache-Control"] = "public, max-age=300"
+
+    return get_jwks()
@@ -0,0 +1,58 @@
+# =========================
+# Service metrics
+# =========================
+
+# Imports
+from fastapi import APIRouter
+# Services
+from ..services.passwords.passwords_service import get_password_pool_metrics
+from ..services.tokens_management.sweep_tokens_service import get_sweeper_stats
+# Utils
+from ..utils.roles_cache import get_roles_cache_stats
+# Schemas
+from ..schemas.metrics.password_metrics_schema import PasswordMetricsSchema
+from ..schemas.metrics.roles_cache_metrics_schema import RolesCacheMetricsSchema
+from ..schemas.metrics.refresh_tokens_metrics_schema import RefreshTokensMetricsSchema
+
+
+# =========================
+# Router setup
+# =========================
+router = APIRouter(
+    prefix="/metrics",  # All endpoints start with /metrics
+    tags=["Service metrics [Internal, not exposed by the gateway]"]  # Tag for docs grouping
+)
+
+
+# =========================
+# Password hashing metrics
+# =========================
+@router.get("/passwords", response_model=PasswordMetricsSchema)
+async def password_metrics_endpoint():
+    """
+    Returns password hashing queue depth and latency.
+    """
+    return get_password_pool_metrics()
+
+
+# =========================
+# Roles cache metrics
+# =========================
+@router.get("/roles-cache", response_model=RolesCacheMetricsSchema)
+async def roles_cache_metrics_endpoint():
+    """
+    Returns user roles cache hit ratio.
+    """
+    return get_roles_cache_stats()
+
+
+
+# =========================
+# Refresh tokens sweeper metrics
+# =========================
+@router.get("/refresh-tokens", response_model=RefreshTokensMetricsSchema)
+async def refresh_tokens_metrics_endpoint():
+    """
+    Returns swept and remaining refresh token rows.
+    """
+    return get_sweeper_stats()
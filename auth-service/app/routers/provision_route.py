@@ -0,0 +1,80 @@
+# =========================
+# Bulk user provisioning service
+# =========================
+
+# Imports
+from fastapi import APIRouter, Depends, Request
+from typing import Annotated
+from sqlmodel.ext.asyncio.session import AsyncSession
+# Services
+from ..services.provisioning.provision_users_service import provision_users, parse_users_csv
+# Dependencies
+from ..dependencies.data_base_connection import get_db
+from ..dependencies.admin_dependency import get_admin_user_id
+# Schemas
+from ..schemas.provisioning.provision_users_schema import (
+    ProvisionUsersSchema,
+    ProvisionUsersResponseSchema
+)
+
+
+# =========================
+# Router setup
+# =========================
+router = APIRouter(
+    prefix="/provision",    # All endpoints start with /provision
+    tags=["Bulk user provisioning [Only for admins]"]   # Tag for docs grouping
+)
+
+
+# =========================
+# Provision users from JSON
+# =========================
+@router.post("/users", response_model=ProvisionUsersResponseSchema)
+async def provision_users_endpoint(
+    data: ProvisionUsersSchema,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    admin_user_id: int = Depends(get_admin_user_id),
+):
+    """
+    Create many users at once (no tokens are issued).
+
+    Steps:
+    1. Verify that requester is admin
+    2. Skip duplicates and existing usernames / emails
+    3. Hash passwords in parallel, insert users and default role in one transaction
+    4. Return outcome per user
+    """
+
+    return await provision_users(rows=data.users, db=db)
+
+
+# =========================
+# Provision users from CSV
+# =========================
+@router.post(
+    "/users/csv",
+    response_model=ProvisionUsersResponseSchema,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"text/csv": {"schema": {"type": "string"}}}
+        }
+    }
+)
+async def provision_users_csv_endpoint(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    admin_user_id: int = Depends(get_admin_user_id),
+):
+    """
+    Create many users from CSV body (header: username,email,password).
+
+    Steps:
+    1. Verify that requester is admin
+    2. Parse and validate rows (invalid rows are reported, not created)
+    3. Same as JSON provisioning
+    """
+    content = (await request.body()).decode("utf-8-sig")
+
+    return await provision_users(rows=parse_users_csv(content), db=db)
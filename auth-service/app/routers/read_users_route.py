@@ -3,16 +3,16 @@
 # =========================
 
 # Imports
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Annotated
+from typing import Annotated, Literal
 from sqlmodel.ext.asyncio.session import AsyncSession
 # Schemas
 from ..schemas.users.pagination_schema import PaginatedUsersSchema
 from ..schemas.users.user_schema import UserSchema
 from app.schemas.users.user_by_email_schema import UserByEmailSchema
 # Services
-from ..services.read_users.read_all_users_service import get_users_paginated
+from ..services.read_users.read_all_users_service import get_users_paginated, get_users_by_cursor
 from ..services.read_users.read_user_by_id_service import get_user_by_id
 from ..services.read_users.read_user_by_name_or_email_service import get_user_by_username_or_email
 from ..services.read_users.read_user_by_role_service import get_users_by_role
@@ -35,6 +35,9 @@ router = APIRouter(
 # Security scheme for access token
 security = HTTPBearer()
 
+# Max users per page (larger or non-positive limits get 422)
+USERS_PAGE_MAX_LIMIT = 100
+
 # =========================
 # Get all users (paginated)
 # =========================
@@ -46,12 +49,19 @@ security = HTTPBearer()
 async def fetch_all_users_endpoint(
     db: Annotated[AsyncSession, Depends(get_db)],
     admin_user_id: int = Depends(get_admin_user_id),
-    page: int = 1,
-    limit: int = 10,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=USERS_PAGE_MAX_LIMIT),
+    cursor: str | None = None,
+    total: Literal["exact", "estimate", "none"] | None = None,
 ):
     """
     Retrieve all users with pagination.
 
+    Two modes:
+    - page / limit (default): exact total unless total="estimate" / "none"
+    - cursor / limit: send cursor="" for the first page, then next_cursor of the
+      previous response; no total unless total="estimate" / "exact"
+
     Steps:
     1. Extract access token
     2. Verify admin role
@@ -59,10 +69,20 @@ async def fetch_all_users_endpoint(
     4. Return items and metadata
     """
 
+    # Cursor (keyset) mode
+    if cursor is not None:
+        return await get_users_by_cursor(
+            db=db,
+            cursor=cursor,
+            limit=limit,
+            total=total or "none"
+        )
+
     paginated_users = await get_users_paginated(
         db=db, 
         page=page, 
-        limit=limit
+        limit=limit,
+        total=total or "exact"
     )
 
     return paginated_users
@@ -140,8 +160,8 @@ async def fetch_user_by_username_or_email_endpoint(
     name_or_email: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     admin_user_id: int = Depends(get_admin_user_id),
-    page: int = 1,
-    limit: int = 10,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=USERS_PAGE_MAX_LIMIT),
 ):
     """
     Search for users by username or email.
@@ -175,8 +195,8 @@ async def fetch_users_by_role_endpoint(  # business logic
     role: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     admin_user_id: int = Depends(get_admin_user_id),
-    page: int = 1,
-    limit: int = 10,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=USERS_PAGE_MAX_LIMIT),
 ):
     '''
     Get users by role.
@@ -4,19 +4,25 @@
 
 # Imports
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi.security import (
     HTTPBearer,
     HTTPAuthorizationCredentials
 )
 from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Annotated
+from dotenv import load_dotenv
+import os
+import time
 # Services
-from ..services.tokens_management.refresh_tokens_service import refresh_access_token, check_access_token
+from ..services.tokens_management.refresh_tokens_service import refresh_access_token, decode_access_token
 # Schemas
 from ..schemas.tokens.token_refresh_schema import TokenRefreshSchema
 # Dependencies
 from ..dependencies.data_base_connection import get_db
+# Utils
+from ..utils.roles_cache import get_user_role_names
+from ..utils.role_versions import is_role_version_current
 
 
 
@@ -34,23 +40,56 @@ refresh_scheme = HTTPBearer()   # For refresh token
 access_scheme = HTTPBearer()    # For access token
 
 
+# =========================
+# Gateway auth cache settings
+# =========================
+load_dotenv()
+# Upper bound (seconds) for how long the gateway may reuse a positive auth decision
+AUTH_CHECK_CACHE_MAX_SECONDS = int(
+    os.getenv("AUTH_CHECK_CACHE_MAX_SECONDS", "5")
+)
+
+
 # =========================
 # Check access token endpoint
 # =========================
 @router.get("/check", response_model=TokenRefreshSchema)
 async def check_token_endpoint(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(access_scheme)],
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)]
 ):
     """
     Validate the access token.
 
     Steps:
     1. Extract access token from header
-    2. Verify token and get user ID
-    3. Return the same access token and empty refresh token
+    2. Verify token and get its payload
+    3. Return verified identity in X-User-Id / X-User-Roles headers (forwarded by the gateway)
+    4. Tell the gateway how long this decision may be cached (never past "exp")
+    5. Return the same access token and empty refresh token
     """
     access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
+    payload = await decode_access_token(access_token)
+
+    # Token issued before the last role change -> client must refresh it
+    if not is_role_version_current(payload):
+        raise HTTPException(status_code=401, detail="Roles changed, refresh token")
+
+    # Verified identity for downstream services
+    user_id = int(payload.get("sub"))
+    role_names = payload.get("roles")
+    if role_names is None:
+        role_names = await get_user_role_names(user_id, db)
+    response.headers["X-User-Id"] = str(user_id)
+    response.headers["X-User-Roles"] = ",".join(role_names)
+
+    # Seconds left until the token expires, capped by the configured maximum
+    # (X-Accel-Expires: 0 disables caching in nginx)
+    ttl = int(payload.get("exp", 0) - time.time())
+    response.headers["X-Accel-Expires"] = str(
+        max(0, min(ttl, AUTH_CHECK_CACHE_MAX_SECONDS))
+    )
 
     return TokenRefreshSchema(
         access_token=access_token,
@@ -9,12 +9,15 @@ from typing import Annotated
 # Services
 from ..services.role_management.add_role_for_user import add_role_for_users
 from ..services.role_management.remove_role_from_user import remove_role_from_users
+from ..services.role_management.bulk_role_management import bulk_add_roles, bulk_remove_roles
 # Dependencies
 from ..dependencies.data_base_connection import get_db
 from ..dependencies.admin_dependency import get_admin_user_id
 # Schemas
 from ..schemas.roles.role_assignment_schema import RoleAssignmentSchema
 from ..schemas.roles.role_operation_response_schema import RoleOperationResponseSchema
+from ..schemas.roles.bulk_role_assignment_schema import BulkRoleAssignmentSchema
+from ..schemas.roles.bulk_role_operation_response_schema import BulkRoleOperationResponseSchema
 
 
 # =========================
@@ -77,4 +80,56 @@ async def remove_role_from_user_endpoint(
         role_id=data.role_id, 
         db=db, 
         user_id=admin_user_id
-    )
\ No newline at end of file
+    )
+
+
+# =========================
+# Bulk add roles endpoint
+# =========================
+@router.post("/bulk/add", response_model=BulkRoleOperationResponseSchema)
+async def bulk_add_roles_endpoint(
+    data: BulkRoleAssignmentSchema,
+    db: Annotated[AsyncSession, Depends(get_db)],    # DB session
+    admin_user_id: int = Depends(get_admin_user_id),
+):
+    """
+    Add several roles to many users in one transaction.
+
+    Steps:
+    1. Verify that requester is admin
+    2. Insert all (user, role) pairs, existing pairs are skipped
+    3. Return outcome per user
+    """
+
+    return await bulk_add_roles(
+        user_ids=data.user_ids,
+        role_names=data.role_names,
+        db=db,
+        user_id=admin_user_id
+    )
+
+
+# =========================
+# Bulk remove roles endpoint
+# =========================
+@router.post("/bulk/remove", response_model=BulkRoleOperationResponseSchema)
+async def bulk_remove_roles_endpoint(
+    data: BulkRoleAssignmentSchema,
+    db: Annotated[AsyncSession, Depends(get_db)],    # DB session
+    admin_user_id: int = Depends(get_admin_user_id),
+):
+    """
+    Remove several roles from many users in one transaction.
+
+    Steps:
+    1. Verify that requester is admin
+    2. Delete all (user, role) pairs
+    3. Return outcome per user
+    """
+
+    return await bulk_remove_roles(
+        user_ids=data.user_ids,
+        role_names=data.role_names,
+        db=db,
+        user_id=admin_user_id
+    )
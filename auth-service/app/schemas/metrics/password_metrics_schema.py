@@ -0,0 +1,48 @@
+# =========================
+# Password hashing metrics schema
+# =========================
+
+# Imports
+from pydantic import BaseModel  # Pydantic base model for validation
+
+
+# =========================
+# Latency statistics
+# =========================
+class LatencySchema(BaseModel):
+    """
+    Latency of one operation type (queue wait included).
+
+    Attributes:
+    - count (int): Number of finished calls
+    - avg_ms (float): Average latency in milliseconds
+    - max_ms (float): Maximum latency in milliseconds
+    """
+    count: int
+    avg_ms: float
+    max_ms: float
+
+
+# =========================
+# Password pool metrics
+# =========================
+class PasswordMetricsSchema(BaseModel):
+    """
+    Password hashing process pool metrics.
+
+    Attributes:
+    - workers (int): Number of worker processes
+    - pending (int): Calls currently waiting or running (queue depth)
+    - max_pending (int): Limit of pending calls before 503 is returned
+    - rejected (int): Calls rejected with 503
+    - hash (LatencySchema): Hashing latency
+    - verify (LatencySchema): Verification latency
+    - hash_bulk (LatencySchema): Latency of one bulk hashing chunk (user provisioning)
+    """
+    workers: int
+    pending: int
+    max_pending: int
+    rejected: int
+    hash: LatencySchema
+    verify: LatencySchema
+    hash_bulk: LatencySchema
@@ -0,0 +1,30 @@
+# =========================
+# Refresh tokens sweeper metrics schema
+# =========================
+
+# Imports
+from pydantic import BaseModel  # Pydantic base model for validation
+from typing import Optional
+
+
+# =========================
+# Refresh tokens sweeper metrics
+# =========================
+class RefreshTokensMetricsSchema(BaseModel):
+    """
+    Refresh tokens sweeper metrics (per worker process).
+
+    Attributes:
+    - runs (int): Completed sweeps
+    - swept_expired (int): Expired tokens deleted
+    - swept_over_limit (int): Tokens deleted because a user had more than per_user_max
+    - remaining (int | None): Rows in the tokens table after the last sweep
+    - last_run_ms (float | None): Duration of the last sweep
+    - per_user_max (int): Max live refresh tokens per user
+    """
+    runs: int
+    swept_expired: int
+    swept_over_limit: int
+    remaining: Optional[int]
+    last_run_ms: Optional[float]
+    per_user_max: int
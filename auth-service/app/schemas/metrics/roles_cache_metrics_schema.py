@@ -0,0 +1,27 @@
+# =========================
+# Roles cache metrics schema
+# =========================
+
+# Imports
+from pydantic import BaseModel  # Pydantic base model for validation
+
+
+# =========================
+# Roles cache metrics
+# =========================
+class RolesCacheMetricsSchema(BaseModel):
+    """
+    User roles cache metrics (per worker process).
+
+    Attributes:
+    - hits (int): Role lookups answered from cache
+    - misses (int): Role lookups that queried the database
+    - hit_ratio (float): hits / (hits + misses)
+    - cached_users (int): Users currently in cache
+    - roles (int): Roles in the in-memory catalog
+    """
+    hits: int
+    misses: int
+    hit_ratio: float
+    cached_users: int
+    roles: int
@@ -0,0 +1,74 @@
+# =========================
+# Bulk user provisioning schemas
+# =========================
+
+# Imports
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+from ..auth.registration_schema import RegistrationSchema
+
+
+# Max users in one provisioning request
+MAX_PROVISION_USERS = 5000
+
+
+# =========================
+# Provisioning input (JSON)
+# =========================
+class ProvisionUsersSchema(BaseModel):
+    """
+    Users to create (same fields and rules as registration).
+
+    Attributes:
+    - users (list[RegistrationSchema]): Users to create (max 5000)
+    """
+    users: list[RegistrationSchema] = Field(min_length=1, max_length=MAX_PROVISION_USERS)
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "users": [
+                    {"username": "support01", "email": "support01@inbox.lv", "password": "12345678"},
+                    {"username": "support02", "email": "support02@inbox.lv", "password": "12345678"}
+                ]
+            }
+        }
+    }
+
+
+# =========================
+# Outcome for one row
+# =========================
+class ProvisionOutcomeSchema(BaseModel):
+    """
+    Result for one input row.
+
+    Attributes:
+    - row (int): Position in the input (1-based, CSV header not counted)
+    - username (str | None): Normalized username
+    - email (str | None): Normalized email
+    - status (str): "created", "invalid", "duplicate_in_request", "username_exists" or "email_exists"
+    - user_id (int | None): ID of the created user
+    - detail (str | None): Validation error for invalid rows
+    """
+    row: int
+    username: Optional[str] = None
+    email: Optional[str] = None
+    status: Literal["created", "invalid", "duplicate_in_request", "username_exists", "email_exists"]
+    user_id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+# =========================
+# Provisioning response
+# =========================
+class ProvisionUsersResponseSchema(BaseModel):
+    """
+    Result of bulk user provisioning.
+
+    Attributes:
+    - created (int): Number of created users
+    - results (list[ProvisionOutcomeSchema]): Outcome per input row
+    """
+    created: int
+    results: list[ProvisionOutcomeSchema]
@@ -0,0 +1,25 @@
+# Imports
+from pydantic import BaseModel, Field
+
+# ========================
+# Bulk role assignment schema
+# ========================
+class BulkRoleAssignmentSchema(BaseModel):
+    """
+    Roles to add to / remove from many users at once.
+
+    Attributes:
+    - user_ids (list[int]): IDs of users (max 1000)
+    - role_names (list[str]): Names of roles (max 20)
+    """
+    user_ids: list[int] = Field(min_length=1, max_length=1000)
+    role_names: list[str] = Field(min_length=1, max_length=20)
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "user_ids": [1, 2, 3],
+                "role_names": ["support", "content_manager"]
+            }
+        }
+    }
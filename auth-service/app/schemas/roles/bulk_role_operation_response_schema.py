@@ -0,0 +1,48 @@
+# Imports
+from pydantic import BaseModel
+from typing import Literal
+
+# ========================
+# Outcome for one user
+# ========================
+class UserRoleOutcomeSchema(BaseModel):
+    """
+    Result of a bulk role operation for one user.
+
+    Attributes:
+    - user_id (int): ID of the user
+    - status (str): "updated", "unchanged" (already had / did not have the roles),
+      "not_found" (no such user) or "forbidden" (own roles)
+    - roles (list[str]): Role names actually added / removed for this user
+    """
+    user_id: int
+    status: Literal["updated", "unchanged", "not_found", "forbidden"]
+    roles: list[str] = []
+
+
+# ========================
+# Bulk role operation response
+# ========================
+class BulkRoleOperationResponseSchema(BaseModel):
+    """
+    Result of a bulk role operation.
+
+    Attributes:
+    - updated (int): Number of users whose roles changed
+    - results (list[UserRoleOutcomeSchema]): Outcome per requested user
+    """
+    updated: int
+    results: list[UserRoleOutcomeSchema]
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "updated": 1,
+                "results": [
+                    {"user_id": 1, "status": "updated", "roles": ["support"]},
+                    {"user_id": 2, "status": "unchanged", "roles": []},
+                    {"user_id": 3, "status": "not_found", "roles": []}
+                ]
+            }
+        }
+    }
@@ -4,7 +4,7 @@
 
 # Imports
 from pydantic import BaseModel  # Pydantic base model for validation
-from typing import List
+from typing import List, Optional
 from ..users.user_schema import UserSchema  # User schema for individual user entries
 
 
@@ -27,6 +27,23 @@ class PaginationMeta(BaseModel):
     total_pages: int
 
 
+# =========================
+# Cursor pagination metadata
+# =========================
+class CursorPaginationMeta(BaseModel):
+    """
+    Metadata for cursor (keyset) paginated results.
+
+    Attributes:
+    - limit (int): Number of items per page
+    - total_users (int | None): Total number of users (None when not requested)
+    - total_is_estimate (bool): True if total_users is an estimate from table statistics
+    """
+    limit: int
+    total_users: Optional[int] = None
+    total_is_estimate: bool = False
+
+
 # =========================
 # Paginated users response
 # =========================
@@ -36,10 +53,12 @@ class PaginatedUsersSchema(BaseModel):
 
     Attributes:
     - items (List[UserSchema]): List of users on the current page
-    - meta (PaginationMeta | None): Pagination metadata (optional)
+    - meta (PaginationMeta | CursorPaginationMeta | None): Pagination metadata (optional)
+    - next_cursor (str | None): Cursor of the next page (cursor mode only, None on the last page)
     """
     items: List[UserSchema]
-    meta: PaginationMeta | None = None
+    meta: PaginationMeta | CursorPaginationMeta | None = None
+    next_cursor: Optional[str] = None
 
     model_config = {
         "from_attributes": True
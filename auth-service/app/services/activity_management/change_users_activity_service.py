@@ -11,6 +11,9 @@ from fastapi import HTTPException
 from ...models import UserModel
 # Schemas
 from ...schemas.users.user_activity_schema import UserActivitySchemaResponse
+# Utils
+from ...utils.revocation_list import revoke_users, restore_users
+from ...utils.role_versions import bump_role_versions, set_role_versions
 
 
 # =========================
@@ -55,9 +58,24 @@ async def change_users_activity_status(
     for user in users:
         user.active = is_active
 
+    # Tokens of deactivated users also become stale in other workers
+    role_versions = {}
+    if not is_active:
+        role_versions = await bump_role_versions(user_ids, db)
+
+    # =========================
+    # Update revocation list (all workers after commit)
+    # =========================
+    if is_active:
+        restore_users(user_ids, db)
+    else:
+        revoke_users(user_ids, db)
+
     # Async commit
     await db.commit()
 
+    set_role_versions(role_versions)
+
     # =========================
     # Build response
     # =========================
@@ -81,8 +99,12 @@ async def change_user_activity_status(
     
     user = await db.get(UserModel, user_id)
     user.active = False
+    role_versions = await bump_role_versions([user_id], db)
+    revoke_users(user_id, db)
     await db.commit()
 
+    set_role_versions(role_versions)
+
     return UserActivitySchemaResponse(
         id=user.id,
         username=user.username,
@@ -5,33 +5,45 @@
 # Imports
 # Libraries
 from fastapi import Request, HTTPException
-from authlib.integrations.starlette_client import OAuth
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import case, or_
+from sqlalchemy.exc import IntegrityError
 # Services
 from ..tokens_management.create_tokens_service import (
-    create_access_token,
+    create_user_access_token,
     create_refresh_token,
-    save_refresh_token
+    save_refresh_token,
+    prune_user_sessions
 )
 # Models
 from ...models import (
     UserRoleModel, 
-    TokenModel, 
     UserModel
 )
 # Schemas
 from ...schemas.tokens.token_refresh_schema import TokenRefreshSchema
+# Utils
+from ...utils.roles_cache import get_role_id
+from ...utils.revocation_list import revoke_session
+
+
+"""
+Google login callback. Everything after the code exchange with Google runs in one
+database transaction (one commit): find / create user, default role, save the new
+refresh token, delete old ones beyond SESSIONS_PER_USER. If a concurrent callback created the same user
+first, the transaction is retried once and finds that user.
+"""
 
 
 async def google_auth_callback(
-    oauth: OAuth,
+    oauth,
     db: AsyncSession,
     request: Request
 ) -> TokenRefreshSchema:
 
     # -------------------------
-    # 1. Get token from Google
+    # 1. Get token from Google (before any database work)
     # -------------------------
     token = await oauth.google.authorize_access_token(request)
     user_info = token["userinfo"]
@@ -39,11 +51,30 @@ async def google_auth_callback(
     email = user_info["email"]
     google_id = user_info["sub"]
 
+    try:
+        return await sign_in_google_user(email, google_id, db)
+    except IntegrityError:
+        await db.rollback()
+        return await sign_in_google_user(email, google_id, db)
+
+
+async def sign_in_google_user(
+    email: str,
+    google_id: str,
+    db: AsyncSession
+) -> TokenRefreshSchema:
+    """
+    Finds or creates the user and issues tokens, committed once.
+    """
+
     # -------------------------
-    # 2. Find user by google_id
+    # 2. Find user by google_id, else by email (one query)
     # -------------------------
     result = await db.exec(
-        select(UserModel).where(UserModel.google_id == google_id)
+        select(UserModel)
+        .where(or_(UserModel.google_id == google_id, UserModel.email == email))
+        .order_by(case((UserModel.google_id == google_id, 0), else_=1))
+        .limit(1)
     )
     user = result.first()  #  User object
 
@@ -51,19 +82,7 @@ async def google_auth_callback(
         raise HTTPException(status_code=401, detail="User is inactive")
 
     # -------------------------
-    # 3. If not found → search by email
-    # -------------------------
-    if not user:
-        result = await db.exec(
-            select(UserModel).where(UserModel.email == email)
-        )
-        user = result.first()
-
-        if user and not user.active:
-            raise HTTPException(status_code=401, detail="User is inactive")
-
-    # -------------------------
-    # 4. Create or update user
+    # 3. Create or update user
     # -------------------------
     if user:
         user.google_id = google_id
@@ -79,40 +98,34 @@ async def google_auth_callback(
         )
 
         db.add(user)
-        await db.commit()
-        await db.refresh(user)
+        await db.flush()    # Assigns user.id
 
         # Assign default role
-        db.add(UserRoleModel(user_id=user.id, role_id=1))
-        await db.commit()
+        role_id = await get_role_id("user", db)
 
-    # If user was updated (not new), commit changes
-    await db.commit()
-    await db.refresh(user)
+        if role_id is not None:
+            db.add(UserRoleModel(user_id=user.id, role_id=role_id))
 
     # -------------------------
-    # 5. Delete old tokens
+    # 4. Generate new tokens
     # -------------------------
-    result = await db.exec(
-        select(TokenModel).where(TokenModel.user_id == user.id)
-    )
-    old_tokens = result.all()
-
-    for t in old_tokens:
-        await db.delete(t)
-
-    await db.commit()
+    refresh_token_value = await create_refresh_token()
+    session = await save_refresh_token(refresh_token_value, user.id, db, commit=False)
 
     # -------------------------
-    # 6. Generate new tokens
+    # 5. Delete sessions beyond SESSIONS_PER_USER (one statement)
     # -------------------------
-    refresh_token_value = await create_refresh_token()
-    await save_refresh_token(refresh_token_value, user.id, db)
+    ended_sessions = await prune_user_sessions(user.id, db)
+
+    access_token = await create_user_access_token(user, db, session.id)
 
-    access_token = await create_access_token({"sub": str(user.id)})
+    # Access tokens of the deleted sessions stop working too (all workers after commit)
+    revoke_session(ended_sessions, db)
+
+    await db.commit()
 
     return TokenRefreshSchema(
         access_token=access_token,
         token_type="bearer",
         refresh_token=refresh_token_value
-    )
\ No newline at end of file
+    )
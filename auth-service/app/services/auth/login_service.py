@@ -6,20 +6,84 @@
 # Libraries
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import update
 from fastapi import HTTPException
+import asyncio
+import logging
 # Models
-from ...models import UserModel, TokenModel
+from ...models import UserModel
+# Dependencies
+from ...dependencies.data_base_connection import async_session
 # Password utility
-from ..passwords.passwords_service import verify_password
+from ..passwords.passwords_service import (
+    verify_password,
+    get_password_hash,
+    password_needs_rehash
+)
 # Token management
 from ..tokens_management.create_tokens_service import (
-    create_access_token,
+    create_user_access_token,
     create_refresh_token,
-    save_refresh_token
+    save_refresh_token,
+    prune_user_sessions
 )
 # Schemas
 from ...schemas.auth.login_schema import LoginSchema
 from ...schemas.tokens.token_refresh_schema import TokenRefreshSchema
+# Utils
+from ...utils.revocation_list import revoke_session
+
+
+logger = logging.getLogger(__name__)
+
+# Running background rehash tasks (strong references so they are not garbage collected)
+_rehash_tasks: set[asyncio.Task] = set()
+
+
+# =========================
+# Background password rehash
+# =========================
+async def _rehash_password(
+    user_id: int,
+    plain_password: str,
+    old_hash: str
+) -> None:
+    """
+    Rehashes password with the current Argon2 profile.
+    Hash is replaced only if it was not changed in the meantime.
+    """
+    try:
+        new_hash = await get_password_hash(plain_password)
+
+        async with async_session() as db:
+            await db.exec(
+                update(UserModel)
+                .where(
+                    UserModel.id == user_id,
+                    UserModel.password_hash == old_hash
+                )
+                .values(password_hash=new_hash)
+            )
+            await db.commit()
+
+    except Exception:
+        # Not critical: hash will be upgraded on next login
+        logger.exception("Password rehash failed for user %s", user_id)
+
+
+def schedule_password_rehash(
+    user_id: int,
+    plain_password: str,
+    old_hash: str
+) -> None:
+    """
+    Starts password rehash in background, login response is not delayed.
+    """
+    task = asyncio.create_task(
+        _rehash_password(user_id, plain_password, old_hash)
+    )
+    _rehash_tasks.add(task)
+    task.add_done_callback(_rehash_tasks.discard)
 
 
 # =========================
@@ -59,28 +123,27 @@ async def login_user(
         raise HTTPException(status_code=401, detail="Invalid data")
 
     # =========================
-    # Delete old refresh tokens
+    # Upgrade outdated hash parameters
     # =========================
-    result = await db.exec(
-        select(TokenModel).where(TokenModel.user_id == user.id)
-    )
-    old_tokens = result.all()
-
-    for t in old_tokens:
-        await db.delete(t)
-
-    await db.commit()
+    if password_needs_rehash(user.password_hash):
+        schedule_password_rehash(user.id, data.password, user.password_hash)
 
     # =========================
-    # Generate new tokens
+    # Replace sessions and issue tokens (one transaction)
     # =========================
     refresh_token_value = await create_refresh_token()
 
-    await save_refresh_token(refresh_token_value, user.id, db)
+    session = await save_refresh_token(refresh_token_value, user.id, db, commit=False)
 
-    access_token = await create_access_token({
-        "sub": str(user.id)
-    })
+    # Sessions beyond SESSIONS_PER_USER (oldest first) are deleted with one statement
+    ended_sessions = await prune_user_sessions(user.id, db)
+
+    access_token = await create_user_access_token(user, db, session.id)
+
+    # Access tokens of the deleted sessions stop working too (all workers after commit)
+    revoke_session(ended_sessions, db)
+
+    await db.commit()
 
     return TokenRefreshSchema(
         access_token=access_token,
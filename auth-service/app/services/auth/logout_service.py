@@ -9,6 +9,10 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException
 # Models
 from ...models import TokenModel
+# Services
+from ..tokens_management.create_tokens_service import hash_refresh_token
+# Utils
+from ...utils.revocation_list import revoke_session
 
 
 async def logout(
@@ -16,12 +20,15 @@ async def logout(
     refresh_token: str
 ) -> dict:
     """
-    Invalidates refresh token by deleting it from database.
+    Invalidates refresh token by deleting it from database
+    and revokes access tokens issued with it.
     """
 
     # Find token
     result = await db.exec(
-        select(TokenModel).where(TokenModel.refresh_token == refresh_token)
+        select(TokenModel).where(
+            TokenModel.token_hash == hash_refresh_token(refresh_token)
+        )
     )
 
     token = result.first()
@@ -34,6 +41,8 @@ async def logout(
 
     await db.delete(token)
 
+    revoke_session(token.id, db)
+
     await db.commit()
 
     return {"message": "Logout successful"}
\ No newline at end of file
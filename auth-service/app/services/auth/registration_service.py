@@ -16,7 +16,7 @@ from ...schemas.tokens.token_refresh_schema import TokenRefreshSchema
 from ..passwords.passwords_service import get_password_hash
 # Tokens
 from ..tokens_management.create_tokens_service import (
-    create_access_token,
+    create_user_access_token,
     create_refresh_token,
     save_refresh_token
 )
@@ -89,10 +89,11 @@ async def register_user(
     # =========================
     # Generate tokens
     # =========================
-    access_token = await create_access_token({"sub": str(user.id)})
     refresh_token = await create_refresh_token()
 
-    await save_refresh_token(refresh_token, user.id, db)
+    session = await save_refresh_token(refresh_token, user.id, db)
+
+    access_token = await create_user_access_token(user, db, session.id)
 
     return TokenRefreshSchema(
         access_token=access_token,
@@ -3,16 +3,163 @@
 # =========================
 
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import HTTPException
+from dotenv import load_dotenv
+import multiprocessing
+import asyncio
+import json
+import time
+import os
 
 """
 This module handles password hashing and verification using the Argon2 algorithm.
 
 It is used by authentication and user management services to securely store and validate passwords.
+Argon2 calls are CPU heavy, so they run in a bounded process pool instead of the event loop.
 """
 
 
-# Initialize recommended Argon2 password hasher
-password_hash = PasswordHash.recommended()
+# =========================
+# Load environment variables
+# =========================
+load_dotenv()
+
+# Number of worker processes for hashing (default: number of CPU cores)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+# Max hash / verify calls waiting or running at once, extra calls get 503
+PASSWORD_HASH_MAX_PENDING = int(
+    os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 4))
+)
+# Worker processes bulk provisioning may use at once (the rest stay free for logins)
+PASSWORD_HASH_BULK_WORKERS = max(1, int(
+    os.getenv("PASSWORD_HASH_BULK_WORKERS", str(PASSWORD_HASH_WORKERS // 2))
+))
+# Passwords per bulk pool call (small: logins wait for at most one chunk)
+PASSWORD_HASH_BULK_CHUNK = max(1, int(os.getenv("PASSWORD_HASH_BULK_CHUNK", "4")))
+# Retry-After value (seconds) sent with 503
+PASSWORD_HASH_RETRY_AFTER = os.getenv("PASSWORD_HASH_RETRY_AFTER", "1")
+# JSON file with Argon2 costs written by app.utils.calibrate_password_hash
+PASSWORD_HASH_PROFILE = os.getenv("PASSWORD_HASH_PROFILE")
+
+
+# =========================
+# Argon2 hasher
+# =========================
+def _load_password_hash() -> PasswordHash:
+    """
+    Builds Argon2 hasher from the calibrated profile,
+    falls back to pwdlib recommended parameters when no profile is configured.
+    """
+    if not PASSWORD_HASH_PROFILE or not os.path.exists(PASSWORD_HASH_PROFILE):
+        return PasswordHash.recommended()
+
+    with open(PASSWORD_HASH_PROFILE) as file:
+        profile = json.load(file)
+
+    return PasswordHash((
+        Argon2Hasher(
+            time_cost=profile["time_cost"],
+            memory_cost=profile["memory_cost"],
+            parallelism=profile["parallelism"],
+        ),
+    ))
+
+
+# Initialize Argon2 password hasher
+password_hash = _load_password_hash()
+
+
+# =========================
+# Process pool state
+# =========================
+_executor: ProcessPoolExecutor | None = None
+_pending = 0
+# Bulk chunks in the pool at once, shared by all provisioning requests
+_bulk_slots = asyncio.Semaphore(PASSWORD_HASH_BULK_WORKERS)
+
+# Counters for metrics
+_metrics = {
+    "hash": {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+    "verify": {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+    "hash_bulk": {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0},
+    "rejected": 0,
+}
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """
+    Creates the process pool on first use.
+    """
+    global _executor
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    return _executor
+
+
+def shutdown_password_pool() -> None:
+    """
+    Stops worker processes (called on application shutdown).
+    """
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+# =========================
+# Worker functions (run in pool processes)
+# =========================
+def _hash_sync(password: str) -> str:
+    return password_hash.hash(password)
+
+
+def _verify_sync(plain_password: str, hashed_password: str) -> bool:
+    return password_hash.verify(plain_password, hashed_password)
+
+
+def _hash_many_sync(passwords: list[str]) -> list[str]:
+    return [password_hash.hash(password) for password in passwords]
+
+
+async def _run_in_pool(operation: str, func, *args):
+    """
+    Runs Argon2 work in the process pool with a concurrency limit.
+
+    :raises HTTPException: 503 with Retry-After when too many calls are pending
+    """
+    global _pending
+
+    if _pending >= PASSWORD_HASH_MAX_PENDING:
+        _metrics["rejected"] += 1
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy, try again later",
+            headers={"Retry-After": PASSWORD_HASH_RETRY_AFTER}
+        )
+
+    _pending += 1
+    started = time.perf_counter()
+
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), func, *args)
+
+    finally:
+        _pending -= 1
+
+        elapsed = time.perf_counter() - started
+        stats = _metrics[operation]
+        stats["count"] += 1
+        stats["total_seconds"] += elapsed
+        stats["max_seconds"] = max(stats["max_seconds"], elapsed)
 
 
 # =========================
@@ -26,7 +173,48 @@ async def get_password_hash(password: str) -> str:
     :return: Hashed password string
     :notes: Uses secure salting and Argon2 hashing
     """
-    return password_hash.hash(password)
+    return await _run_in_pool("hash", _hash_sync, password)
+
+
+# =========================
+# Hash many passwords
+# =========================
+async def get_password_hashes(passwords: list[str]) -> list[str]:
+    """
+    Hashes many passwords in parallel (bulk user provisioning).
+
+    :param passwords: Plain text passwords
+    :return: Hashes in the same order
+    :notes: Work is split into chunks of PASSWORD_HASH_BULK_CHUNK passwords, at most
+            PASSWORD_HASH_BULK_WORKERS of them in the pool at once. Logins and
+            registrations queued meanwhile run after at most one small chunk
+            and always find free worker processes. When a chunk fails (503) or the
+            request is cancelled, chunks not yet started are cancelled too
+    """
+    if not passwords:
+        return []
+
+    async def hash_chunk(chunk: list[str]) -> list[str]:
+        async with _bulk_slots:
+            return await _run_in_pool("hash_bulk", _hash_many_sync, chunk)
+
+    tasks = [
+        asyncio.create_task(hash_chunk(passwords[start:start + PASSWORD_HASH_BULK_CHUNK]))
+        for start in range(0, len(passwords), PASSWORD_HASH_BULK_CHUNK)
+    ]
+
+    try:
+        chunks = await asyncio.gather(*tasks)
+
+    except BaseException:
+        # The batch fails as a whole: free the pool for logins
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return [hashed for chunk in chunks for hashed in chunk]
 
 # =========================
 # Verify a password
@@ -40,4 +228,45 @@ async def verify_password(plain_password: str, hashed_password: str) -> bool:
     :return: True if passwords match, False otherwise
     :notes: Uses Argon2 verification for security
     """
-    return password_hash.verify(plain_password, hashed_password)
+    return await _run_in_pool("verify", _verify_sync, plain_password, hashed_password)
+
+
+# =========================
+# Check hash parameters
+# =========================
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Checks if a stored hash was created with other Argon2 parameters than the current profile.
+
+    :param hashed_password: Hashed password stored in database
+    :return: True if the hash should be replaced
+    :notes: Only parses the hash header, cheap enough for the event loop
+    """
+    return password_hash.hashers[0].check_needs_rehash(hashed_password)
+
+
+# =========================
+# Metrics
+# =========================
+def get_password_pool_metrics() -> dict:
+    """
+    Returns queue depth and hash / verify latency statistics.
+    """
+    def latency(stats: dict) -> dict:
+        count = stats["count"]
+        return {
+            "count": count,
+            "avg_ms": round(stats["total_seconds"] / count * 1000, 2) if count else 0.0,
+            "max_ms": round(stats["max_seconds"] * 1000, 2),
+        }
+
+    return {
+        "workers": PASSWORD_HASH_WORKERS,
+        "pending": _pending,
+        "max_pending": PASSWORD_HASH_MAX_PENDING,
+        "bulk_workers": PASSWORD_HASH_BULK_WORKERS,
+        "rejected": _metrics["rejected"],
+        "hash": latency(_metrics["hash"]),
+        "verify": latency(_metrics["verify"]),
+        "hash_bulk": latency(_metrics["hash_bulk"]),
+    }
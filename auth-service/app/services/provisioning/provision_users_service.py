@@ -0,0 +1,220 @@
+# =========================
+# Bulk user provisioning service
+# =========================
+
+# Imports
+# Libraries
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import or_
+from fastapi import HTTPException
+from pydantic import ValidationError
+import csv
+import io
+# Models
+from ...models import UserModel, UserRoleModel
+# Schemas
+from ...schemas.auth.registration_schema import RegistrationSchema
+from ...schemas.provisioning.provision_users_schema import (
+    MAX_PROVISION_USERS,
+    ProvisionOutcomeSchema,
+    ProvisionUsersResponseSchema
+)
+# Password hashing
+from ..passwords.passwords_service import get_password_hashes
+# Utils
+from ...utils.roles_cache import get_role_id
+from ...utils.dialect_insert import dialect_insert
+
+
+"""
+Creates many users (HR export) in one transaction, without issuing tokens.
+
+- one SELECT checks usernames and emails already taken
+- passwords are hashed in parallel in the password process pool
+- users and their default "user" role go in with multi-row INSERTs
+"""
+
+
+# Rows per INSERT statement (keeps bind parameters under database limits)
+INSERT_CHUNK_SIZE = 1000
+
+
+# =========================
+# CSV input
+# =========================
+def parse_users_csv(content: str) -> list[RegistrationSchema | str]:
+    """
+    Parses CSV with header username,email,password.
+    Returns one entry per row: validated data or validation error text.
+
+    :raises HTTPException: 400 if the header is wrong or there are too many rows
+    """
+    reader = csv.DictReader(io.StringIO(content))
+
+    if not reader.fieldnames or not {"username", "email", "password"} <= set(reader.fieldnames):
+        raise HTTPException(
+            status_code=400,
+            detail="CSV header must contain username,email,password"
+        )
+
+    rows = []
+
+    for record in reader:
+        if len(rows) >= MAX_PROVISION_USERS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many users, max {MAX_PROVISION_USERS}"
+            )
+
+        try:
+            rows.append(RegistrationSchema(
+                username=record["username"] or "",
+                email=record["email"] or "",
+                password=record["password"] or ""
+            ))
+        except ValidationError as error:
+            first = error.errors()[0]
+            rows.append(f"{'.'.join(map(str, first['loc']))}: {first['msg']}")
+
+    if not rows:
+        raise HTTPException(status_code=400, detail="CSV has no users")
+
+    return rows
+
+
+# =========================
+# Provision users
+# =========================
+async def provision_users(
+    rows: list[RegistrationSchema | str],
+    db: AsyncSession
+) -> ProvisionUsersResponseSchema:
+    """
+    Creates users from validated rows (strings are validation errors from CSV).
+    """
+    results = [ProvisionOutcomeSchema(row=number, status="created") for number in range(1, len(rows) + 1)]
+    candidates: list[tuple[ProvisionOutcomeSchema, RegistrationSchema]] = []
+
+    # =========================
+    # Normalize, drop duplicates inside the request
+    # =========================
+    seen_usernames = set()
+    seen_emails = set()
+
+    for outcome, data in zip(results, rows):
+        if isinstance(data, str):
+            outcome.status = "invalid"
+            outcome.detail = data
+            continue
+
+        outcome.username = data.username.lower()
+        outcome.email = data.email.lower()
+
+        if outcome.username in seen_usernames or outcome.email in seen_emails:
+            outcome.status = "duplicate_in_request"
+            continue
+
+        seen_usernames.add(outcome.username)
+        seen_emails.add(outcome.email)
+        candidates.append((outcome, data))
+
+    # =========================
+    # Existing usernames / emails (one query)
+    # =========================
+    if candidates:
+        result = await db.exec(
+            select(UserModel.username, UserModel.email).where(
+                or_(
+                    UserModel.username.in_(seen_usernames),
+                    UserModel.email.in_(seen_emails)
+                )
+            )
+        )
+
+        taken_usernames = set()
+        taken_emails = set()
+        for username, email in result.all():
+            taken_usernames.add(username)
+            taken_emails.add(email)
+
+        remaining = []
+        for outcome, data in candidates:
+            if outcome.username in taken_usernames:
+                outcome.status = "username_exists"
+            elif outcome.email in taken_emails:
+                outcome.status = "email_exists"
+            else:
+                remaining.append((outcome, data))
+
+        candidates = remaining
+
+    # =========================
+    # Hash passwords in parallel
+    # =========================
+    password_hashes = await get_password_hashes([data.password for _, data in candidates])
+
+    # =========================
+    # Insert users (multi-row)
+    # =========================
+    by_username = {outcome.username: outcome for outcome, _ in candidates}
+    values = [
+        {
+            "username": outcome.username,
+            "email": outcome.email,
+            "password_hash": password_hash,
+            "auth_provider": "local"
+        }
+        for (outcome, _), password_hash in zip(candidates, password_hashes)
+    ]
+
+    created_ids = []
+
+    for start in range(0, len(values), INSERT_CHUNK_SIZE):
+        # Rows taken by a concurrent registration are skipped, not failing the batch
+        result = await db.exec(
+            dialect_insert(db)(UserModel)
+            .values(values[start:start + INSERT_CHUNK_SIZE])
+            .on_conflict_do_nothing()
+            .returning(UserModel.id, UserModel.username)
+        )
+
+        for user_id, username in result.all():
+            by_username[username].user_id = user_id
+            created_ids.append(user_id)
+
+    # Taken meanwhile by a concurrent registration (rare): find out which field
+    lost = [outcome for outcome in by_username.values() if outcome.user_id is None]
+
+    if lost:
+        result = await db.exec(
+            select(UserModel.username).where(
+                UserModel.username.in_([outcome.username for outcome in lost])
+            )
+        )
+        taken_usernames = set(result.all())
+
+        for outcome in lost:
+            outcome.status = "username_exists" if outcome.username in taken_usernames else "email_exists"
+
+    # =========================
+    # Assign default role (multi-row)
+    # =========================
+    role_id = await get_role_id("user", db)
+
+    if role_id is not None:
+        for start in range(0, len(created_ids), INSERT_CHUNK_SIZE):
+            await db.exec(
+                dialect_insert(db)(UserRoleModel)
+                .values([
+                    {"user_id": user_id, "role_id": role_id}
+                    for user_id in created_ids[start:start + INSERT_CHUNK_SIZE]
+                ])
+            )
+
+    await db.commit()
+
+    return ProvisionUsersResponseSchema(
+        created=len(created_ids),
+        results=results
+    )
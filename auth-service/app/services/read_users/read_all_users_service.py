@@ -5,16 +5,80 @@
 # Imports
 # Libraries
 from sqlmodel import select
-from sqlalchemy import func
+from sqlalchemy import tuple_
 from fastapi import HTTPException
 from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import datetime
+import base64
+import json
 # Models
 from ...models import UserModel
 # Schemas
 from ...schemas.users.user_schema import UserSchema
-from ...schemas.users.pagination_schema import PaginatedUsersSchema, PaginationMeta
+from ...schemas.users.pagination_schema import (
+    PaginatedUsersSchema,
+    PaginationMeta,
+    CursorPaginationMeta
+)
 # Utils
 from ...utils.get_users_roles_map import get_users_roles_map
+from ...utils.count_rows import count_rows_exact, count_rows_estimate
+
+
+# Users are listed in (created_at, id) order (index ix_users_created_at_id)
+USERS_ORDER = (UserModel.created_at, UserModel.id)
+
+
+# =========================
+# Cursor encoding
+# =========================
+def encode_cursor(user: UserModel) -> str:
+    """
+    Encodes position after the given user as an opaque string.
+    """
+    raw = json.dumps([user.created_at.isoformat(), user.id])
+
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decodes cursor created by encode_cursor.
+
+    :raises HTTPException: 400 if cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, user_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(user_id)
+
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# =========================
+# Build response items
+# =========================
+async def build_user_items(
+    users: list[UserModel],
+    db: AsyncSession
+) -> list[UserSchema]:
+    """
+    Converts users of one page to schemas (one roles query for the page).
+    """
+    roles_map = await get_users_roles_map([user.id for user in users], db)
+
+    return [
+        UserSchema(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            active=user.active,
+            roles=roles_map.get(user.id, []),
+            created_at=user.created_at
+        )
+        for user in users
+    ]
 
 
 # =========================
@@ -23,25 +87,31 @@ from ...utils.get_users_roles_map import get_users_roles_map
 async def get_users_paginated(
     db: AsyncSession,
     page: int = 1,
-    limit: int = 10
+    limit: int = 10,
+    total: str = "exact"
 ) -> PaginatedUsersSchema:
     """
     Retrieves users with pagination and includes their roles.
     Async-safe version.
+
+    :param total: "exact" (count query), "estimate" (table statistics) or "none"
     """
 
     # Pagination offset
     offset = (page - 1) * limit
 
     # =========================
-    # Count total users (optimized)
+    # Count total users
     # =========================
-    total_count = (await db.exec(
-        select(func.count(UserModel.id))
-    )).one()
+    total_count = None
+
+    if total == "exact":
+        total_count = await count_rows_exact(UserModel, db)
+    elif total == "estimate":
+        total_count, _ = await count_rows_estimate(UserModel, db)
 
     # Check if page exists
-    if offset >= total_count and total_count != 0:
+    if total == "exact" and offset >= total_count and total_count != 0:
         raise HTTPException(status_code=404, detail="Page not found")
 
     # =========================
@@ -49,51 +119,27 @@ async def get_users_paginated(
     # =========================
     result = await db.exec(
         select(UserModel)
+        .order_by(*USERS_ORDER)
         .limit(limit)
         .offset(offset)
     )
     users_page = result.all()
 
-    # If no users found
-    if not users_page:
-        return PaginatedUsersSchema(
-            items=[],
-            meta=PaginationMeta(
-                page=page,
-                limit=limit,
-                total_users=total_count,
-                total_pages=(total_count + limit - 1) // limit
-            )
-        )
-
-    # =========================
-    # Extract user IDs
-    # =========================
-    user_ids = [user.id for user in users_page]
-
-    # =========================
-    # Fetch roles mapping
-    # =========================
-    roles_map = await get_users_roles_map(user_ids, db)
+    # Without exact count an empty page past the first one means it does not exist
+    if not users_page and total != "exact" and page > 1:
+        raise HTTPException(status_code=404, detail="Page not found")
 
     # =========================
     # Build response items
     # =========================
-    items = [
-        UserSchema(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            active=user.active,
-            roles=roles_map.get(user.id, []),
-            created_at=user.created_at
-        )
-        for user in users_page
-    ]
+    items = await build_user_items(users_page, db) if users_page else []
 
     # =========================
     # Pagination metadata
     # =========================
+    if total_count is None:
+        total_count = offset + len(users_page)
+
     meta = PaginationMeta(
         page=page,
         limit=limit,
@@ -104,4 +150,54 @@ async def get_users_paginated(
     return PaginatedUsersSchema(
         items=items,
         meta=meta
-    )
\ No newline at end of file
+    )
+
+
+# =========================
+# Get users after cursor (keyset pagination)
+# =========================
+async def get_users_by_cursor(
+    db: AsyncSession,
+    cursor: str | None = None,
+    limit: int = 10,
+    total: str = "none"
+) -> PaginatedUsersSchema:
+    """
+    Retrieves the page of users following the cursor (first page if cursor is empty).
+    Cost does not grow with page depth: the index is searched from the cursor position.
+
+    :param total: "exact" (count query), "estimate" (table statistics) or "none"
+    """
+    query = select(UserModel).order_by(*USERS_ORDER).limit(limit + 1)
+
+    if cursor:
+        query = query.where(tuple_(*USERS_ORDER) > decode_cursor(cursor))
+
+    result = await db.exec(query)
+    users_page = result.all()
+
+    # One extra row tells whether a next page exists
+    next_cursor = None
+    if len(users_page) > limit:
+        users_page = users_page[:limit]
+
+        if users_page:
+            next_cursor = encode_cursor(users_page[-1])
+
+    items = await build_user_items(users_page, db) if users_page else []
+
+    # =========================
+    # Optional total
+    # =========================
+    meta = CursorPaginationMeta(limit=limit)
+
+    if total == "exact":
+        meta.total_users = await count_rows_exact(UserModel, db)
+    elif total == "estimate":
+        meta.total_users, meta.total_is_estimate = await count_rows_estimate(UserModel, db)
+
+    return PaginatedUsersSchema(
+        items=items,
+        meta=meta,
+        next_cursor=next_cursor
+    )
@@ -5,16 +5,15 @@
 # Imports
 # Libraries
 from sqlmodel import select
-from sqlalchemy import or_
+from sqlalchemy import or_, func
 from fastapi import HTTPException
 from sqlmodel.ext.asyncio.session import AsyncSession
 # Models
 from ...models import UserModel
 # Schemas
-from ...schemas.users.user_schema import UserSchema
 from ...schemas.users.pagination_schema import PaginatedUsersSchema, PaginationMeta
-# Utils
-from ...utils.get_users_roles_map import get_users_roles_map
+# Services
+from .read_all_users_service import build_user_items
 
 
 # =========================
@@ -26,51 +25,58 @@ async def get_user_by_username_or_email(
     page: int = 1,
     limit: int = 10
 ) -> PaginatedUsersSchema:
+    """
+    Searches users whose username or email contains the term.
+
+    Only the requested page is loaded: filtering, ranking, pagination and the total
+    (window count) are done in one query. On PostgreSQL the ILIKE filter uses the
+    pg_trgm GIN indexes and results are ranked by trigram similarity.
+    """
 
     offset = (page - 1) * limit
     search = username_or_email.strip().lower()
 
-    # ASYNC QUERY — WAIT FOR IT
+    # Escape LIKE wildcards typed by the user
+    pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+    # Best match first (similarity is PostgreSQL only)
+    if db.bind.dialect.name == "postgresql":
+        order_by = (
+            func.greatest(
+                func.similarity(UserModel.username, search),
+                func.similarity(UserModel.email, search)
+            ).desc(),
+            UserModel.id
+        )
+    else:
+        order_by = (UserModel.id,)
+
     result = await db.exec(
-        select(UserModel).where(
+        select(UserModel, func.count().over().label("total_users"))
+        .where(
             or_(
-                UserModel.username.ilike(f"%{search}%"),
-                UserModel.email.ilike(f"%{search}%")
+                UserModel.username.ilike(pattern, escape="\\"),
+                UserModel.email.ilike(pattern, escape="\\")
             )
         )
+        .order_by(*order_by)
+        .limit(limit)
+        .offset(offset)
     )
 
-    # NOW get all results
-    users = result.all()
-
-    if not users:
-        raise HTTPException(status_code=404, detail="User not found")
+    rows = result.all()
 
-    total_users = len(users)
-
-    if offset >= total_users:
+    # Empty page: nothing matched at all, or page is past the end
+    if not rows:
+        if page == 1:
+            raise HTTPException(status_code=404, detail="User not found")
         raise HTTPException(status_code=404, detail="Page not found")
 
-    # IDs
-    user_ids = [user.id for user in users]
-
-    # ASYNC roles map
-    roles_map = await get_users_roles_map(user_ids, db)
+    total_users = rows[0].total_users
+    users = [row[0] for row in rows]
 
-    # Paginated slice
-    paginated_users = users[offset:offset + limit]
-
-    items = [
-        UserSchema(
-            id=user.id,
-            username=user.username or "",
-            email=user.email,
-            active=user.active,
-            roles=roles_map.get(user.id, []),
-            created_at=user.created_at
-        )
-        for user in paginated_users
-    ]
+    # Roles only for the returned page
+    items = await build_user_items(users, db)
 
     meta = PaginationMeta(
         page=page,
@@ -79,4 +85,4 @@ async def get_user_by_username_or_email(
         total_pages=(total_users + limit - 1) // limit
     )
 
-    return PaginatedUsersSchema(items=items, meta=meta)
\ No newline at end of file
+    return PaginatedUsersSchema(items=items, meta=meta)
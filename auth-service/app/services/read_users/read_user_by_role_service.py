@@ -5,16 +5,17 @@
 # Imports
 # Libraries
 from sqlmodel import select
+from sqlalchemy import func
 from fastapi import HTTPException
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy import select as sa_select
 # Models
-from ...models import UserModel, RoleModel, UserRoleModel
+from ...models import UserModel, UserRoleModel
 # Schemas
-from ...schemas.users.user_schema import UserSchema
 from ...schemas.users.pagination_schema import PaginatedUsersSchema, PaginationMeta
+# Services
+from .read_all_users_service import build_user_items
 # Utils
-from ...utils.get_users_roles_map import get_users_roles_map
+from ...utils.roles_cache import get_role_id
 
 
 # =========================
@@ -26,45 +27,43 @@ async def get_users_by_role(
     page: int = 1,
     limit: int = 10
 ) -> PaginatedUsersSchema:
+    """
+    Lists users having the role, ordered by user ID.
+
+    One query returns the page and the total (window count); it walks the
+    (role_id, user_id) index of user_roles. Roles are loaded for the page only.
+    """
 
     role = role.strip().lower()
     offset = (page - 1) * limit
 
-    # ASYNC QUERY — IMPORTANT: await
+    # Role name -> ID from the in-memory catalog (no join with roles)
+    role_id = await get_role_id(role, db)
+
+    if role_id is None:
+        raise HTTPException(status_code=404, detail="Role not found")
+
     result = await db.exec(
-        select(UserModel)
+        select(UserModel, func.count().over().label("total_users"))
         .join(UserRoleModel, UserRoleModel.user_id == UserModel.id)
-        .join(RoleModel, RoleModel.id == UserRoleModel.role_id)
-        .where(RoleModel.name == role)
+        .where(UserRoleModel.role_id == role_id)
+        .order_by(UserRoleModel.user_id)
+        .limit(limit)
+        .offset(offset)
     )
 
-    users = result.all()
+    rows = result.all()
 
-    if not users:
-        raise HTTPException(status_code=404, detail="Role not found")
-
-    total_users = len(users)
-
-    if offset >= total_users:
+    # Empty page: nobody has the role, or page is past the end
+    if not rows:
+        if page == 1:
+            raise HTTPException(status_code=404, detail="Role not found")
         raise HTTPException(status_code=404, detail="Page not found")
 
-    # Roles async
-    user_ids = [user.id for user in users]
-    roles_map = await get_users_roles_map(user_ids, db)
-
-    paginated = users[offset:offset + limit]
+    total_users = rows[0].total_users
 
-    items = [
-        UserSchema(
-            id=user.id,
-            username=user.username or "",
-            email=user.email,
-            active=user.active,
-            roles=roles_map.get(user.id, []),
-            created_at=user.created_at
-        )
-        for user in paginated
-    ]
+    # Roles only for the returned page
+    items = await build_user_items([row[0] for row in rows], db)
 
     meta = PaginationMeta(
         page=page,
@@ -73,4 +72,4 @@ async def get_users_by_role(
         total_pages=(total_users + limit - 1) // limit
     )
 
-    return PaginatedUsersSchema(items=items, meta=meta)
\ No newline at end of file
+    return PaginatedUsersSchema(items=items, meta=meta)
@@ -13,6 +13,8 @@ from ...models import UserModel, RoleModel, UserRoleModel
 from ...schemas.roles.role_operation_response_schema import RoleOperationResponseSchema
 # Utils
 from ...utils.get_users_roles_map import get_users_roles_map
+from ...utils.roles_cache import invalidate_user_roles
+from ...utils.role_versions import bump_role_versions, set_role_versions
 
 
 # =========================
@@ -87,11 +89,18 @@ async def add_role_for_users(
                 )
             )
 
+    # Access tokens issued before this change become stale
+    role_versions = await bump_role_versions(user_ids, db)
+
     # =========================
     # Commit async
     # =========================
     await db.commit()
 
+    # Cached roles of these users are outdated now
+    invalidate_user_roles(user_ids)
+    set_role_versions(role_versions)
+
     # =========================
     # Reload roles map
     # =========================
@@ -0,0 +1,190 @@
+# =========================
+# Bulk role management service
+# =========================
+
+# Imports
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import delete
+from fastapi import HTTPException
+# Models
+from ...models import UserModel, UserRoleModel
+# Schemas
+from ...schemas.roles.bulk_role_operation_response_schema import (
+    BulkRoleOperationResponseSchema,
+    UserRoleOutcomeSchema
+)
+# Utils
+from ...utils.roles_cache import get_role_id, get_role_name, invalidate_user_roles
+from ...utils.role_versions import bump_role_versions, set_role_versions
+from ...utils.dialect_insert import dialect_insert
+
+
+"""
+Adds / removes several roles for many users in one transaction:
+one SELECT for existing users, one set-based INSERT ... ON CONFLICT DO NOTHING
+(or DELETE) with RETURNING, one role_version update, one commit.
+"""
+
+
+# =========================
+# Shared steps
+# =========================
+async def _resolve_role_ids(role_names: list[str], db: AsyncSession) -> list[int]:
+    """
+    Role names -> IDs from the in-memory catalog.
+
+    :raises HTTPException: 404 if a role does not exist
+    """
+    role_ids = []
+
+    for role_name in dict.fromkeys(name.strip().lower() for name in role_names):
+        role_id = await get_role_id(role_name, db)
+
+        if role_id is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Role not found: {role_name}"
+            )
+
+        role_ids.append(role_id)
+
+    return role_ids
+
+
+async def _split_users(
+    user_ids: list[int],
+    db: AsyncSession,
+    admin_user_id: str
+) -> tuple[list[int], dict[int, str]]:
+    """
+    Returns users that can be modified and statuses of the ones that cannot.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+
+    result = await db.exec(
+        select(UserModel.id).where(UserModel.id.in_(user_ids))
+    )
+    existing = set(result.all())
+
+    skipped = {}
+    targets = []
+
+    for target_id in user_ids:
+        if target_id not in existing:
+            skipped[target_id] = "not_found"
+        elif target_id == int(admin_user_id):
+            skipped[target_id] = "forbidden"    # own roles cannot be modified
+        else:
+            targets.append(target_id)
+
+    return targets, skipped
+
+
+async def _finish(
+    user_ids: list[int],
+    changed_rows: list[tuple[int, int]],
+    skipped: dict[int, str],
+    db: AsyncSession
+) -> BulkRoleOperationResponseSchema:
+    """
+    Bumps role versions of changed users, commits and builds per-user outcomes.
+    """
+    changed: dict[int, list[str]] = {}
+    for changed_user_id, role_id in changed_rows:
+        changed.setdefault(changed_user_id, []).append(await get_role_name(role_id, db))
+
+    # Access tokens issued before this change become stale
+    role_versions = {}
+    if changed:
+        role_versions = await bump_role_versions(list(changed), db)
+
+    await db.commit()
+
+    # Cached roles of these users are outdated now
+    invalidate_user_roles(list(changed))
+    set_role_versions(role_versions)
+
+    results = []
+    for target_id in dict.fromkeys(user_ids):
+        if target_id in skipped:
+            status = skipped[target_id]
+        elif target_id in changed:
+            status = "updated"
+        else:
+            status = "unchanged"
+
+        results.append(UserRoleOutcomeSchema(
+            user_id=target_id,
+            status=status,
+            roles=changed.get(target_id, [])
+        ))
+
+    return BulkRoleOperationResponseSchema(
+        updated=len(changed),
+        results=results
+    )
+
+
+# =========================
+# Bulk add
+# =========================
+async def bulk_add_roles(
+    user_ids: list[int],
+    role_names: list[str],
+    db: AsyncSession,
+    user_id: str
+) -> BulkRoleOperationResponseSchema:
+    """
+    Adds every given role to every given user (existing pairs are skipped).
+    """
+    role_ids = await _resolve_role_ids(role_names, db)
+    targets, skipped = await _split_users(user_ids, db, user_id)
+
+    inserted = []
+
+    if targets:
+        result = await db.exec(
+            dialect_insert(db)(UserRoleModel)
+            .values([
+                {"user_id": target_id, "role_id": role_id}
+                for target_id in targets
+                for role_id in role_ids
+            ])
+            .on_conflict_do_nothing(index_elements=["user_id", "role_id"])
+            .returning(UserRoleModel.user_id, UserRoleModel.role_id)
+        )
+        inserted = result.all()
+
+    return await _finish(user_ids, inserted, skipped, db)
+
+
+# =========================
+# Bulk remove
+# =========================
+async def bulk_remove_roles(
+    user_ids: list[int],
+    role_names: list[str],
+    db: AsyncSession,
+    user_id: str
+) -> BulkRoleOperationResponseSchema:
+    """
+    Removes every given role from every given user.
+    """
+    role_ids = await _resolve_role_ids(role_names, db)
+    targets, skipped = await _split_users(user_ids, db, user_id)
+
+    deleted = []
+
+    if targets:
+        result = await db.exec(
+            delete(UserRoleModel)
+            .where(
+                UserRoleModel.user_id.in_(targets),
+                UserRoleModel.role_id.in_(role_ids)
+            )
+            .returning(UserRoleModel.user_id, UserRoleModel.role_id)
+        )
+        deleted = result.all()
+
+    return await _finish(user_ids, deleted, skipped, db)
@@ -4,17 +4,20 @@
 
 # Imports
 # Libraries
-import jwt
 import secrets
+import hashlib
 import os
 from datetime import timedelta
 from dotenv import load_dotenv
+from sqlalchemy import delete
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 # Models
-from ...models import TokenModel
+from ...models import TokenModel, UserModel
 # Utils
 from ...utils.current_date import get_current_date
+from ...utils.get_users_roles_map import get_users_roles_map
+from ...utils.signing_keys import encode_token
 
 
 # =========================
@@ -22,11 +25,12 @@ from ...utils.current_date import get_current_date
 # =========================
 load_dotenv()
 
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = os.getenv("ALGORITHM")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(
     os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
 )
+# Sessions (refresh tokens) a user keeps after login, the new one included.
+# 1 = single session: every login ends the other devices' sessions
+SESSIONS_PER_USER = max(1, int(os.getenv("SESSIONS_PER_USER", "1")))
 
 
 # ============================================================
@@ -49,15 +53,59 @@ async def create_access_token(
 
     to_encode.update({"exp": expire})
 
-    encoded_jwt = jwt.encode(
-        to_encode,
-        SECRET_KEY,
-        algorithm=ALGORITHM
-    )
+    # Signed with the current key (EdDSA / RS256) or SECRET_KEY (HS256)
+    encoded_jwt = encode_token(to_encode)
 
     return encoded_jwt
 
 
+# ============================================================
+# Create JWT Access Token for user (with roles)
+# ============================================================
+
+async def create_user_access_token(
+    user: UserModel,
+    db: AsyncSession,
+    session_id: int | None = None
+) -> str:
+    """
+    Creates access token with user roles and role version claims,
+    so verifiers can authorize without a database lookup.
+    Roles are read from the database (not cache) to be exact at issue time.
+    session_id (ID of the refresh token issued together) is stored as "sid",
+    so logout and refresh can revoke the access token.
+    """
+    return await create_access_token_for_user_id(
+        user.id,
+        user.role_version,
+        db,
+        session_id
+    )
+
+
+async def create_access_token_for_user_id(
+    user_id: int,
+    role_version: int,
+    db: AsyncSession,
+    session_id: int | None = None
+) -> str:
+    """
+    Same as create_user_access_token when only the user ID and role version are loaded.
+    """
+    roles_map = await get_users_roles_map(user_id, db)
+
+    claims = {
+        "sub": str(user_id),
+        "roles": roles_map.get(user_id, []),
+        "role_version": role_version
+    }
+
+    if session_id is not None:
+        claims["sid"] = session_id
+
+    return await create_access_token(claims)
+
+
 # ============================================================
 # Create Refresh Token
 # ============================================================
@@ -66,6 +114,18 @@ async def create_refresh_token() -> str:
     return secrets.token_urlsafe(32)
 
 
+# ============================================================
+# Hash Refresh Token
+# ============================================================
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """
+    Returns SHA-256 hex digest stored instead of the refresh token.
+    Tokens are random 256-bit values, so a fast unsalted hash is enough.
+    """
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
 # ============================================================
 # Save Refresh Token (ASYNC)
 # ============================================================
@@ -74,24 +134,66 @@ async def save_refresh_token(
     refresh_token: str,
     user_id: int,
     db: AsyncSession,
-    expires_days: int = 7
+    expires_days: int = 7,
+    commit: bool = True
 ) -> TokenModel:
-
+    """
+    Stores hash of the refresh token.
+    With commit=False the row is only flushed (ID is assigned) and the caller commits.
+    """
     token = TokenModel(
         user_id=user_id,
-        refresh_token=refresh_token,
+        token_hash=hash_refresh_token(refresh_token),
         created_at=get_current_date(),
         expires_at=get_current_date() + timedelta(days=expires_days)
     )
 
     db.add(token)
 
+    if not commit:
+        await db.flush()
+        return token
+
     await db.commit()
     await db.refresh(token)
 
     return token
 
 
+# ============================================================
+# Prune user sessions on login (ASYNC)
+# ============================================================
+
+async def prune_user_sessions(
+    user_id: int,
+    db: AsyncSession,
+    keep: int = SESSIONS_PER_USER
+) -> list[int]:
+    """
+    Deletes user's refresh tokens except the `keep` most recent ones, in one statement.
+    Called after the new token is flushed (so it is one of the kept ones, and its ID
+    never reuses an ID of a deleted session). Does not commit.
+    Returns IDs of the deleted sessions (revoke their access tokens after commit).
+    """
+    newest_ids = (
+        select(TokenModel.id)
+        .where(TokenModel.user_id == user_id)
+        .order_by(TokenModel.created_at.desc(), TokenModel.id.desc())
+        .limit(keep)
+    )
+
+    result = await db.exec(
+        delete(TokenModel)
+        .where(
+            TokenModel.user_id == user_id,
+            TokenModel.id.not_in(newest_ids)
+        )
+        .returning(TokenModel.id)
+    )
+
+    return list(result.scalars())
+
+
 # ============================================================
 # Delete Refresh Token (ASYNC)
 # ============================================================
@@ -101,16 +203,10 @@ async def delete_refresh_token(
     db: AsyncSession
 ) -> None:
 
-    result = await db.exec(
-        select(TokenModel).where(
-            TokenModel.refresh_token == refresh_token
+    await db.exec(
+        delete(TokenModel).where(
+            TokenModel.token_hash == hash_refresh_token(refresh_token)
         )
     )
 
-    rows = result.all()
-
-    for row in rows:
-        token_obj = row[0]
-        await db.delete(token_obj)
-
     await db.commit()
\ No newline at end of file
@@ -5,11 +5,10 @@
 # Imports
 # Libraries
 from sqlmodel import select
+from sqlalchemy import delete
 from fastapi import HTTPException, status
-from jose import jwt, JWTError, ExpiredSignatureError
+import jwt
 from datetime import datetime, timezone
-from dotenv import load_dotenv
-import os
 from sqlmodel.ext.asyncio.session import AsyncSession
 # Models
 from ...models import TokenModel, UserModel
@@ -17,48 +16,61 @@ from ...models import TokenModel, UserModel
 from ...schemas.tokens.token_refresh_schema import TokenRefreshSchema
 # Services
 from .create_tokens_service import (
-    create_access_token,
+    create_access_token_for_user_id,
     create_refresh_token,
+    hash_refresh_token,
     save_refresh_token
 )
-
-
-# =========================
-# Load env
-# =========================
-load_dotenv()
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = os.getenv("ALGORITHM")
+# Utils
+from ...utils.current_date import get_current_date
+from ...utils.signing_keys import decode_token
+from ...utils.revocation_list import is_token_revoked, revoke_session
 
 
 # =====================================================
 # Decode access token
 # =====================================================
-async def check_access_token(access_token: str) -> int:
+async def decode_access_token(access_token: str) -> dict:
+    """
+    Decodes access token and returns its full payload.
+
+    :param access_token: JWT access token string
+    :return: token payload ("sub", "exp", ...)
+    :raises HTTPException: if token is expired or invalid
+    """
     try:
-        payload = jwt.decode(
-            access_token,
-            SECRET_KEY,
-            algorithms=[ALGORITHM]
-        )
-        
-        # Get user ID from token payload ("sub" = subject)
-        user_id = payload.get("sub")
+        payload = decode_token(access_token)
 
-        return int(user_id)
-
-    except ExpiredSignatureError:
+    except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=401,
             detail="Token expired"
         )
 
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=401,
             detail="Invalid token"
         )
 
+    # User deactivated or session ended (logout / refresh)
+    if is_token_revoked(payload):
+        raise HTTPException(
+            status_code=401,
+            detail="Token revoked"
+        )
+
+    return payload
+
+
+async def check_access_token(access_token: str) -> int:
+    payload = await decode_access_token(access_token)
+
+    # Get user ID from token payload ("sub" = subject)
+    user_id = payload.get("sub")
+
+    return int(user_id)
+
 
 # =====================================================
 # Refresh tokens
@@ -67,15 +79,88 @@ async def refresh_access_token(
     refresh_token: str,
     db: AsyncSession
 ) -> TokenRefreshSchema:
-
+    """
+    Rotates refresh token in one transaction.
+
+    A single DELETE ... RETURNING removes the presented token only if it is
+    not expired and its user is active, so two concurrent refreshes with the
+    same token cannot both succeed (the second one deletes nothing).
+    """
+    token_hash = hash_refresh_token(refresh_token)
+
+    # =========================
+    # Consume old token (one statement)
+    # =========================
     result = await db.exec(
-        select(TokenModel).where(
-            TokenModel.refresh_token == refresh_token
+        delete(TokenModel)
+        .where(
+            TokenModel.token_hash == token_hash,
+            TokenModel.expires_at > get_current_date(),
+            TokenModel.user_id.in_(
+                select(UserModel.id).where(UserModel.active == True)
+            )
+        )
+        .returning(
+            TokenModel.id,
+            TokenModel.user_id,
+            select(UserModel.role_version)
+            .where(UserModel.id == TokenModel.user_id)
+            .scalar_subquery()
         )
     )
 
+    consumed = result.first()
+
+    if consumed is None:
+        await db.rollback()
+        await reject_refresh_token(token_hash, db)     # always raises 401
+
+    old_session_id, user_id, role_version = consumed
+
+    # =========================
+    # Issue new tokens (same transaction)
+    # =========================
+    new_refresh_token = await create_refresh_token()
+    session = await save_refresh_token(new_refresh_token, user_id, db, commit=False)
+
+    access_token = await create_access_token_for_user_id(
+        user_id,
+        role_version,
+        db,
+        session.id
+    )
+
+    # Access tokens issued with the old refresh token are replaced by the new one
+    revoke_session(old_session_id, db)
+
+    await db.commit()
+
+    return TokenRefreshSchema(
+        access_token=access_token,
+        token_type="Bearer",
+        refresh_token=new_refresh_token
+    )
+
+
+# =====================================================
+# Rejected refresh (slow path)
+# =====================================================
+async def reject_refresh_token(
+    token_hash: str,
+    db: AsyncSession
+) -> None:
+    """
+    Finds out why rotation deleted nothing and raises matching 401.
+    Expired tokens are removed. Access tokens of inactive users were revoked when
+    the user was deactivated (revocations table, all workers).
+    """
+    result = await db.exec(
+        select(TokenModel).where(TokenModel.token_hash == token_hash)
+    )
+
     token = result.first()
 
+    # Unknown or already used token
     if not token:
         raise HTTPException(
             status_code=401,
@@ -85,7 +170,7 @@ async def refresh_access_token(
     # expiration check
     expires_at = token.expires_at.replace(tzinfo=timezone.utc)
 
-    if expires_at < datetime.now(timezone.utc):
+    if expires_at <= datetime.now(timezone.utc):
         await db.delete(token)
         await db.commit()
 
@@ -94,32 +179,7 @@ async def refresh_access_token(
             detail="Refresh token expired"
         )
 
-    # check user
-    user_result = await db.exec(
-        select(UserModel).where(UserModel.id == token.user_id)
+    raise HTTPException(
+        status_code=401,
+        detail="User inactive"
     )
-
-    user = user_result.first()
-
-    if not user or not user.active:
-        raise HTTPException(
-            status_code=401,
-            detail="User inactive"
-        )
-
-    # token rotation
-    await db.delete(token)
-    await db.commit()
-
-    new_refresh_token = await create_refresh_token()
-    await save_refresh_token(new_refresh_token, token.user_id, db)
-
-    access_token = await create_access_token(
-        {"sub": str(token.user_id)}
-    )
-
-    return TokenRefreshSchema(
-        access_token=access_token,
-        token_type="Bearer",
-        refresh_token=new_refresh_token
-    )
\ No newline at end of file
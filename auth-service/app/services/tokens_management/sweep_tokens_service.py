@@ -0,0 +1,201 @@
+# =========================
+# Refresh tokens sweeper
+# =========================
+
+# Imports
+# Libraries
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import delete, func
+from dotenv import load_dotenv
+from datetime import timedelta
+import asyncio
+import logging
+import time
+import os
+# Models
+from ...models import RevocationModel, TokenModel
+# Utils
+from ...utils.current_date import get_current_date
+from ...utils.revocation_list import ACCESS_TOKEN_TTL_SECONDS, revoke_session
+# Services
+from .create_tokens_service import prune_user_sessions
+
+
+"""
+Background cleanup of the tokens table.
+
+Rows are otherwise deleted only when the same token is presented again or the user
+logs in, so expired tokens would pile up. Every REFRESH_TOKENS_SWEEP_INTERVAL seconds:
+
+- expired tokens are deleted
+- tokens above REFRESH_TOKENS_PER_USER_MAX per user are deleted (oldest first) and their
+  access tokens revoked; only users over the limit are visited (login already prunes,
+  so there are few), one short transaction per user
+- revocations older than the access token lifetime are deleted (those tokens expired)
+
+Expired tokens are deleted in batches of REFRESH_TOKENS_SWEEP_BATCH rows, one short
+transaction each, so refreshes and logins are never blocked for long.
+"""
+
+
+# =========================
+# Load environment variables
+# =========================
+load_dotenv()
+
+REFRESH_TOKENS_SWEEP_INTERVAL = float(os.getenv("REFRESH_TOKENS_SWEEP_INTERVAL", "300"))
+REFRESH_TOKENS_SWEEP_BATCH = int(os.getenv("REFRESH_TOKENS_SWEEP_BATCH", "1000"))
+REFRESH_TOKENS_PER_USER_MAX = int(os.getenv("REFRESH_TOKENS_PER_USER_MAX", "10"))
+
+logger = logging.getLogger(__name__)
+
+# Counters for metrics (per worker process)
+_stats = {
+    "runs": 0,
+    "swept_expired": 0,
+    "swept_over_limit": 0,
+    "remaining": None,
+    "last_run_ms": None,
+}
+
+
+# =========================
+# Batched delete
+# =========================
+async def _delete_in_batches(ids_query, db: AsyncSession, model=TokenModel) -> int:
+    """
+    Deletes rows whose IDs are returned by ids_query (already limited to one batch)
+    until a batch is not full. Commits after every batch.
+    """
+    deleted = 0
+
+    while True:
+        result = await db.exec(
+            delete(model).where(model.id.in_(ids_query))
+        )
+        await db.commit()
+
+        deleted += result.rowcount
+
+        if result.rowcount < REFRESH_TOKENS_SWEEP_BATCH:
+            return deleted
+
+        # Let other transactions run between batches
+        await asyncio.sleep(0.01)
+
+
+# =========================
+# Tokens above the per-user limit
+# =========================
+async def _delete_over_limit(db: AsyncSession) -> int:
+    """
+    Keeps the REFRESH_TOKENS_PER_USER_MAX newest tokens of each user over the limit
+    (found with GROUP BY on the tokens user_id index) and revokes the deleted sessions.
+    """
+    deleted = 0
+
+    while True:
+        result = await db.exec(
+            select(TokenModel.user_id)
+            .group_by(TokenModel.user_id)
+            .having(func.count() > REFRESH_TOKENS_PER_USER_MAX)
+            .limit(REFRESH_TOKENS_SWEEP_BATCH)
+        )
+        user_ids = list(result.all())
+
+        for user_id in user_ids:
+            ended_sessions = await prune_user_sessions(user_id, db, keep=REFRESH_TOKENS_PER_USER_MAX)
+            revoke_session(ended_sessions, db)
+            await db.commit()
+
+            deleted += len(ended_sessions)
+
+        if len(user_ids) < REFRESH_TOKENS_SWEEP_BATCH:
+            return deleted
+
+        # Let other transactions run between batches
+        await asyncio.sleep(0.01)
+
+
+# =========================
+# Sweep once
+# =========================
+async def sweep_refresh_tokens(db: AsyncSession) -> dict:
+    """
+    Deletes expired tokens and tokens above the per-user limit.
+    Returns number of deleted and remaining rows.
+    """
+    started = time.perf_counter()
+
+    # Expired tokens (rows locked by a running refresh are skipped)
+    expired_ids = (
+        select(TokenModel.id)
+        .where(TokenModel.expires_at <= get_current_date())
+        .limit(REFRESH_TOKENS_SWEEP_BATCH)
+        .with_for_update(skip_locked=True)
+    )
+    swept_expired = await _delete_in_batches(expired_ids, db)
+
+    # Tokens above the per-user limit (newest ones are kept)
+    swept_over_limit = await _delete_over_limit(db)
+
+    # Revocations of tokens that have expired
+    old_revocation_ids = (
+        select(RevocationModel.id)
+        .where(
+            RevocationModel.created_at
+            <= get_current_date() - timedelta(seconds=ACCESS_TOKEN_TTL_SECONDS)
+        )
+        .limit(REFRESH_TOKENS_SWEEP_BATCH)
+    )
+    await _delete_in_batches(old_revocation_ids, db, RevocationModel)
+
+    result = await db.exec(select(func.count()).select_from(TokenModel))
+    remaining = result.one()
+
+    _stats["runs"] += 1
+    _stats["swept_expired"] += swept_expired
+    _stats["swept_over_limit"] += swept_over_limit
+    _stats["remaining"] = remaining
+    _stats["last_run_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    return {
+        "swept_expired": swept_expired,
+        "swept_over_limit": swept_over_limit,
+        "remaining": remaining,
+    }
+
+
+# =========================
+# Background task
+# =========================
+async def sweep_refresh_tokens_forever(session_factory) -> None:
+    """
+    Runs sweep_refresh_tokens on an interval (started from the app lifespan).
+    """
+    while True:
+        try:
+            async with session_factory() as db:
+                await sweep_refresh_tokens(db)
+        except Exception:
+            logger.exception("Refresh tokens sweep failed")
+
+        await asyncio.sleep(REFRESH_TOKENS_SWEEP_INTERVAL)
+
+
+# =========================
+# Metrics
+# =========================
+def get_sweeper_stats() -> dict:
+    """
+    Returns totals of swept rows and remaining rows after the last run.
+    """
+    return {
+        "runs": _stats["runs"],
+        "swept_expired": _stats["swept_expired"],
+        "swept_over_limit": _stats["swept_over_limit"],
+        "remaining": _stats["remaining"],
+        "last_run_ms": _stats["last_run_ms"],
+        "per_user_max": REFRESH_TOKENS_PER_USER_MAX,
+    }
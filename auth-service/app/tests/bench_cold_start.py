@@ -0,0 +1,124 @@
+# =========================
+# Cold start benchmark (time to first request)
+# =========================
+
+# Imports
+# Libraries
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import httpx
+
+
+"""
+Starts the auth service in a fresh uvicorn process and measures:
+
+- import: seconds to import app.main in a fresh interpreter
+- first request: seconds from process start to the first successful response
+
+Each mode is started --rounds times:
+
+- check: startup only checks the schema_version row (default deployment)
+- auto-migrate: DATABASE_AUTO_MIGRATE=true, schema checked / created on every start
+  (same work the previous startup did with create_all and role seeding)
+
+The database is migrated once before measuring. Uses DATABASE_URL / SECRET_KEY /
+ALGORITHM from the environment, run from the auth-service directory:
+
+    python -m app.tests.bench_cold_start --rounds 5
+"""
+
+
+# First request target: served without database or authentication
+PROBE_PATH = "/.well-known/jwks.json"
+
+
+# =========================
+# Helpers
+# =========================
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import_s() -> float:
+    """
+    Returns seconds needed to import app.main in a new interpreter.
+    """
+    output = subprocess.check_output([
+        sys.executable, "-c",
+        "import time; started = time.perf_counter(); import app.main; "
+        "print(time.perf_counter() - started)"
+    ])
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def measure_first_request_s(env: dict, timeout: float) -> float:
+    """
+    Returns seconds from uvicorn process start to the first 200 response.
+    """
+    port = free_port()
+    started = time.perf_counter()
+
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL
+    )
+
+    try:
+        while time.perf_counter() - started < timeout:
+            if process.poll() is not None:
+                raise SystemExit(f"uvicorn exited with code {process.returncode}")
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}{PROBE_PATH}", timeout=1)
+                if response.status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                pass
+            time.sleep(0.01)
+
+        raise SystemExit(f"No response within {timeout} s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+# =========================
+# Benchmark entry
+# =========================
+def main(rounds: int, timeout: float):
+    subprocess.check_call(
+        [sys.executable, "-m", "app.utils.init_data_base"],
+        stdout=subprocess.DEVNULL
+    )
+
+    imports = [measure_import_s() for _ in range(rounds)]
+    print(f"{'import app.main':<28} {statistics.median(imports) * 1000:10.1f} ms")
+
+    modes = {
+        "first request (check)": "false",
+        "first request (auto-migrate)": "true",
+    }
+
+    for name, auto_migrate in modes.items():
+        env = {**os.environ, "DATABASE_AUTO_MIGRATE": auto_migrate}
+        samples = [measure_first_request_s(env, timeout) for _ in range(rounds)]
+        print(f"{name:<28} {statistics.median(samples) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Auth service cold start benchmark")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for a start")
+    args = parser.parse_args()
+
+    main(args.rounds, args.timeout)
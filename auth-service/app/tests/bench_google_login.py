@@ -0,0 +1,151 @@
+# =========================
+# Google login latency benchmark (stub provider)
+# =========================
+
+# Imports
+# Libraries
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import httpx
+
+
+"""
+Runs complete Google logins against the local stub provider
+(app/tests/stub_oauth_provider.py, started here with --latency-ms):
+
+/auth/google/login -> stub /authorize -> /auth/google/callback (code exchange,
+id_token check, user + tokens in one transaction) -> 303 to the frontend.
+
+Half of the logins are returning users (existing email), half are new users.
+Reports callback latency and how often the provider's discovery document and
+JWKS were fetched (cached, so once per GOOGLE_METADATA_TTL).
+
+Uses DATABASE_URL / SECRET_KEY / ALGORITHM from the environment:
+
+    python -m app.tests.bench_google_login --logins 200 --concurrency 10 --latency-ms 50
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_stub_provider(port: int, latency_ms: float) -> subprocess.Popen:
+    """
+    Starts the stub provider and waits until it answers.
+    """
+    process = subprocess.Popen([
+        sys.executable, "-m", "app.tests.stub_oauth_provider",
+        "--port", str(port), "--latency-ms", str(latency_ms)
+    ])
+
+    for _ in range(500):
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/stats", timeout=1)
+            return process
+        except httpx.TransportError:
+            time.sleep(0.02)
+
+    process.terminate()
+    raise SystemExit("Stub provider did not start")
+
+
+# =========================
+# One login
+# =========================
+async def google_login(
+    transport: httpx.ASGITransport,
+    provider: httpx.AsyncClient,
+    email: str,
+    latencies: list[float]
+) -> None:
+    """
+    Runs one login with its own cookie jar (session holds OAuth state and nonce).
+    """
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get("/auth/google/login")
+        assert response.status_code == 302, response.status_code
+
+        authorize_url = httpx.URL(response.headers["location"])
+        response = await provider.get(
+            authorize_url.copy_merge_params({"login_hint": email})
+        )
+        assert response.status_code == 302, response.text
+
+        callback = httpx.URL(response.headers["location"])
+
+        started = time.perf_counter()
+        response = await client.get(callback.raw_path.decode())
+        latencies.append(time.perf_counter() - started)
+
+        assert response.status_code == 303, response.text
+        assert "access_token=" in response.headers["location"]
+
+
+# =========================
+# Benchmark entry
+# =========================
+async def main(logins: int, concurrency: int, latency_ms: float):
+    port = free_port()
+    provider_url = f"http://127.0.0.1:{port}"
+
+    # Read by app.utils.google_oauth on import
+    os.environ["GOOGLE_CONF_URL"] = f"{provider_url}/.well-known/openid-configuration"
+    os.environ["GOOGLE_CLIENT_ID"] = "bench-client"
+    os.environ["GOOGLE_CLIENT_SECRET"] = "bench-secret"
+    os.environ["GOOGLE_REDIRECT_URI"] = "http://bench/auth/google/callback"
+
+    from ..main import app
+    from ..utils.init_data_base import init_db
+
+    await init_db()
+
+    process = start_stub_provider(port, latency_ms)
+    run_id = os.urandom(3).hex()
+    latencies: list[float] = []
+
+    try:
+        transport = httpx.ASGITransport(app=app)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with httpx.AsyncClient() as provider, app.router.lifespan_context(app):
+            async def limited(i: int):
+                # Every second login is a returning user
+                email = f"google_{run_id}_{i // 2}@bench.local"
+                async with semaphore:
+                    await google_login(transport, provider, email, latencies)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(limited(i) for i in range(logins)))
+            elapsed = time.perf_counter() - started
+
+            stats = (await provider.get(f"{provider_url}/stats")).json()
+    finally:
+        process.terminate()
+        process.wait()
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+
+    print(f"logins          : {logins} (concurrency {concurrency}, provider latency {latency_ms} ms)")
+    print(f"throughput      : {logins / elapsed:10.1f} logins/s")
+    print(f"callback p50    : {statistics.median(latencies_ms):10.2f} ms")
+    print(f"callback p95    : {latencies_ms[int(len(latencies_ms) * 0.95) - 1]:10.2f} ms")
+    print(f"provider calls  : {stats}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Google login latency benchmark")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=50, help="Stub provider latency")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.logins, args.concurrency, args.latency_ms))
@@ -0,0 +1,147 @@
+# =========================
+# Refresh token rotation benchmark
+# =========================
+
+# Imports
+# Libraries
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+import httpx
+# App
+from ..main import app
+from ..dependencies.data_base_connection import async_session
+from ..models import UserModel
+from ..services.tokens_management.create_tokens_service import (
+    create_refresh_token,
+    save_refresh_token
+)
+from ..utils.init_data_base import init_db
+
+
+"""
+Simulates users with several browser tabs refreshing the same refresh token at once.
+
+For every round each user sends --tabs concurrent POST /token/refresh requests with
+the current refresh token: exactly one of them must win (200), the others get 401.
+The winner's new refresh token is used in the next round.
+
+Uses DATABASE_URL / SECRET_KEY / ALGORITHM from the environment:
+
+    python -m app.tests.bench_refresh_tokens --users 50 --tabs 4 --rounds 10
+"""
+
+
+# =========================
+# Test data
+# =========================
+async def create_sessions(users: int) -> list[str]:
+    """
+    Creates users with one refresh token each, returns the tokens.
+    """
+    prefix = uuid.uuid4().hex[:8]
+    tokens = []
+
+    async with async_session() as db:
+        for i in range(users):
+            user = UserModel(
+                username=f"bench_{prefix}_{i}",
+                email=f"bench_{prefix}_{i}@bench.local"
+            )
+            db.add(user)
+            await db.flush()
+
+            refresh_token = await create_refresh_token()
+            await save_refresh_token(refresh_token, user.id, db, commit=False)
+            tokens.append(refresh_token)
+
+        await db.commit()
+
+    return tokens
+
+
+# =========================
+# One round
+# =========================
+async def refresh_round(
+    client: httpx.AsyncClient,
+    tokens: list[str],
+    tabs: int,
+    latencies: list[float]
+) -> tuple[list[str], int]:
+    """
+    Sends `tabs` concurrent refreshes per user.
+    Returns next refresh tokens and number of users with a double success.
+    """
+    async def tab(refresh_token: str) -> str | None:
+        started = time.perf_counter()
+        response = await client.post(
+            "/token/refresh",
+            headers={"Authorization": f"Bearer {refresh_token}"}
+        )
+        latencies.append(time.perf_counter() - started)
+
+        if response.status_code == 200:
+            return response.json()["refresh_token"]
+
+        assert response.status_code == 401, response.status_code
+        return None
+
+    results = await asyncio.gather(*(
+        asyncio.gather(*(tab(token) for _ in range(tabs)))
+        for token in tokens
+    ))
+
+    next_tokens = []
+    double_wins = 0
+
+    for user_results in results:
+        winners = [token for token in user_results if token is not None]
+        assert winners, "every user must keep one valid session"
+        double_wins += len(winners) > 1
+        next_tokens.append(winners[0])
+
+    return next_tokens, double_wins
+
+
+# =========================
+# Benchmark entry
+# =========================
+async def main(users: int, tabs: int, rounds: int):
+    await init_db()
+
+    tokens = await create_sessions(users)
+    latencies: list[float] = []
+    double_wins = 0
+
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+
+        for _ in range(rounds):
+            tokens, wins = await refresh_round(client, tokens, tabs, latencies)
+            double_wins += wins
+
+        elapsed = time.perf_counter() - started
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+
+    print(f"requests      : {len(latencies_ms)} ({users} users x {tabs} tabs x {rounds} rounds)")
+    print(f"throughput    : {len(latencies_ms) / elapsed:10.1f} req/s")
+    print(f"latency p50   : {statistics.median(latencies_ms):10.2f} ms")
+    print(f"latency p95   : {latencies_ms[int(len(latencies_ms) * 0.95) - 1]:10.2f} ms")
+    print(f"latency max   : {latencies_ms[-1]:10.2f} ms")
+    print(f"double wins   : {double_wins:10d} (must be 0)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh token rotation benchmark")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--tabs", type=int, default=4, help="Concurrent refreshes per user")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.tabs, args.rounds))
@@ -0,0 +1,371 @@
+# =========================
+# Auth service benchmark suite
+# =========================
+
+# Imports
+# Libraries
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import time
+import uuid
+import httpx
+from sqlalchemy import insert
+# App
+from ..main import app
+from ..dependencies.data_base_connection import async_session, engine
+from ..models import UserModel, UserRoleModel
+from ..utils.init_data_base import init_db
+from ..utils.roles_cache import get_role_id
+
+
+"""
+Load test of the main auth endpoints, in-process (httpx ASGI transport, no network),
+against the database in DATABASE_URL (local PostgreSQL or a SQLite file).
+
+Scenarios (run in this order, --scenarios selects a subset):
+
+- login         POST /auth/login (password check, session prune, new tokens)
+- register      POST /auth/register (new user every request)
+- refresh       POST /token/refresh (each worker rotates its own session)
+- token_check   GET /token/check
+- users_list    GET /users/ (admin, page 1)
+- users_search  GET /users/search/{term} (admin)
+
+Each scenario sends --requests requests with --concurrency workers and reports
+throughput and p50 / p95 / p99 latency. --save-baseline writes the results as JSON;
+--baseline compares with such a file and exits with code 1 when p95 grew or
+throughput dropped by more than --tolerance (or any request failed).
+
+    python -m app.tests.bench_suite --requests 500 --concurrency 20 --save-baseline bench_baseline.json
+    python -m app.tests.bench_suite --requests 500 --concurrency 20 --baseline bench_baseline.json
+"""
+
+
+SCENARIOS = ["login", "register", "refresh", "token_check", "users_list", "users_search"]
+
+PASSWORD = "bench-password-1"
+
+
+# =========================
+# Test data
+# =========================
+class BenchState:
+    """
+    Users and current tokens shared by the scenarios.
+
+    Attributes:
+    - run_id (str): Prefix of every name created by this run
+    - usernames (list[str]): One login user per worker
+    - tokens (list[dict]): Current access / refresh token of each worker
+    - admin_token (str): Access token with the admin role
+    """
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.usernames: list[str] = []
+        self.tokens: list[dict] = []
+        self.admin_token = ""
+
+
+async def seed_users(run_id: str, count: int) -> None:
+    """
+    Inserts users without password (listing / search data), 1000 rows per statement.
+    """
+    async with async_session() as db:
+        for start in range(0, count, 1000):
+            await db.exec(
+                insert(UserModel),
+                params=[
+                    {
+                        "username": f"seed_{run_id}_{i}",
+                        "email": f"seed_{run_id}_{i}@benchmail.lv",
+                        "auth_provider": "local",
+                        "active": True,
+                        "role_version": 0,
+                    }
+                    for i in range(start, min(start + 1000, count))
+                ]
+            )
+        await db.commit()
+
+
+async def register(client: httpx.AsyncClient, username: str) -> dict:
+    response = await client.post("/auth/register", json={
+        "username": username,
+        "email": f"{username}@benchmail.lv",
+        "password": PASSWORD
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def login(client: httpx.AsyncClient, username: str) -> dict:
+    response = await client.post(
+        "/auth/login",
+        data={"username": username, "password": PASSWORD}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def prepare(client: httpx.AsyncClient, concurrency: int, seed: int) -> BenchState:
+    """
+    Creates seed users, one login user per worker and an admin.
+    """
+    state = BenchState(uuid.uuid4().hex[:8])
+
+    await seed_users(state.run_id, seed)
+
+    for worker in range(concurrency):
+        username = f"user_{state.run_id}_{worker}"
+        state.usernames.append(username)
+        state.tokens.append(await register(client, username))
+
+    admin_username = f"admin_{state.run_id}"
+    await register(client, admin_username)
+
+    async with async_session() as db:
+        admin = (await db.exec(
+            UserModel.__table__.select().where(UserModel.username == admin_username)
+        )).first()
+        db.add(UserRoleModel(user_id=admin.id, role_id=await get_role_id("admin", db)))
+        await db.commit()
+
+    # Logged in after the role change, so the token carries the admin role
+    state.admin_token = (await login(client, admin_username))["access_token"]
+
+    return state
+
+
+# =========================
+# Scenarios
+# =========================
+def bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def scenario_login(client, state: BenchState, worker: int, i: int) -> int:
+    response = await client.post(
+        "/auth/login",
+        data={"username": state.usernames[worker], "password": PASSWORD}
+    )
+    if response.status_code == 200:
+        state.tokens[worker] = response.json()
+    return response.status_code
+
+
+async def scenario_register(client, state: BenchState, worker: int, i: int) -> int:
+    username = f"reg_{state.run_id}_{worker}_{i}"
+    response = await client.post("/auth/register", json={
+        "username": username,
+        "email": f"{username}@benchmail.lv",
+        "password": PASSWORD
+    })
+    return response.status_code
+
+
+async def scenario_refresh(client, state: BenchState, worker: int, i: int) -> int:
+    response = await client.post(
+        "/token/refresh",
+        headers=bearer(state.tokens[worker]["refresh_token"])
+    )
+    if response.status_code == 200:
+        state.tokens[worker] = response.json()
+    return response.status_code
+
+
+async def scenario_token_check(client, state: BenchState, worker: int, i: int) -> int:
+    response = await client.get(
+        "/token/check",
+        headers=bearer(state.tokens[worker]["access_token"])
+    )
+    return response.status_code
+
+
+async def scenario_users_list(client, state: BenchState, worker: int, i: int) -> int:
+    response = await client.get(
+        "/users/",
+        params={"page": 1, "limit": 20},
+        headers=bearer(state.admin_token)
+    )
+    return response.status_code
+
+
+async def scenario_users_search(client, state: BenchState, worker: int, i: int) -> int:
+    terms = [state.run_id, f"seed_{state.run_id}_{i % 100}", "benchmail.lv"]
+    response = await client.get(
+        f"/users/search/{terms[i % len(terms)]}",
+        params={"page": 1, "limit": 20},
+        headers=bearer(state.admin_token)
+    )
+    return response.status_code
+
+
+SCENARIO_FUNCTIONS = {
+    "login": scenario_login,
+    "register": scenario_register,
+    "refresh": scenario_refresh,
+    "token_check": scenario_token_check,
+    "users_list": scenario_users_list,
+    "users_search": scenario_users_search,
+}
+
+
+# =========================
+# Runner
+# =========================
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    state: BenchState,
+    name: str,
+    requests: int,
+    concurrency: int
+) -> dict:
+    """
+    Sends `requests` requests with `concurrency` workers, returns latency / throughput.
+    """
+    scenario = SCENARIO_FUNCTIONS[name]
+    per_worker = max(1, requests // concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(index: int):
+        nonlocal errors
+
+        for i in range(per_worker):
+            started = time.perf_counter()
+            status = await scenario(client, state, index, i)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+            if status != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+# =========================
+# Baseline
+# =========================
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Returns regressions: p95 above or throughput below the baseline by more than tolerance.
+    """
+    regressions = []
+
+    for name, result in results.items():
+        if result["errors"]:
+            regressions.append(f"{name}: {result['errors']} failed requests")
+
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+
+        if result["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {result['p95_ms']} ms > baseline {base['p95_ms']} ms")
+
+        if result["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['rps']} req/s < baseline {base['rps']} req/s")
+
+    return regressions
+
+
+def print_report(results: dict, baseline: dict | None) -> None:
+    print(f"{'scenario':<14} {'req':>6} {'err':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'base p95':>9}")
+
+    for name, result in results.items():
+        base = (baseline or {}).get("scenarios", {}).get(name)
+        base_p95 = f"{base['p95_ms']:9.2f}" if base else f"{'-':>9}"
+
+        print(
+            f"{name:<14} {result['requests']:6d} {result['errors']:5d} {result['rps']:9.1f} "
+            f"{result['p50_ms']:9.2f} {result['p95_ms']:9.2f} {result['p99_ms']:9.2f} {base_p95}"
+        )
+
+
+# =========================
+# Benchmark entry
+# =========================
+async def main(args) -> int:
+    engine.echo = False
+
+    await init_db()
+
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            state = await prepare(client, args.concurrency, args.seed_users)
+
+            for name in args.scenarios:
+                results[name] = await run_scenario(
+                    client, state, name, args.requests, args.concurrency
+                )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    print(f"database: {engine.dialect.name}, concurrency: {args.concurrency}, requests: {args.requests}")
+    print_report(results, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file:
+            json.dump({
+                "database": engine.dialect.name,
+                "concurrency": args.concurrency,
+                "requests": args.requests,
+                "host": platform.node(),
+                "cpus": os.cpu_count(),
+                "scenarios": results,
+            }, file, indent=4)
+        print(f"Baseline saved: {args.save_baseline}")
+
+    if baseline is None:
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Auth service benchmark suite")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--seed-users", type=int, default=10000, help="Users for listing / search")
+    parser.add_argument("--baseline", help="JSON file to compare with")
+    parser.add_argument("--save-baseline", help="Write results to this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed regression (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    raise SystemExit(asyncio.run(main(args)))
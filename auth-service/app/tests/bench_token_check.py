@@ -0,0 +1,82 @@
+# =========================
+# /token/check vs /token/verify micro-benchmark
+# =========================
+
+# Imports
+# Libraries
+import argparse
+import asyncio
+import time
+import httpx
+# App
+from ..main import app
+from ..services.tokens_management.create_tokens_service import create_access_token
+from ..utils.init_data_base import init_db
+
+
+"""
+Measures requests/sec of the FastAPI /token/check endpoint and the ASGI
+/token/verify fast path, in-process (no network, no gateway cache).
+
+Uses DATABASE_URL / SECRET_KEY / ALGORITHM from the environment:
+
+    python -m app.tests.bench_token_check --requests 5000 --concurrency 50
+"""
+
+
+# =========================
+# Run one endpoint
+# =========================
+async def run_endpoint(
+    client: httpx.AsyncClient,
+    path: str,
+    token: str,
+    requests: int,
+    concurrency: int
+) -> float:
+    """
+    Sends `requests` GET requests with `concurrency` workers, returns requests/sec.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    per_worker = requests // concurrency
+
+    async def worker():
+        for _ in range(per_worker):
+            response = await client.get(path, headers=headers)
+            assert response.status_code in (200, 204), response.status_code
+
+    # Warm up (fills the claims cache for /token/verify)
+    await client.get(path, headers=headers)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return per_worker * concurrency / elapsed
+
+
+# =========================
+# Benchmark entry
+# =========================
+async def main(requests: int, concurrency: int):
+    await init_db()
+
+    token = await create_access_token({"sub": "1"})
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        check_rps = await run_endpoint(client, "/token/check", token, requests, concurrency)
+        verify_rps = await run_endpoint(client, "/token/verify", token, requests, concurrency)
+
+    print(f"/token/check  : {check_rps:10.1f} req/s")
+    print(f"/token/verify : {verify_rps:10.1f} req/s")
+    print(f"speedup       : {verify_rps / check_rps:10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Token check micro-benchmark")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency))
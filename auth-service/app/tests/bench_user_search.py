@@ -0,0 +1,134 @@
+# =========================
+# User search benchmark (PostgreSQL)
+# =========================
+
+# Imports
+# Libraries
+import argparse
+import asyncio
+import statistics
+import time
+from sqlalchemy import or_, text
+from sqlmodel import select
+# App
+from ..dependencies.data_base_connection import async_session, engine
+from ..models import UserModel
+from ..services.read_users.read_user_by_name_or_email_service import get_user_by_username_or_email
+from ..utils.get_users_roles_map import get_users_roles_map
+from ..utils.init_data_base import init_db
+
+
+"""
+Compares the previous search (ILIKE over the whole table, every match loaded into
+Python with its roles, page sliced afterwards) with the trigram-indexed search
+(ranking, pagination and total in SQL, roles for one page).
+
+Seeds --users synthetic rows once (username synth_<n>, email synth_<n>@bench.local)
+with generate_series, so 1M users take seconds. PostgreSQL only:
+
+    python -m app.tests.bench_user_search --users 1000000 --terms 42 4242 synth_99 bench
+"""
+
+
+# =========================
+# Test data
+# =========================
+async def seed_users(users: int) -> None:
+    """
+    Inserts synthetic users up to the requested number and refreshes statistics.
+    """
+    async with engine.begin() as conn:
+        existing = (await conn.execute(
+            text("SELECT count(*) FROM users WHERE username LIKE 'synth\\_%'")
+        )).scalar()
+
+        if existing < users:
+            await conn.execute(
+                text(
+                    "INSERT INTO users (username, email, auth_provider, created_at, active, role_version) "
+                    "SELECT 'synth_' || g, 'synth_' || g || '@bench.local', 'local', now(), true, 0 "
+                    "FROM generate_series(:start, :stop) AS g"
+                ),
+                {"start": existing + 1, "stop": users}
+            )
+
+        await conn.execute(text("ANALYZE users"))
+
+
+# =========================
+# Previous implementation
+# =========================
+async def legacy_search(term: str, page: int, limit: int) -> int:
+    """
+    Search as it was before the trigram index (kept here for comparison).
+    """
+    async with async_session() as db:
+        result = await db.exec(
+            select(UserModel).where(
+                or_(
+                    UserModel.username.ilike(f"%{term}%"),
+                    UserModel.email.ilike(f"%{term}%")
+                )
+            )
+        )
+        users = result.all()
+
+        await get_users_roles_map([user.id for user in users], db)
+
+        offset = (page - 1) * limit
+        return len(users[offset:offset + limit])
+
+
+async def indexed_search(term: str, page: int, limit: int) -> int:
+    async with async_session() as db:
+        result = await get_user_by_username_or_email(term, db, page=page, limit=limit)
+        return len(result.items)
+
+
+# =========================
+# Timing
+# =========================
+async def measure_ms(search, term: str, page: int, limit: int, rounds: int) -> float:
+    """
+    Returns median duration of one search in milliseconds.
+    """
+    samples = []
+
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await search(term, page, limit)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(samples)
+
+
+# =========================
+# Benchmark entry
+# =========================
+async def main(users: int, terms: list[str], page: int, limit: int, rounds: int):
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("This benchmark needs PostgreSQL (pg_trgm)")
+
+    engine.echo = False
+
+    await init_db()
+    await seed_users(users)
+
+    print(f"{'term':<12} {'legacy ms':>12} {'indexed ms':>12} {'speedup':>9}")
+
+    for term in terms:
+        legacy = await measure_ms(legacy_search, term, page, limit, rounds)
+        indexed = await measure_ms(indexed_search, term, page, limit, rounds)
+        print(f"{term:<12} {legacy:12.1f} {indexed:12.1f} {legacy / indexed:8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="User search benchmark")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--terms", nargs="+", default=["42", "4242", "synth_99", "bench"])
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.terms, args.page, args.limit, args.rounds))
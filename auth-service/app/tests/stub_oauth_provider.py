@@ -0,0 +1,143 @@
+# =========================
+# Stub OpenID Connect provider (latency tests)
+# =========================
+
+# Imports
+# Libraries
+from fastapi import FastAPI, Form, Request
+from fastapi.responses import RedirectResponse
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+from urllib.parse import urlencode
+import argparse
+import asyncio
+import json
+import secrets
+import time
+import jwt
+import uvicorn
+
+
+"""
+Local stand-in for Google's OpenID provider: discovery document, authorize redirect,
+code exchange with an RS256 id_token, JWKS. Every endpoint waits --latency-ms to
+simulate the network round trip to the provider, and requests are counted per
+endpoint (GET /stats), so metadata / JWKS caching is visible.
+
+    python -m app.tests.stub_oauth_provider --port 9000 --latency-ms 80
+
+Point the auth service to it with GOOGLE_CONF_URL=http://127.0.0.1:9000/.well-known/openid-configuration.
+/authorize signs in as login_hint (email), or as a new random user without it.
+"""
+
+
+KEY_ID = "stub-key"
+
+_private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+_codes: dict[str, dict] = {}        # authorization code -> id_token claims
+_stats: dict[str, int] = {}         # endpoint -> requests
+_latency_seconds = 0.0
+
+app = FastAPI()
+
+
+async def _hit(endpoint: str) -> None:
+    """
+    Counts request and waits the simulated network latency.
+    """
+    _stats[endpoint] = _stats.get(endpoint, 0) + 1
+
+    if _latency_seconds:
+        await asyncio.sleep(_latency_seconds)
+
+
+# =========================
+# Endpoints
+# =========================
+@app.get("/.well-known/openid-configuration")
+async def discovery(request: Request):
+    await _hit("discovery")
+    issuer = str(request.base_url).rstrip("/")
+
+    return {
+        "issuer": issuer,
+        "authorization_endpoint": f"{issuer}/authorize",
+        "token_endpoint": f"{issuer}/token",
+        "jwks_uri": f"{issuer}/jwks",
+        "id_token_signing_alg_values_supported": ["RS256"],
+    }
+
+
+@app.get("/authorize")
+async def authorize(
+    request: Request,
+    client_id: str,
+    redirect_uri: str,
+    state: str,
+    nonce: str | None = None,
+    login_hint: str | None = None
+):
+    await _hit("authorize")
+
+    email = login_hint or f"stub_{secrets.token_hex(6)}@stub.local"
+    code = secrets.token_urlsafe(16)
+
+    _codes[code] = {
+        "iss": str(request.base_url).rstrip("/"),
+        "aud": client_id,
+        "sub": f"stub-{email}",
+        "email": email,
+        "email_verified": True,
+        "nonce": nonce,
+    }
+
+    query = urlencode({"code": code, "state": state})
+    return RedirectResponse(url=f"{redirect_uri}?{query}", status_code=302)
+
+
+@app.post("/token")
+async def token(code: str = Form(...)):
+    await _hit("token")
+
+    claims = _codes.pop(code)
+    now = int(time.time())
+    claims.update({"iat": now, "exp": now + 3600})
+
+    return {
+        "access_token": secrets.token_urlsafe(24),
+        "token_type": "Bearer",
+        "expires_in": 3600,
+        "id_token": jwt.encode(
+            claims,
+            _private_key,
+            algorithm="RS256",
+            headers={"kid": KEY_ID}
+        ),
+    }
+
+
+@app.get("/jwks")
+async def jwks():
+    await _hit("jwks")
+
+    jwk = json.loads(RSAAlgorithm.to_jwk(_private_key.public_key()))
+    jwk.update({"kid": KEY_ID, "alg": "RS256", "use": "sig"})
+
+    return {"keys": [jwk]}
+
+
+@app.get("/stats")
+async def stats():
+    return _stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub OpenID Connect provider")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay of every response")
+    args = parser.parse_args()
+
+    _latency_seconds = args.latency_ms / 1000
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,116 @@
+# =========================
+# Argon2 cost calibration
+# =========================
+
+# Imports
+# Libraries
+import argparse
+import json
+import os
+import statistics
+import time
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+
+"""
+Benchmarks Argon2 time / memory costs on the current host and writes a target profile.
+
+The chosen profile is the strongest one (largest memory_cost * time_cost) whose median
+hashing time stays under the target. Point PASSWORD_HASH_PROFILE to the written file;
+existing users are rehashed to the new profile on their next login.
+
+Run:
+    python -m app.utils.calibrate_password_hash --target-ms 250 --output password_hash_profile.json
+"""
+
+
+# Memory costs (KiB) tried by default: 19 MiB (OWASP minimum) ... 256 MiB
+DEFAULT_MEMORY_COSTS = [19456, 32768, 65536, 131072, 262144]
+
+
+# =========================
+# Measure one parameter set
+# =========================
+def measure_ms(time_cost: int, memory_cost: int, parallelism: int, rounds: int) -> float:
+    """
+    Returns median hashing time in milliseconds.
+    """
+    hasher = Argon2Hasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism
+    )
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        hasher.hash("calibration-password")
+        samples.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(samples)
+
+
+# =========================
+# Calibrate
+# =========================
+def calibrate(
+    target_ms: float,
+    parallelism: int,
+    memory_costs: list[int],
+    max_time_cost: int,
+    rounds: int
+) -> dict | None:
+    """
+    Tries memory / time cost combinations and returns the strongest one under target_ms.
+    """
+    best = None
+
+    for memory_cost in sorted(memory_costs):
+        for time_cost in range(1, max_time_cost + 1):
+            elapsed = measure_ms(time_cost, memory_cost, parallelism, rounds)
+            print(f"memory_cost={memory_cost:>7} time_cost={time_cost:>2} -> {elapsed:8.1f} ms")
+
+            # Higher time_cost will only be slower
+            if elapsed > target_ms:
+                break
+
+            if best is None or memory_cost * time_cost > best["memory_cost"] * best["time_cost"]:
+                best = {
+                    "time_cost": time_cost,
+                    "memory_cost": memory_cost,
+                    "parallelism": parallelism,
+                    "measured_ms": round(elapsed, 1),
+                    "target_ms": target_ms,
+                }
+
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Argon2 cost calibration")
+    parser.add_argument("--target-ms", type=float, default=250, help="Max hashing time per password")
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument("--memory-costs", type=int, nargs="+", default=DEFAULT_MEMORY_COSTS)
+    parser.add_argument("--max-time-cost", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5, help="Measurements per parameter set")
+    parser.add_argument(
+        "--output",
+        default=os.getenv("PASSWORD_HASH_PROFILE", "password_hash_profile.json")
+    )
+    args = parser.parse_args()
+
+    profile = calibrate(
+        target_ms=args.target_ms,
+        parallelism=args.parallelism,
+        memory_costs=args.memory_costs,
+        max_time_cost=args.max_time_cost,
+        rounds=args.rounds
+    )
+
+    if profile is None:
+        raise SystemExit("No parameter set fits the target, increase --target-ms")
+
+    with open(args.output, "w") as file:
+        json.dump(profile, file, indent=4)
+
+    print(f"Profile written to {args.output}: {profile}")
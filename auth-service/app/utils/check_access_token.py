@@ -5,21 +5,10 @@
 # Imports
 # Libraries
 from fastapi import HTTPException
-from jose import jwt, JWTError, ExpiredSignatureError
-from dotenv import load_dotenv
-import os
-
-
-# =========================
-# Environment setup
-# =========================
-# Read values from .env file into environment
-load_dotenv()
-
-# Secret key used to sign and verify JWT tokens
-SECRET_KEY = os.getenv("SECRET_KEY")
-# Algorithm used for JWT encoding/decoding (e.g. HS256)
-ALGORITHM = os.getenv("ALGORITHM")
+import jwt
+# Utils
+from .revocation_list import is_token_revoked
+from .signing_keys import decode_token
 
 
 # =========================
@@ -33,32 +22,48 @@ async def check_access_token(access_token: str) -> int:
     :return: user_id extracted from token payload
     :raises HTTPException: if token is expired or invalid
     """
+    payload = await decode_access_token(access_token)
 
-    try:
-        # Decode JWT token using secret key and algorithm
-        payload = jwt.decode(
-            access_token, 
-            SECRET_KEY, 
-            algorithms=[ALGORITHM]
-        )
+    # Get user ID from token payload ("sub" = subject)
+    return int(payload.get("sub"))
 
-        # Get user ID from token payload ("sub" = subject)
-        user_id = payload.get("sub")
 
+# =========================
+# Access token decoding
+# =========================
+async def decode_access_token(access_token: str) -> dict:
+    """
+    Validates JWT access token and returns its payload.
 
-        return int(user_id)
+    :param access_token: JWT access token string
+    :return: token payload ("sub", "roles", "role_version", "exp")
+    :raises HTTPException: if token is expired or invalid
+    """
+
+    try:
+        # Verify signature (current or previous key by "kid") and expiry
+        payload = decode_token(access_token)
         
 
     # Token is valid but expired
-    except ExpiredSignatureError:
+    except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=401,
             detail="Token has expired",
         )
     
     # Token is invalid (wrong signature, wrong format, etc.)
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=401,
             detail="Could not validate credentials",
-        )
\ No newline at end of file
+        )
+
+    # User deactivated or session ended (logout / refresh)
+    if is_token_revoked(payload):
+        raise HTTPException(
+            status_code=401,
+            detail="Token has been revoked",
+        )
+
+    return payload
\ No newline at end of file
@@ -5,12 +5,11 @@
 # Imports
 # Libraries
 from fastapi import HTTPException, status
-from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 # Utils
-from .check_access_token import check_access_token
-# Models
-from ..models import RoleModel, UserRoleModel
+from .check_access_token import decode_access_token
+from .roles_cache import get_user_role_names
+from .role_versions import is_role_version_current
 
 
 # =========================
@@ -24,33 +23,23 @@ async def check_admin_role(access_token: str, db: AsyncSession) -> str:
     """
 
     # Validate token
-    user_id = await check_access_token(access_token)
+    payload = await decode_access_token(access_token)
+    user_id = int(payload.get("sub"))
 
-    # Get all user roles (ASYNC -> MUST await)
-    result = await db.exec(
-        select(UserRoleModel).where(UserRoleModel.user_id == user_id)
-    )
-
-    user_roles = result.all()
-
-    # If no roles -> deny
-    if not user_roles:
+    # Token issued before the last role change -> client must refresh it
+    if not is_role_version_current(payload):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin privileges required"
-        )
-
-    # Check if any role is admin
-    for user_role in user_roles:
-
-        role_result = await db.exec(
-            select(RoleModel).where(RoleModel.id == user_role.role_id)
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Roles changed, refresh token"
         )
 
-        role = role_result.first()
+    # Role names from token claims, older tokens fall back to the roles cache
+    role_names = payload.get("roles")
+    if role_names is None:
+        role_names = await get_user_role_names(user_id, db)
 
-        if role and role.name == "admin":
-            return user_id
+    if "admin" in role_names:
+        return user_id
 
     # No admin found
     raise HTTPException(
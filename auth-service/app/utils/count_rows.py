@@ -0,0 +1,46 @@
+# =========================
+# Table row counts
+# =========================
+
+# Imports
+# Libraries
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import func, text
+
+
+# =========================
+# Exact count
+# =========================
+async def count_rows_exact(model, db: AsyncSession) -> int:
+    """
+    Returns exact number of rows (full scan on large tables).
+    """
+    result = await db.exec(select(func.count()).select_from(model))
+
+    return result.one()
+
+
+# =========================
+# Estimated count
+# =========================
+async def count_rows_estimate(model, db: AsyncSession) -> tuple[int, bool]:
+    """
+    Returns (row count, is_estimate).
+
+    On PostgreSQL the planner statistics (pg_class.reltuples) are read, which costs
+    the same for any table size. Other databases, and tables never analyzed,
+    fall back to the exact count.
+    """
+    if db.bind.dialect.name == "postgresql":
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+            .bindparams(table=model.__tablename__)
+        )
+        estimate = result.scalar()
+
+        # -1 -> table was never vacuumed / analyzed
+        if estimate is not None and estimate >= 0:
+            return estimate, True
+
+    return await count_rows_exact(model, db), False
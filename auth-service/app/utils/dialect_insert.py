@@ -0,0 +1,22 @@
+# =========================
+# Dialect specific INSERT
+# =========================
+
+# Imports
+# Libraries
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+# =========================
+# INSERT with ON CONFLICT support
+# =========================
+def dialect_insert(db: AsyncSession):
+    """
+    Returns insert() of the session's database (PostgreSQL or SQLite),
+    which supports on_conflict_do_nothing().
+    """
+    if db.bind.dialect.name == "postgresql":
+        return postgresql.insert
+
+    return sqlite.insert
@@ -0,0 +1,61 @@
+# =========================
+# JWT signing key generator
+# =========================
+
+# Imports
+# Libraries
+import argparse
+import json
+import os
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+# Utils
+from .signing_keys import public_jwk
+
+
+"""
+Generates a private key for access token signing and its public key.
+
+Run:
+    python -m app.utils.generate_signing_key --algorithm EdDSA --output keys/jwt_signing_key.pem
+
+Then set ALGORITHM=EdDSA and JWT_PRIVATE_KEY_FILE=keys/jwt_signing_key.pem.
+The public key (.pub.pem) is what JWT_PREVIOUS_PUBLIC_KEY_FILES needs after a rotation.
+"""
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JWT signing key generator")
+    parser.add_argument("--algorithm", choices=["EdDSA", "RS256"], default="EdDSA")
+    parser.add_argument("--output", default="jwt_signing_key.pem")
+    args = parser.parse_args()
+
+    if args.algorithm == "EdDSA":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+
+    public_path = os.path.splitext(args.output)[0] + ".pub.pem"
+
+    # Private key readable by owner only
+    with open(os.open(args.output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as file:
+        file.write(private_pem)
+
+    with open(public_path, "wb") as file:
+        file.write(public_pem)
+
+    jwk = public_jwk(private_key.public_key())
+    print(f"Private key: {args.output}")
+    print(f"Public key : {public_path}")
+    print(f"Key ID     : {jwk['kid']}")
+    print(json.dumps(jwk, indent=4))
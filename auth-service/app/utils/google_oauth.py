@@ -0,0 +1,73 @@
+# =========================
+# Google OAuth client (lazy)
+# =========================
+
+# Imports
+# Libraries
+from dotenv import load_dotenv
+import time
+import os
+
+
+"""
+authlib (and the HTTP client stack under it) is imported on the first Google login,
+not when a worker starts. Workers that never serve Google logins never load it.
+
+Provider metadata (discovery document) and signing keys (JWKS) are cached in the
+client by authlib. Here they are expired every GOOGLE_METADATA_TTL seconds, so key
+rotation at the provider is picked up; between refreshes a login makes no metadata
+or JWKS request (authlib also refetches the JWKS once on an unknown key).
+
+GOOGLE_CONF_URL points the client to another OpenID provider
+(app/tests/stub_oauth_provider.py for latency tests).
+"""
+
+
+# =========================
+# Load environment variables
+# =========================
+load_dotenv()
+
+CONF_URL = os.getenv(
+    "GOOGLE_CONF_URL",
+    "https://accounts.google.com/.well-known/openid-configuration"
+)
+GOOGLE_METADATA_TTL = float(os.getenv("GOOGLE_METADATA_TTL", "3600"))
+
+_oauth = None
+_metadata_expires_at = 0.0
+
+
+# =========================
+# Client
+# =========================
+def get_google_oauth():
+    """
+    Returns authlib OAuth registry with the "google" client (created once).
+    """
+    global _oauth, _metadata_expires_at
+
+    if _oauth is None:
+        from authlib.integrations.starlette_client import OAuth
+
+        oauth = OAuth()
+        oauth.register(
+            name="google",
+            client_id=os.getenv("GOOGLE_CLIENT_ID"),
+            client_secret=os.getenv("GOOGLE_CLIENT_SECRET"),
+            server_metadata_url=CONF_URL,
+            client_kwargs={
+                "scope": "openid email profile",
+            },
+        )
+        _oauth = oauth
+
+    now = time.monotonic()
+
+    if now >= _metadata_expires_at:
+        # authlib reloads metadata without "_loaded_at" and the JWKS without "jwks"
+        _oauth.google.server_metadata.pop("_loaded_at", None)
+        _oauth.google.server_metadata.pop("jwks", None)
+        _metadata_expires_at = now + GOOGLE_METADATA_TTL
+
+    return _oauth
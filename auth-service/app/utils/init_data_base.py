@@ -4,42 +4,152 @@
 
 # Imports
 # Libraries
-from sqlmodel import SQLModel
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
 from dotenv import load_dotenv
+import asyncio
 import os
-# Import models so metadata registers them
-from ..models import RoleModel, TokenModel, UserModel, UserRoleModel
+# Models (imported so metadata registers every table)
+from ..models import SchemaVersionModel
+# Database engine shared with the app
+from ..dependencies.data_base_connection import engine
+# Migrations
+from ..utils.schema_migrations import MIGRATIONS, SCHEMA_VERSION
 # Default roles
 from ..utils.init_data_base_roles import init_roles
 
 
+"""
+Schema setup runs once per deploy, not on every worker start:
+
+    python -m app.utils.init_data_base
+
+creates a new database (tables, indexes, default roles) or applies pending migrations.
+Workers only check the schema_version row on startup (check_db_schema).
+DATABASE_AUTO_MIGRATE=true runs the setup on startup instead (local development).
+"""
+
+
 # =========================
 # Load environment variables
 # =========================
 load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
+
+DATABASE_AUTO_MIGRATE = os.getenv("DATABASE_AUTO_MIGRATE", "false").lower() == "true"
+
+# Serializes concurrent migrations (several containers starting at once), PostgreSQL only
+MIGRATION_LOCK_ID = 4242_0017
 
 
 # =========================
-# Async engine
+# Migrate
 # =========================
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,
-)
+def _current_version(conn) -> int | None:
+    """
+    Returns applied version, 0 for a database older than schema_version,
+    None for an empty database.
+    """
+    tables = inspect(conn).get_table_names()
+
+    if "schema_version" in tables:
+        version = conn.execute(
+            select(SchemaVersionModel.version).where(SchemaVersionModel.id == 1)
+        ).scalar()
+
+        if version is not None:
+            return version
+
+    return 0 if "users" in tables else None
+
+
+def _migrate(conn) -> tuple[int | None, int]:
+    """
+    Creates or upgrades schema in one transaction. Returns (previous, new) version.
+    """
+    version = _current_version(conn)
+    # Never stamp a lower version (database already migrated by newer code)
+    new_version = max(version or 0, SCHEMA_VERSION)
+
+    if version is None:
+        # New database: current models are the latest schema
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        SQLModel.metadata.create_all(conn)
+    else:
+        SQLModel.metadata.create_all(conn, tables=[SchemaVersionModel.__table__])
+
+        for migration in MIGRATIONS[version:]:
+            migration(conn)
+
+    conn.execute(SchemaVersionModel.__table__.delete())
+    conn.execute(
+        SchemaVersionModel.__table__.insert().values(id=1, version=new_version)
+    )
+
+    return version, new_version
+
+
+async def init_db(db_engine: AsyncEngine = engine) -> tuple[int | None, int]:
+    """
+    Creates tables or applies pending migrations, then default roles.
+    Returns (previous, new) schema version (previous None = new database).
+    """
+    async with db_engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(:lock_id)"),
+                {"lock_id": MIGRATION_LOCK_ID}
+            )
+
+        versions = await conn.run_sync(_migrate)
+
+    await init_roles(db_engine)
+
+    return versions
 
 
 # =========================
-# Initialize database
+# Startup check
 # =========================
-async def init_db():
+async def check_db_schema(db_engine: AsyncEngine = engine) -> None:
     """
-    Creates tables asynchronously and initializes default data.
+    One query on worker startup: fails fast if migrations were not applied.
     """
+    if DATABASE_AUTO_MIGRATE:
+        await init_db(db_engine)
+        return
+
+    try:
+        async with db_engine.connect() as conn:
+            result = await conn.execute(
+                select(SchemaVersionModel.version).where(SchemaVersionModel.id == 1)
+            )
+            version = result.scalar()
+    except DBAPIError:
+        version = None      # No schema_version table yet
+
+    if version is None or version < SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema version is {version}, expected {SCHEMA_VERSION}: "
+            "run python -m app.utils.init_data_base"
+        )
+
+
+async def main():
+    try:
+        return await init_db()
+    finally:
+        await engine.dispose()
+
 
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+if __name__ == "__main__":
+    previous, current = asyncio.run(main())
 
-    # Initialize roles AFTER tables are created
-    await init_roles(engine)
\ No newline at end of file
+    if previous is None:
+        print(f"Database created at schema version {current}")
+    elif previous == current:
+        print(f"Database schema is up to date (version {current})")
+    else:
+        print(f"Database schema migrated from version {previous} to {current}")
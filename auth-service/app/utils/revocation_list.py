@@ -0,0 +1,217 @@
+# =========================
+# Access token revocation list
+# =========================
+
+# Imports
+# Libraries
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from dotenv import load_dotenv
+from datetime import timedelta, timezone
+import asyncio
+import logging
+import time
+import os
+# Models
+from ..models import RevocationModel
+# Utils
+from .current_date import get_current_date
+
+
+"""
+Deny set for access tokens that must stop working before their "exp".
+
+- Users: deactivated users (every token of the user is rejected)
+- Sessions: "sid" claim of access tokens whose refresh token was used or logged out
+
+An entry is only needed while tokens issued before the revocation can still be valid,
+so each entry expires ACCESS_TOKEN_EXPIRE_MINUTES after it was added.
+Lookups are two dict reads, cheap enough for every request.
+
+The set is kept in memory of each worker. Revocations are also added to the
+revocations table in the caller's transaction; every REVOCATION_SYNC_SECONDS each
+worker loads the rows created since its previous load, so other workers reject
+revoked tokens after at most that long.
+"""
+
+
+# =========================
+# Load environment variables
+# =========================
+load_dotenv()
+
+ACCESS_TOKEN_TTL_SECONDS = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15")) * 60
+REVOCATION_SYNC_SECONDS = float(os.getenv("REVOCATION_SYNC_SECONDS", "2"))
+
+USER = "user"
+RESTORE = "restore"
+SESSION = "session"
+
+logger = logging.getLogger(__name__)
+
+
+# =========================
+# Deny set state
+# =========================
+_revoked_users: dict[int, float] = {}       # user id -> entry expires at
+_revoked_sessions: dict[int, float] = {}    # session id -> entry expires at
+_next_purge = 0.0
+_last_load: float | None = None             # monotonic time of the previous load
+
+
+def _purge(now: float) -> None:
+    """
+    Drops expired entries (at most once per minute).
+    """
+    global _next_purge
+
+    if now < _next_purge:
+        return
+
+    _next_purge = now + 60
+
+    for entries in (_revoked_users, _revoked_sessions):
+        for key in [key for key, expires_at in entries.items() if expires_at <= now]:
+            del entries[key]
+
+
+# =========================
+# Populate (in memory)
+# =========================
+def _as_list(ids: list[int] | int) -> list[int]:
+    return [ids] if isinstance(ids, int) else list(ids)
+
+
+def _apply(kind: str, subject_id: int, revoked_at: float) -> None:
+    """
+    Applies one revocation made at revoked_at (epoch seconds).
+    """
+    expires_at = revoked_at + ACCESS_TOKEN_TTL_SECONDS
+
+    if kind == SESSION:
+        _revoked_sessions[subject_id] = max(_revoked_sessions.get(subject_id, 0.0), expires_at)
+
+    elif kind == USER:
+        _revoked_users[subject_id] = max(_revoked_users.get(subject_id, 0.0), expires_at)
+
+    # Activation only cancels deactivations made before it
+    elif _revoked_users.get(subject_id, 0.0) <= expires_at:
+        _revoked_users.pop(subject_id, None)
+
+
+def _record(kind: str, ids: list[int] | int, db: AsyncSession | None) -> None:
+    """
+    Applies revocations in this worker and adds them to db (caller commits).
+    """
+    now = time.time()
+    _purge(now)
+
+    ids = _as_list(ids)
+
+    for subject_id in ids:
+        _apply(kind, subject_id, now)
+
+    if db is not None:
+        created_at = get_current_date()
+        db.add_all(
+            RevocationModel(kind=kind, subject_id=subject_id, created_at=created_at)
+            for subject_id in ids
+        )
+
+
+def revoke_users(user_ids: list[int] | int, db: AsyncSession | None = None) -> None:
+    """
+    Rejects all current access tokens of given users.
+    With db, other workers get the revocation after the caller commits.
+    """
+    _record(USER, user_ids, db)
+
+
+def restore_users(user_ids: list[int] | int, db: AsyncSession | None = None) -> None:
+    """
+    Removes users from the deny set (user was activated again).
+    """
+    _record(RESTORE, user_ids, db)
+
+
+def revoke_session(session_ids: list[int] | int, db: AsyncSession | None = None) -> None:
+    """
+    Rejects access tokens issued together with the given refresh token(s).
+    """
+    _record(SESSION, session_ids, db)
+
+
+# =========================
+# Lookup
+# =========================
+def is_revoked(user_id: int, session_id: int | None) -> bool:
+    """
+    Checks user and session of a token against the deny set.
+    """
+    now = time.time()
+
+    expires_at = _revoked_users.get(user_id)
+    if expires_at is not None and expires_at > now:
+        return True
+
+    if session_id is not None:
+        expires_at = _revoked_sessions.get(session_id)
+        if expires_at is not None and expires_at > now:
+            return True
+
+    return False
+
+
+def is_token_revoked(payload: dict) -> bool:
+    """
+    Checks decoded access token payload ("sub", optional "sid").
+    """
+    return is_revoked(int(payload["sub"]), payload.get("sid"))
+
+
+
+# =========================
+# Sync between workers
+# =========================
+async def load_revocations(db: AsyncSession) -> None:
+    """
+    Loads revocations created since the previous load (first load: within the token lifetime).
+
+    The window starts one sync interval before the previous load, so rows committed
+    while it ran (timestamp taken before commit) are not missed. Rows are applied in
+    creation order: a later activation cancels an earlier deactivation.
+    """
+    global _last_load
+
+    started = time.monotonic()
+    window = ACCESS_TOKEN_TTL_SECONDS
+
+    if _last_load is not None:
+        window = min(window, started - _last_load + REVOCATION_SYNC_SECONDS)
+
+    result = await db.exec(
+        select(RevocationModel.kind, RevocationModel.subject_id, RevocationModel.created_at)
+        .where(RevocationModel.created_at > get_current_date() - timedelta(seconds=window))
+        .order_by(RevocationModel.created_at, RevocationModel.id)
+    )
+
+    _purge(time.time())
+
+    for kind, subject_id, created_at in result.all():
+        _apply(kind, subject_id, created_at.replace(tzinfo=timezone.utc).timestamp())
+
+    _last_load = started
+
+
+async def sync_revocations_forever(session_factory) -> None:
+    """
+    Background task: loads revocations of other workers on an interval.
+    """
+    while True:
+        await asyncio.sleep(REVOCATION_SYNC_SECONDS)
+
+        try:
+            async with session_factory() as db:
+                await load_revocations(db)
+        except Exception:
+            logger.exception("Revocation list sync failed")
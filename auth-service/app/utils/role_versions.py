@@ -0,0 +1,156 @@
+# =========================
+# Role versions (in-process)
+# =========================
+
+# Imports
+# Libraries
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import update
+from dotenv import load_dotenv
+from datetime import timedelta
+import asyncio
+import logging
+import time
+import os
+# Models
+from ..models import UserModel
+# Utils
+from .current_date import get_current_date
+
+
+"""
+Small in-memory map user_id -> role_version used to reject access tokens
+issued before the user's last role change (token "role_version" claim is lower).
+
+Only versions changed within the access token lifetime matter: tokens issued before
+an older change have expired. The map is loaded at startup (changes of the last
+ACCESS_TOKEN_EXPIRE_MINUTES), updated by role management services in this worker and
+refreshed every ROLE_VERSIONS_REFRESH_SECONDS with the changes since the previous load
+(users.role_changed_at, indexed). Entries older than the token lifetime are dropped.
+"""
+
+
+# =========================
+# Load environment variables
+# =========================
+load_dotenv()
+
+ROLE_VERSIONS_REFRESH_SECONDS = float(os.getenv("ROLE_VERSIONS_REFRESH_SECONDS", "30"))
+ACCESS_TOKEN_TTL_SECONDS = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15")) * 60
+
+logger = logging.getLogger(__name__)
+
+_role_versions: dict[int, int] = {}
+_stored_at: dict[int, float] = {}       # user_id -> monotonic time the version was stored
+_last_load: float | None = None         # monotonic time of the previous load
+
+
+# =========================
+# Read / update
+# =========================
+def get_role_version(user_id: int) -> int:
+    """
+    Returns current role version of a user (0 if roles were never changed).
+    """
+    return _role_versions.get(user_id, 0)
+
+
+def set_role_versions(versions: dict[int, int]) -> None:
+    """
+    Stores new role versions (never moves a version back).
+    """
+    now = time.monotonic()
+
+    for user_id, version in versions.items():
+        if version > _role_versions.get(user_id, 0):
+            _role_versions[user_id] = version
+            _stored_at[user_id] = now
+
+
+def _drop_expired_versions() -> None:
+    """
+    Drops versions stored longer than the access token lifetime ago.
+    """
+    limit = time.monotonic() - ACCESS_TOKEN_TTL_SECONDS - ROLE_VERSIONS_REFRESH_SECONDS
+
+    for user_id in [user_id for user_id, stored in _stored_at.items() if stored < limit]:
+        del _stored_at[user_id]
+        _role_versions.pop(user_id, None)
+
+
+def is_role_version_current(payload: dict) -> bool:
+    """
+    Checks access token payload against the version map.
+    Tokens without "role_version" claim (issued before roles were embedded) are accepted.
+    """
+    token_version = payload.get("role_version")
+
+    if token_version is None:
+        return True
+
+    return token_version >= _role_versions.get(int(payload["sub"]), 0)
+
+
+# =========================
+# Database operations
+# =========================
+async def bump_role_versions(
+    user_ids: list[int],
+    db: AsyncSession
+) -> dict[int, int]:
+    """
+    Increments role_version of given users (caller commits).
+    Returns new versions.
+    """
+    result = await db.exec(
+        update(UserModel)
+        .where(UserModel.id.in_(user_ids))
+        .values(
+            role_version=UserModel.role_version + 1,
+            role_changed_at=get_current_date()
+        )
+        .returning(UserModel.id, UserModel.role_version)
+    )
+
+    return {user_id: version for user_id, version in result.all()}
+
+
+async def load_role_versions(db: AsyncSession) -> None:
+    """
+    Loads versions changed since the previous load (first load: within the token lifetime).
+
+    The window starts one refresh interval before the previous load, so changes
+    committed while it ran (timestamp taken before commit) are not missed.
+    """
+    global _last_load
+
+    started = time.monotonic()
+    window = ACCESS_TOKEN_TTL_SECONDS
+
+    if _last_load is not None:
+        window = min(window, started - _last_load + ROLE_VERSIONS_REFRESH_SECONDS)
+
+    result = await db.exec(
+        select(UserModel.id, UserModel.role_version)
+        .where(UserModel.role_changed_at > get_current_date() - timedelta(seconds=window))
+    )
+
+    set_role_versions({user_id: version for user_id, version in result.all()})
+    _drop_expired_versions()
+
+    _last_load = started
+
+
+async def refresh_role_versions_forever(session_factory) -> None:
+    """
+    Background task: reloads the version map on an interval.
+    """
+    while True:
+        await asyncio.sleep(ROLE_VERSIONS_REFRESH_SECONDS)
+
+        try:
+            async with session_factory() as db:
+                await load_role_versions(db)
+        except Exception:
+            logger.exception("Role versions refresh failed")
@@ -0,0 +1,144 @@
+# =========================
+# Roles cache (in-process)
+# =========================
+
+# Imports
+# Libraries
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from dotenv import load_dotenv
+import time
+import os
+# Models
+from ..models import RoleModel, UserRoleModel
+
+
+"""
+In-process caches for authorization checks.
+
+- Role catalog: id <-> name of every role, loaded once at startup
+  (the roles table is small and only changes through init_roles)
+- User roles: user_id -> role names, kept for USER_ROLES_CACHE_TTL seconds and
+  invalidated by the role management services
+
+Each worker process has its own cache, so role changes made through another worker
+become visible here after at most USER_ROLES_CACHE_TTL seconds.
+"""
+
+
+# =========================
+# Load environment variables
+# =========================
+load_dotenv()
+
+USER_ROLES_CACHE_TTL = float(os.getenv("USER_ROLES_CACHE_TTL", "60"))
+USER_ROLES_CACHE_SIZE = int(os.getenv("USER_ROLES_CACHE_SIZE", "10000"))
+
+
+# =========================
+# Cache state
+# =========================
+_role_names: dict[int, str] = {}        # role id -> role name
+_role_ids: dict[str, int] = {}          # role name -> role id
+_user_roles: dict[int, tuple[float, list[str]]] = {}   # user id -> (expires at, role names)
+_stats = {"hits": 0, "misses": 0}
+
+
+# =========================
+# Role catalog
+# =========================
+async def load_role_catalog(db: AsyncSession) -> None:
+    """
+    Loads all roles into memory (called on startup).
+    """
+    result = await db.exec(select(RoleModel))
+    roles = result.all()
+
+    _role_names.clear()
+    _role_ids.clear()
+
+    for role in roles:
+        _role_names[role.id] = role.name
+        _role_ids[role.name] = role.id
+
+
+async def get_role_id(role_name: str, db: AsyncSession) -> int | None:
+    """
+    Returns role ID by name, reloads catalog once if role is unknown.
+    """
+    if role_name not in _role_ids:
+        await load_role_catalog(db)
+
+    return _role_ids.get(role_name)
+
+
+async def get_role_name(role_id: int, db: AsyncSession) -> str | None:
+    """
+    Returns role name by ID, reloads catalog once if role is unknown.
+    """
+    if role_id not in _role_names:
+        await load_role_catalog(db)
+
+    return _role_names.get(role_id)
+
+
+# =========================
+# User roles
+# =========================
+async def get_user_role_names(user_id: int, db: AsyncSession) -> list[str]:
+    """
+    Returns role names of a user.
+    Common case (cached user) costs zero database round trips.
+    """
+    cached = _user_roles.get(user_id)
+
+    if cached and cached[0] > time.monotonic():
+        _stats["hits"] += 1
+        return cached[1]
+
+    _stats["misses"] += 1
+
+    # One query: role IDs of the user, names come from the catalog
+    result = await db.exec(
+        select(UserRoleModel.role_id).where(UserRoleModel.user_id == user_id)
+    )
+    role_ids = result.all()
+
+    if any(role_id not in _role_names for role_id in role_ids):
+        await load_role_catalog(db)
+
+    role_names = [_role_names[role_id] for role_id in role_ids if role_id in _role_names]
+
+    # Keep cache bounded: drop oldest entries first
+    while len(_user_roles) >= USER_ROLES_CACHE_SIZE:
+        del _user_roles[next(iter(_user_roles))]
+
+    _user_roles[user_id] = (time.monotonic() + USER_ROLES_CACHE_TTL, role_names)
+
+    return role_names
+
+
+def invalidate_user_roles(user_ids: list[int] | int) -> None:
+    """
+    Removes cached roles of given users (call after role changes).
+    """
+    if isinstance(user_ids, int):
+        user_ids = [user_ids]
+
+    for user_id in user_ids:
+        _user_roles.pop(user_id, None)
+
+
+def get_roles_cache_stats() -> dict:
+    """
+    Returns cache hits, misses and hit ratio.
+    """
+    total = _stats["hits"] + _stats["misses"]
+
+    return {
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "hit_ratio": round(_stats["hits"] / total, 4) if total else 0.0,
+        "cached_users": len(_user_roles),
+        "roles": len(_role_names),
+    }
@@ -0,0 +1,166 @@
+# =========================
+# Schema migrations
+# =========================
+
+# Imports
+# Libraries
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+# Models
+from ..models import RevocationModel, TokenModel, UserModel, UserRoleModel
+# Utils
+from .current_date import get_current_date
+
+
+"""
+Versioned upgrades of databases created before the schema_version table existed.
+
+New databases are created from the models (create_all) and stamped with the latest
+version directly. Each migration checks what exists first, so it is safe on databases
+where the statement was already applied by hand (README ALTERs).
+
+To change the schema: change the model, append a migration, never edit an applied one.
+"""
+
+
+# =========================
+# Helpers
+# =========================
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return column in {c["name"] for c in inspect(conn).get_columns(table)}
+
+
+def _create_index(conn: Connection, table, name: str) -> None:
+    """
+    Creates index declared on the model if it does not exist yet.
+    """
+    index = next(index for index in table.indexes if index.name == name)
+    index.create(conn, checkfirst=True)
+
+
+# =========================
+# Migrations
+# =========================
+def add_role_version(conn: Connection) -> None:
+    if not _has_column(conn, "users", "role_version"):
+        conn.execute(text(
+            "ALTER TABLE users ADD COLUMN role_version INTEGER NOT NULL DEFAULT 0"
+        ))
+
+
+def hash_refresh_tokens(conn: Connection) -> None:
+    # Plain tokens cannot be converted to hashes: users log in again
+    if _has_column(conn, "tokens", "token_hash"):
+        return
+
+    conn.execute(text("DELETE FROM tokens"))
+    conn.execute(text("ALTER TABLE tokens DROP COLUMN refresh_token"))
+    conn.execute(text("ALTER TABLE tokens ADD COLUMN token_hash VARCHAR(64) NOT NULL"))
+    _create_index(conn, TokenModel.__table__, "ix_tokens_token_hash")
+
+
+def index_tokens_expires_at(conn: Connection) -> None:
+    _create_index(conn, TokenModel.__table__, "ix_tokens_expires_at")
+
+
+def index_users_created_at(conn: Connection) -> None:
+    _create_index(conn, UserModel.__table__, "ix_users_created_at_id")
+
+
+def index_users_trigram(conn: Connection) -> None:
+    if conn.dialect.name != "postgresql":
+        return
+
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    _create_index(conn, UserModel.__table__, "ix_users_username_trgm")
+    _create_index(conn, UserModel.__table__, "ix_users_email_trgm")
+
+
+def index_user_roles_role_id(conn: Connection) -> None:
+    _create_index(conn, UserRoleModel.__table__, "ix_user_roles_role_id_user_id")
+
+
+def add_role_changed_at(conn: Connection) -> None:
+    if not _has_column(conn, "users", "role_changed_at"):
+        conn.execute(text("ALTER TABLE users ADD COLUMN role_changed_at TIMESTAMP"))
+        # Unknown change time: treat as changed now, loaded until access tokens expire
+        conn.execute(
+            text("UPDATE users SET role_changed_at = :now WHERE role_version > 0"),
+            {"now": get_current_date()}
+        )
+
+    _create_index(conn, UserModel.__table__, "ix_users_role_changed_at")
+
+
+def create_revocations(conn: Connection) -> None:
+    RevocationModel.__table__.create(conn, checkfirst=True)
+
+
+def sqlite_tokens_autoincrement(conn: Connection) -> None:
+    # Token IDs are session IDs ("sid") in the revocation list. PostgreSQL sequences
+    # never reuse them; a SQLite table without AUTOINCREMENT reuses the highest
+    # deleted ID, so a new session could match a revoked one. Rebuild the table.
+    if conn.dialect.name != "sqlite":
+        return
+
+    sql = conn.execute(text(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'tokens'"
+    )).scalar()
+
+    if "AUTOINCREMENT" in sql.upper():
+        return
+
+    # Table as of schema version 9 (never the live model: later migrations change it)
+    columns = "id, user_id, token_hash, expires_at, created_at"
+
+    for index in inspect(conn).get_indexes("tokens"):
+        conn.execute(text(f'DROP INDEX "{index["name"]}"'))
+
+    conn.execute(text("ALTER TABLE tokens RENAME TO tokens_old"))
+    conn.execute(text(
+        "CREATE TABLE tokens ("
+        " id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,"
+        " user_id INTEGER NOT NULL,"
+        " token_hash VARCHAR(64) NOT NULL,"
+        " expires_at DATETIME NOT NULL,"
+        " created_at DATETIME NOT NULL,"
+        " FOREIGN KEY(user_id) REFERENCES users (id)"
+        ")"
+    ))
+    conn.execute(text("CREATE UNIQUE INDEX ix_tokens_token_hash ON tokens (token_hash)"))
+    conn.execute(text("CREATE INDEX ix_tokens_expires_at ON tokens (expires_at)"))
+    conn.execute(text(f"INSERT INTO tokens ({columns}) SELECT {columns} FROM tokens_old"))
+    conn.execute(text("DROP TABLE tokens_old"))
+
+    # Continue after every ID already used (revoked sessions included)
+    last_id = conn.execute(text(
+        "SELECT max(coalesce((SELECT max(id) FROM tokens), 0),"
+        " coalesce((SELECT max(subject_id) FROM revocations WHERE kind = 'session'), 0))"
+    )).scalar()
+
+    conn.execute(text("DELETE FROM sqlite_sequence WHERE name = 'tokens'"))
+    conn.execute(
+        text("INSERT INTO sqlite_sequence (name, seq) VALUES ('tokens', :seq)"),
+        {"seq": last_id}
+    )
+
+
+def index_tokens_user_id_created_at(conn: Connection) -> None:
+    _create_index(conn, TokenModel.__table__, "ix_tokens_user_id_created_at")
+
+
+# Version N = first N migrations applied (append only)
+MIGRATIONS = [
+    add_role_version,                   # 1
+    hash_refresh_tokens,                # 2
+    index_tokens_expires_at,            # 3
+    index_users_created_at,             # 4
+    index_users_trigram,                # 5
+    index_user_roles_role_id,           # 6
+    add_role_changed_at,                # 7
+    create_revocations,                 # 8
+    sqlite_tokens_autoincrement,        # 9
+    index_tokens_user_id_created_at,    # 10
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
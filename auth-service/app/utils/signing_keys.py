@@ -0,0 +1,159 @@
+# =========================
+# JWT signing keys
+# =========================
+
+# Imports
+# Libraries
+import jwt
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from dotenv import load_dotenv
+import base64
+import hashlib
+import json
+import os
+
+
+"""
+Access token signing and verification.
+
+- ALGORITHM=EdDSA or RS256: tokens are signed with the private key from
+  JWT_PRIVATE_KEY_FILE and carry its key ID ("kid" header). Public keys are
+  published as JWKS (GET /.well-known/jwks.json), so other services verify tokens
+  locally without holding any secret.
+- ALGORITHM=HS256 (legacy): tokens are signed with the shared SECRET_KEY, JWKS is empty.
+
+Key rotation: generate a new key, point JWT_PRIVATE_KEY_FILE to it and list the old
+key in JWT_PREVIOUS_PUBLIC_KEY_FILES until tokens signed with it have expired.
+"""
+
+
+# =========================
+# Load environment variables
+# =========================
+load_dotenv()
+
+SECRET_KEY = os.getenv("SECRET_KEY")
+ALGORITHM = os.getenv("ALGORITHM", "HS256")
+# PEM private key (Ed25519 for EdDSA, RSA for RS256)
+JWT_PRIVATE_KEY_FILE = os.getenv("JWT_PRIVATE_KEY_FILE")
+# Comma separated PEM public keys of previous signing keys (still accepted and published)
+JWT_PREVIOUS_PUBLIC_KEY_FILES = os.getenv("JWT_PREVIOUS_PUBLIC_KEY_FILES", "")
+
+ASYMMETRIC_ALGORITHMS = ("EdDSA", "RS256")
+
+
+# =========================
+# Key helpers
+# =========================
+def public_jwk(public_key) -> dict:
+    """
+    Returns public key as JWK (with "kid", "alg", "use").
+    """
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        jwk = json.loads(OKPAlgorithm.to_jwk(public_key))
+        algorithm = "EdDSA"
+    elif isinstance(public_key, rsa.RSAPublicKey):
+        jwk = json.loads(RSAAlgorithm.to_jwk(public_key))
+        algorithm = "RS256"
+    else:
+        raise ValueError("Only Ed25519 and RSA keys are supported")
+
+    jwk.pop("key_ops", None)    # "use" is published instead
+    jwk.update({"kid": key_id(jwk), "alg": algorithm, "use": "sig"})
+
+    return jwk
+
+
+def key_id(jwk: dict) -> str:
+    """
+    RFC 7638 thumbprint: stable ID derived from the public key itself.
+    """
+    if jwk["kty"] == "OKP":
+        members = {"crv": jwk["crv"], "kty": jwk["kty"], "x": jwk["x"]}
+    else:
+        members = {"e": jwk["e"], "kty": jwk["kty"], "n": jwk["n"]}
+
+    digest = hashlib.sha256(
+        json.dumps(members, separators=(",", ":"), sort_keys=True).encode()
+    ).digest()
+
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
+
+
+def _load_keys():
+    """
+    Loads signing key and all verification keys (by kid) once at import.
+    """
+    if ALGORITHM not in ASYMMETRIC_ALGORITHMS:
+        return None, None, {}, []
+
+    if not JWT_PRIVATE_KEY_FILE:
+        raise RuntimeError(f"ALGORITHM={ALGORITHM} requires JWT_PRIVATE_KEY_FILE")
+
+    with open(JWT_PRIVATE_KEY_FILE, "rb") as file:
+        private_key = serialization.load_pem_private_key(file.read(), password=None)
+
+    public_keys = [private_key.public_key()]
+
+    for path in filter(None, (p.strip() for p in JWT_PREVIOUS_PUBLIC_KEY_FILES.split(","))):
+        with open(path, "rb") as file:
+            public_keys.append(serialization.load_pem_public_key(file.read()))
+
+    jwks = [public_jwk(public_key) for public_key in public_keys]
+    verification_keys = {
+        jwk["kid"]: (public_key, jwk["alg"])
+        for jwk, public_key in zip(jwks, public_keys)
+    }
+
+    return private_key, jwks[0]["kid"], verification_keys, jwks
+
+
+_private_key, _signing_kid, _verification_keys, _jwks = _load_keys()
+
+
+# =========================
+# Sign / verify
+# =========================
+def encode_token(claims: dict) -> str:
+    """
+    Signs claims with the current key.
+    """
+    if _private_key is None:
+        return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+    return jwt.encode(
+        claims,
+        _private_key,
+        algorithm=ALGORITHM,
+        headers={"kid": _signing_kid}
+    )
+
+
+def decode_token(token: str) -> dict:
+    """
+    Verifies signature and expiry, returns payload.
+
+    :raises jwt.ExpiredSignatureError: token expired
+    :raises jwt.PyJWTError: token invalid (signature, format, unknown kid)
+    """
+    if _private_key is None:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+    kid = jwt.get_unverified_header(token).get("kid")
+    key = _verification_keys.get(kid)
+
+    if key is None:
+        raise jwt.InvalidKeyError("Unknown key ID")
+
+    public_key, algorithm = key
+
+    return jwt.decode(token, public_key, algorithms=[algorithm])
+
+
+def get_jwks() -> dict:
+    """
+    Returns JWKS document with current and previous public keys.
+    """
+    return {"keys": _jwks}
@@ -1,6 +1,5 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Schemas
 # ===== Events Schemas =====
 # ===== data:
@@ -13,8 +12,8 @@ from app.schemas.events.response.get_events_schemas import (
     EventsInMonthSchema
 )
 # =========================
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.events.create_event_service import create_event
 from app.services.events.delete_event_service import delete_event
@@ -32,17 +31,13 @@ router = APIRouter(
     tags=["Events management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
-
 # ===== GET ===========================================================
 @router.get(
     "/get-all-events",
     response_model=MultipleEventsSchema
 )
 async def get_all_events_endpoint(
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
     limit: int = 10,
     page: int = 1
 ):
@@ -53,9 +48,6 @@ async def get_all_events_endpoint(
     1. Call service to get all events in DB
     2. Return all events
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_events(
         page=page,
         limit=limit,
@@ -70,7 +62,7 @@ async def get_all_events_endpoint(
 async def get_all_events_in_month_endpoint(
     month: int,
     year: int,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all events in a month.
@@ -79,9 +71,6 @@ async def get_all_events_in_month_endpoint(
     1. Call service to get all events in DB
     2. Return all events
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_events_in_month(
         month=month,
         year=year,
@@ -97,7 +86,7 @@ async def get_events_by_title_endpoint(
     title: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all events by title.
@@ -106,9 +95,6 @@ async def get_events_by_title_endpoint(
     1. Call service to get all events in DB
     2. Return all events
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_events_by_title(
         title=title,
         page=page,
@@ -122,7 +108,7 @@ async def get_events_by_title_endpoint(
 )
 async def is_creator_of_event_endpoint(
     event_id: str,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all events by title.
@@ -131,9 +117,6 @@ async def is_creator_of_event_endpoint(
     1. Call service to get all events in DB
     2. Return all events
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await is_creator_of_event(
         event_id=event_id,
         user_id=user_id
@@ -146,7 +129,7 @@ async def is_creator_of_event_endpoint(
 )
 async def create_event_endpoint(
     data: CreateEventSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Create a new event.
@@ -157,9 +140,6 @@ async def create_event_endpoint(
     3. Call service to create event in DB
     4. Return created event
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_event(
         data=data, 
         user_id=user_id
@@ -172,7 +152,7 @@ async def create_event_endpoint(
 )
 async def update_event_endpoint(
     data: UpdateEventSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Update an event.
@@ -183,9 +163,6 @@ async def update_event_endpoint(
     3. Call service to update event in DB
     4. Return updated event
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_event(
         data=data,
         user_id=user_id
@@ -198,7 +175,7 @@ async def update_event_endpoint(
 )
 async def delete_event_endpoint(
     eventId: str,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Delete an event.
@@ -209,9 +186,6 @@ async def delete_event_endpoint(
     3. Call service to delete event in DB
     4. Return success message
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_event(
         eventId=eventId, 
         creatorId=user_id
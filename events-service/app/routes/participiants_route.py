@@ -1,6 +1,5 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Schemas
 # ===== data:
 from app.schemas.participants.data.create_participant_schema import CreateParticipantSchema
@@ -11,8 +10,8 @@ from app.schemas.participants.response.get_participants_schemas import (
     MultipleParticipantsSchema
 )
 # =========================
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.participants.create_participant_service import create_participant
 from app.services.participants.delete_participant_service import delete_participant, leave_event
@@ -24,9 +23,6 @@ router = APIRouter(
     tags=["Participants management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
 # ===== GET ===========================================================
 # Route for getting all participants
 @router.get(
@@ -37,7 +33,7 @@ async def get_all_participants_route(
     limit: int = 10,
     page: int = 1,
     event_id: str | None = None,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get all participants.
@@ -48,9 +44,6 @@ async def get_all_participants_route(
     3. Call service to get all participants
     4. Return all participants
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_participants(
         limit=limit,
         page=page,
@@ -68,7 +61,7 @@ async def get_participants_by_email_route(
     event_id: str,
     limit: int = 10,
     page: int = 1,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get participants by email.
@@ -79,9 +72,6 @@ async def get_participants_by_email_route(
     3. Call service to get participants by email
     4. Return participants
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await search_event_participants_by_email(
         event_id=event_id,
         email=email,
@@ -98,7 +88,7 @@ async def get_participants_by_email_route(
 )
 async def create_participant_route(
     participant: CreateParticipantSchema, 
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new participant.
@@ -109,9 +99,6 @@ async def create_participant_route(
     3. Call service to create participant in DB
     4. Return created participant
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_participant(
         data=participant
     )
@@ -125,7 +112,7 @@ async def create_participant_route(
 async def delete_participant_route(
     eventId: str,
     userId: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Delete a participant.
@@ -136,9 +123,6 @@ async def delete_participant_route(
     3. Call service to delete participant in DB
     4. Return success message
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_participant(
         eventId=eventId,
         userId=userId,
@@ -152,7 +136,7 @@ async def delete_participant_route(
 )
 async def leave_event_route(
     eventId: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Leave an event.
@@ -163,9 +147,6 @@ async def leave_event_route(
     3. Call service to leave event in DB
     4. Return success message
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await leave_event(
         eventId=eventId, 
         userId=user_id
@@ -5,10 +5,14 @@
 # FastAPI exceptions and HTTP status codes
 from fastapi import HTTPException, status
 # JWT handling (decode tokens and catch errors)
-from jose import jwt, JWTError, ExpiredSignatureError
+import jwt
+# Fetches public keys from auth-service
+import httpx
 # Load environment variables from .env file
 from dotenv import load_dotenv
 # Standard library
+import asyncio
+import time
 import os
 
 
@@ -18,12 +22,86 @@ import os
 # Read values from .env file into environment
 load_dotenv()
 
+# auth-service JWKS endpoint, e.g. http://auth-fastapi-container:80/.well-known/jwks.json
+# (set it when auth-service signs with EdDSA / RS256)
+JWKS_URL = os.getenv("JWKS_URL")
+# Min seconds between JWKS downloads triggered by unknown key IDs
+JWKS_MIN_REFRESH_SECONDS = float(os.getenv("JWKS_MIN_REFRESH_SECONDS", "30"))
+
+# Legacy shared secret mode (used when JWKS_URL is not set)
 # Secret key used to sign and verify JWT tokens
 SECRET_KEY = os.getenv("SECRET_KEY")
 # Algorithm used for JWT encoding/decoding (e.g. HS256)
 ALGORITHM = os.getenv("ALGORITHM")
 
 
+# =========================
+# Public keys cache
+# =========================
+_keys: dict[str, tuple[object, str]] = {}   # kid -> (public key, algorithm)
+_last_fetch = 0.0
+_fetch_lock = asyncio.Lock()
+
+
+async def _refresh_keys() -> None:
+    """
+    Downloads JWKS (at most once per JWKS_MIN_REFRESH_SECONDS, one request at a time).
+    """
+    global _last_fetch
+
+    async with _fetch_lock:
+        if time.monotonic() - _last_fetch < JWKS_MIN_REFRESH_SECONDS:
+            return
+
+        _last_fetch = time.monotonic()
+
+        async with httpx.AsyncClient(timeout=5) as client:
+            response = await client.get(JWKS_URL)
+            response.raise_for_status()
+
+        keys = {}
+        for jwk in response.json().get("keys", []):
+            keys[jwk["kid"]] = (jwt.PyJWK(jwk).key, jwk["alg"])
+
+        _keys.clear()
+        _keys.update(keys)
+
+
+async def _get_key(kid: str | None) -> tuple[object, str]:
+    """
+    Returns public key by ID, refreshing JWKS when the ID is unknown (key rotation).
+    """
+    if kid not in _keys:
+        try:
+            await _refresh_keys()
+        except (httpx.HTTPError, ValueError, KeyError, jwt.PyJWTError):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Signing keys are unavailable",
+            )
+
+    if kid not in _keys:
+        raise jwt.InvalidKeyError("Unknown key ID")
+
+    return _keys[kid]
+
+
+async def _decode(access_token: str) -> dict:
+    """
+    Verifies token locally: JWKS public key by "kid", or SECRET_KEY in legacy mode.
+
+    Only signature and "exp" are checked. Revocations (logout, deactivated users,
+    changed roles) are known to auth-service only: the gateway auth check enforces them.
+    """
+    if not JWKS_URL:
+        return jwt.decode(access_token, SECRET_KEY, algorithms=[ALGORITHM])
+
+    kid = jwt.get_unverified_header(access_token).get("kid")
+    public_key, algorithm = await _get_key(kid)
+
+    return jwt.decode(access_token, public_key, algorithms=[algorithm])
+
+
 # =========================
 # Access token validation
 # =========================
@@ -37,12 +115,8 @@ async def check_access_token(access_token: str) -> str:
     """
 
     try:
-        # Decode JWT token using secret key and algorithm
-        payload = jwt.decode(
-            access_token, 
-            SECRET_KEY, 
-            algorithms=[ALGORITHM]
-        )
+        # Verify signature and expiry
+        payload = await _decode(access_token)
 
         # Get user ID from token payload ("sub" = subject)
         user_id = payload.get("sub")
@@ -52,15 +126,15 @@ async def check_access_token(access_token: str) -> str:
         
 
     # Token is valid but expired
-    except ExpiredSignatureError:
+    except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=401,
             detail="Token has expired",
         )
     
-    # Token is invalid (wrong signature, wrong format, etc.)
-    except JWTError:
+    # Token is invalid (wrong signature, wrong format, unknown key, etc.)
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=401,
             detail="Could not validate credentials",
-        )
\ No newline at end of file
+        )
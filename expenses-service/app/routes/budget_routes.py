@@ -2,9 +2,8 @@
 # IMPORTS
 # =========================
 from fastapi import APIRouter, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Utilities
-from app.utils.check_access_token import check_access_token
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.budget_service import (
     create_budget,
@@ -26,10 +25,6 @@ router = APIRouter(
     tags=["Budget management service"]
 )
 
-# Authentication dependency using HTTP Bearer token
-security = HTTPBearer()
-
-
 # =========================
 # ROUTES
 # =========================
@@ -41,7 +36,7 @@ security = HTTPBearer()
 )
 async def create_budget_route(
     budget: BudgetCreateSchema,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Create a budget for the current user.
@@ -50,9 +45,6 @@ async def create_budget_route(
     - Validates user via access token
     - Uses `create_budget` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_budget(
         user_id=user_id,
         data=budget
@@ -66,7 +58,7 @@ async def create_budget_route(
 )
 async def get_budgets_route(
     month: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get budgets for the current user.
@@ -75,9 +67,6 @@ async def get_budgets_route(
     - Validates user via access token
     - Uses `get_budgets` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_budgets(
         user_id=user_id,
         month=month
@@ -92,7 +81,7 @@ async def get_budgets_route(
 async def update_budget_route(
     budget: BudgetUpdateSchema,
     budget_id: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Update a budget for the current user.
@@ -101,9 +90,6 @@ async def update_budget_route(
     - Validates user via access token
     - Uses `update_budget` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_budget(
         budget_id=budget_id,
         data=budget,
@@ -118,7 +104,7 @@ async def update_budget_route(
 )
 async def delete_budget_route(
     budget_id: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Delete a budget for the current user.
@@ -127,9 +113,6 @@ async def delete_budget_route(
     - Validates user via access token
     - Uses `delete_budget` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_budget(
         budget_id=budget_id,
         user_id=user_id
@@ -2,9 +2,8 @@
 # IMPORTS
 # =========================
 from fastapi import APIRouter, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Utilities
-from app.utils.check_access_token import check_access_token
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.expense_service import (
     create_expense,
@@ -27,9 +26,6 @@ router = APIRouter(
     tags=["Expense management service"]
 )
 
-# Authentication dependency using HTTP Bearer token
-security = HTTPBearer()
-
 # =========================
 # ROUTES
 # =========================
@@ -41,7 +37,7 @@ security = HTTPBearer()
 )
 async def create_expense_route(
     expense: ExpenseCreateSchema,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Create an expense for the current user.
@@ -50,9 +46,6 @@ async def create_expense_route(
     - Validates user via access token
     - Uses `create_expense` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_expense(
         data=expense,
         user_id=user_id
@@ -66,7 +59,7 @@ async def create_expense_route(
     response_model=PaginatedResponse,
 )
 async def get_expenses_route(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
     filters: ExpenseFilter = Depends(),
     page: int = 1,
     limit: int = 10
@@ -78,9 +71,6 @@ async def get_expenses_route(
     - Validates user via access token
     - Uses `get_expenses` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_expenses(
         user_id=user_id, 
         filters=filters,
@@ -95,7 +85,7 @@ async def get_expenses_route(
     "/stats",
 )
 async def get_stats_route(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get stats for the current user.
@@ -104,9 +94,6 @@ async def get_stats_route(
     - Validates user via access token
     - Uses `get_stats` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_stats(
         user_id=user_id
     )
@@ -120,7 +107,7 @@ async def get_stats_route(
 async def update_expense_route(
     expense_id: str,
     expense: ExpenseUpdateSchema,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Update an expense for the current user.
@@ -129,9 +116,6 @@ async def update_expense_route(
     - Validates user via access token
     - Uses `update_expense` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_expense(
         expense_id=expense_id,
         data=expense,
@@ -146,7 +130,7 @@ async def update_expense_route(
 )
 async def delete_expense_route(
     expense_id: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Delete an expense for the current user.
@@ -155,9 +139,6 @@ async def delete_expense_route(
     - Validates user via access token
     - Uses `delete_expense` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_expense(
         expense_id=expense_id,
         user_id=user_id
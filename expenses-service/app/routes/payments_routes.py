@@ -2,9 +2,8 @@
 # IMPORTS
 # =========================
 from fastapi import APIRouter, Depends
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Utilities
-from app.utils.check_access_token import check_access_token
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.payments_service import (
     create_recurring,
@@ -27,10 +26,6 @@ router = APIRouter(
     tags=["Payment management service"]
 )
 
-# Authentication dependency using HTTP Bearer token
-security = HTTPBearer()
-
-
 # =========================
 # ROUTES
 # =========================
@@ -41,7 +36,7 @@ security = HTTPBearer()
 )
 async def create_recurring_route(
     payment: RecurringPaymentCreateSchema,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Create a recurring payment for the current user.
@@ -50,9 +45,6 @@ async def create_recurring_route(
     - Validates user via access token
     - Uses `create_recurring` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_recurring(
         user_id=user_id,
         data=payment
@@ -66,7 +58,7 @@ async def create_recurring_route(
 async def get_recurring_route(
     page: int = 1,
     limit: int = 10,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get recurring payments for the current user.
@@ -75,9 +67,6 @@ async def get_recurring_route(
     - Validates user via access token
     - Uses `get_recurring` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_recurring(
         user_id=user_id,
         page=page,
@@ -93,7 +82,7 @@ async def get_recurring_route(
 async def update_recurring_route(
     payment_id: str,
     payment: RecurringPaymentUpdateSchema,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Update a recurring payment for the current user.
@@ -102,9 +91,6 @@ async def update_recurring_route(
     - Validates user via access token
     - Uses `update_recurring` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_recurring(
         payment_id=payment_id,
         data=payment,
@@ -118,7 +104,7 @@ async def update_recurring_route(
 )
 async def delete_recurring_route(
     payment_id: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Delete a recurring payment for the current user.
@@ -127,9 +113,6 @@ async def delete_recurring_route(
     - Validates user via access token
     - Uses `delete_recurring` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_recurring(
         payment_id=payment_id,
         user_id=user_id
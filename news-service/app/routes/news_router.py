@@ -3,7 +3,6 @@
 # =========================
 from fastapi import APIRouter, HTTPException, status, Depends
 from typing import Optional
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 # Schemas
 from app.schemas.data.create_news_schema import CreateNews
@@ -17,7 +16,7 @@ from app.services.delete_news_service import delete_news
 from app.services.get_news_service import get_news_paginated
 
 # Utilities
-from app.utils.check_access_token import check_access_token
+from app.dependencies.user_dependency import get_current_user_id
 
 # =========================
 # ROUTER SETUP
@@ -27,10 +26,6 @@ router = APIRouter(
     tags=["News management service"]
 )
 
-# Authentication dependency using HTTP Bearer token
-security = HTTPBearer()
-
-
 # =========================
 # CREATE NEWS ROUTE
 # =========================
@@ -40,7 +35,7 @@ security = HTTPBearer()
 )
 async def create_news_route(
     data: CreateNews,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new news item.
@@ -49,9 +44,6 @@ async def create_news_route(
     - Validates user via access token
     - Uses `create_news` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_news(
         authorEmail=data.authorEmail,
         authorId=user_id,
@@ -73,7 +65,7 @@ async def get_news_route(
     limit: int = 10,
     page: int = 1,
     query: Optional[str] = None,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get paginated news list.
@@ -82,9 +74,6 @@ async def get_news_route(
     - Requires authentication
     - Uses `get_news_paginated` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_news_paginated(
         limit=limit,
         page=page,
@@ -101,7 +90,7 @@ async def get_news_route(
 )
 async def update_news_route(
     data: UpdateNewsSchema,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Update an existing news item by ID.
@@ -110,9 +99,6 @@ async def update_news_route(
     - Validates user via access token
     - Uses `update_news` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_news(
         content=data.content,
         coverImage=data.coverImage,
@@ -129,7 +115,7 @@ async def update_news_route(
 @router.delete("/delete/{newsId}")
 async def delete_news_route(
     newsId: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Delete a news item by ID.
@@ -137,9 +123,6 @@ async def delete_news_route(
     - Requires authentication
     - Uses `delete_news` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_news(
         newsId=newsId
     )
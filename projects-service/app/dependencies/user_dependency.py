@@ -0,0 +1,72 @@
+# =========================
+# Current user dependency
+# =========================
+
+# Imports
+# Libraries
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from dotenv import load_dotenv
+import hmac
+import os
+# Utils
+from ..utils.check_access_token import check_access_token
+
+
+# =========================
+# Environment setup
+# =========================
+load_dotenv()
+
+# "true" -> trust identity headers set by the nginx gateway, skip JWT decoding
+TRUSTED_GATEWAY_HEADERS = os.getenv("TRUSTED_GATEWAY_HEADERS", "false").lower() == "true"
+# Shared secret the gateway sends in X-Gateway-Secret (must match nginx gateway_secret.conf)
+GATEWAY_SECRET = os.getenv("GATEWAY_SECRET", "")
+
+# Bearer token is optional here: in trusted mode the gateway already checked it
+security = HTTPBearer(auto_error=False)
+
+
+# =========================
+# Current user ID
+# =========================
+async def get_current_user_id(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+) -> str:
+    """
+    Returns ID of the authenticated user.
+
+    Modes:
+    - trusted gateway headers: reads X-User-Id set by the gateway after its auth check,
+      requests without a valid X-Gateway-Secret (not from the gateway) are rejected
+    - default: decodes the bearer access token
+
+    :raises HTTPException: 401 if user cannot be authenticated
+    """
+
+    if TRUSTED_GATEWAY_HEADERS:
+        gateway_secret = request.headers.get("X-Gateway-Secret", "")
+        user_id = request.headers.get("X-User-Id")
+
+        if not GATEWAY_SECRET or not hmac.compare_digest(gateway_secret, GATEWAY_SECRET):
+            raise HTTPException(
+                status_code=401,
+                detail="Request must come through the gateway",
+            )
+
+        if not user_id:
+            raise HTTPException(
+                status_code=401,
+                detail="Could not validate credentials",
+            )
+
+        return user_id
+
+    if not credentials:
+        raise HTTPException(
+            status_code=401,
+            detail="Not authenticated",
+        )
+
+    return await check_access_token(credentials.credentials)
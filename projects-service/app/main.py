@@ -1,6 +1,7 @@
 # Imports
 from fastapi import FastAPI
 from .dependencies.database import init_db
+from .utils.membership_cache import start_membership_sync, membership_cache_stats
 from contextlib import asynccontextmanager
 # API routers
 from .routers.tasks import tasks_route
@@ -26,10 +27,13 @@ from .routers.workspaces import (
 async def lifespan(app: FastAPI):
     # Initialize database when application starts
     await init_db()
+    # Membership cache sync between workers (MEMBERSHIP_CACHE_SYNC=true)
+    sync_tasks = start_membership_sync()
     # Application works while this yield exists
     yield
 
-    # (Optional) place cleanup logic here if needed
+    for task in sync_tasks:
+        task.cancel()
 
 
 # =========================
@@ -52,3 +56,14 @@ app.include_router(workspace_members_route.router)
 app.include_router(workspace_stage_route.router)
 app.include_router(workspace_tasks_route.router)
 app.include_router(workspace_selected_project_route.router)
+
+
+# =========================
+# Internal stats (not routed by the gateway)
+# =========================
+@app.get("/internal/membership-cache")
+async def membership_cache_stats_endpoint():
+    """
+    Membership cache size, hits, misses and hit ratio of this worker.
+    """
+    return membership_cache_stats()
@@ -46,6 +46,7 @@ class KanbanBoardMemberModel(Document):
 class KanbanBoardModel(Document):
     userId: str                                                      # User ID
     title: str                                                       # Board title
+    stagesVersion: int = 0                                           # Stage order version (+1 on every change)
     createdAt: datetime = Field(default_factory=get_current_date)    # Creation date (automatically set)
 
     class Settings:
@@ -88,7 +89,7 @@ class KanbanTaskModel(Document):
 
     title: str                          # Task title
     description: Optional[str] = None   # Task description
-    order: int                          # Task order
+    order: float                        # Task order (fractional rank)
 
     class Settings:
         name = "kanban_tasks"
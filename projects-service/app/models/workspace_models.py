@@ -45,7 +45,7 @@ class WorkspaceProjectModel(Document):
 class WorkspaceStageModel(Document):
     projectId: str  # Foreign key
     title: str      # Stage title
-    order: int      # Stage order
+    order: float    # Stage order
     description: Optional[str] = None   # Stage description
     createdAt: datetime   # Start date
     dueDate: Optional[datetime] = None
@@ -1,22 +1,23 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Schemas
 # ===== response:
 from app.schemas.response.kanban.boards.kanban_board_schema import KanbanBoardSchema
 from app.schemas.response.kanban.boards.kanban_boards_paginated_schema import KanbanBoardsPaginatedSchema
+from app.schemas.response.kanban.boards.kanban_board_snapshot_schema import KanbanBoardSnapshotSchema
 # ===== data:
 from app.schemas.data.kanban.boards.kanban_board_create_schema import KanbanBoardCreateSchema
 from app.schemas.data.kanban.boards.kanban_board_update_schema import KanbanBoardUpdateSchema
 from app.schemas.data.kanban.boards.kanbar_board_remove_schema import KanbanBoardRemoveSchema
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.kanban.boards.create_board_service import create_board
 from app.services.kanban.boards.get_all_boards_service import get_all_boards_paginated
 from app.services.kanban.boards.find_board_service import find_board_by_title
 from app.services.kanban.boards.update_board_service import update_board
 from app.services.kanban.boards.remove_board_service import remove_board
+from app.services.kanban.boards.get_board_snapshot_service import get_board_snapshot
 
 # Router
 router = APIRouter(
@@ -24,9 +25,6 @@ router = APIRouter(
     tags=["Kanban board management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
 # ===== Boards GET ================================
 
 # Route for find all kanban boards paginated
@@ -37,7 +35,7 @@ security = HTTPBearer()
 async def get_all_boards_endpoint(
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get all kanban boards from the database with pagination.
@@ -48,9 +46,6 @@ async def get_all_boards_endpoint(
     3. Call service to get all kanban boards from DB
     4. Return all kanban boards
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_boards_paginated(
         page=page, 
         limit=limit, 
@@ -68,7 +63,7 @@ async def find_kanban_board_endpoint(
     title: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Find a kanban board in the database.
@@ -79,9 +74,6 @@ async def find_kanban_board_endpoint(
     3. Call service to find kanban board in DB
     4. Return found kanban board
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await find_board_by_title(
         title=title, 
         page=page, 
@@ -89,6 +81,29 @@ async def find_kanban_board_endpoint(
         user_id=user_id
     )
 
+# Route for whole board: stages with their tasks and caller role
+@router.get(
+    "/{board_id}/snapshot",
+    response_model=KanbanBoardSnapshotSchema
+)
+async def get_board_snapshot_endpoint(
+    board_id: str,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    Get a kanban board with all stages and tasks in one request.
+
+    Steps:
+    1. Extract access token
+    2. Verify token and get user ID
+    3. Call service to read board, stages and tasks from DB
+    4. Return board snapshot
+    """
+    return await get_board_snapshot(
+        board_id=board_id,
+        user_id=user_id
+    )
+
 # ===== Boards POST ================================
 
 # Route for creating a new kanban board
@@ -98,7 +113,7 @@ async def find_kanban_board_endpoint(
 )
 async def create_kanban_board_endpoint(
     data: KanbanBoardCreateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Create a new kanban board in the database.
@@ -109,9 +124,6 @@ async def create_kanban_board_endpoint(
     3. Call service to create kanban board in DB
     4. Return new kanban board
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_board(
         title=data.title,
         email=data.email,
@@ -126,7 +138,7 @@ async def create_kanban_board_endpoint(
 )
 async def update_kanban_board_endpoint(
     data: KanbanBoardUpdateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Update a kanban board in the database.
@@ -137,9 +149,6 @@ async def update_kanban_board_endpoint(
     3. Call service to update kanban board in DB
     4. Return updated kanban board
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_board(
         board_id=data.boardId, 
         title=data.title,
@@ -152,7 +161,7 @@ async def update_kanban_board_endpoint(
 )
 async def remove_kanban_board_endpoint(
     data: KanbanBoardRemoveSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Remove a kanban board from the database.
@@ -162,9 +171,6 @@ async def remove_kanban_board_endpoint(
     2. Verify token and get user ID
     3. Call service to remove kanban board from DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await remove_board(
         board_id=data.boardId, 
         user_id=user_id
@@ -1,6 +1,5 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Schemas
 # ===== response:
 from app.schemas.response.kanban.members.kanban_board_member_schema import KanbanBoardMemberSchema
@@ -9,8 +8,8 @@ from app.schemas.response.kanban.members.kanban_board_members_paginated_schema i
 from app.schemas.data.kanban.members.add_member_schema import AddMemberSchema
 from app.schemas.data.kanban.members.update_member_schema import UpdateKanbanBoardMemberSchema
 from app.schemas.data.kanban.members.remove_member_schema import RemoveKanbanBoardMemberSchema
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.kanban.members.add_board_member_service import add_board_member
 from app.services.kanban.members.delete_board_member_service import delete_board_member
@@ -26,9 +25,6 @@ router = APIRouter(
     tags=["Kanban board member management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
 # ===== Kanban board member GET ==========================================================
 # Route for getting all members of a kanban board
 @router.get(
@@ -39,7 +35,7 @@ async def get_all_kanban_board_members_endpoint(
     board_id: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all members of a kanban board in the database.
@@ -50,8 +46,6 @@ async def get_all_kanban_board_members_endpoint(
     3. Call service to get all board members from DB
     4. Return all board members
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
 
     return await get_all_members(
         board_id=board_id, 
@@ -71,7 +65,7 @@ async def get_all_kanban_board_members_endpoint(
     email: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all members of a kanban board in the database.
@@ -82,8 +76,6 @@ async def get_all_kanban_board_members_endpoint(
     3. Call service to get all board members from DB
     4. Return all board members
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
 
     return await get_member_by_email(
         board_id=board_id, 
@@ -103,7 +95,7 @@ async def get_all_kanban_board_members_endpoint(
     role: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all members of a kanban board in the database.
@@ -114,9 +106,6 @@ async def get_all_kanban_board_members_endpoint(
     3. Call service to get all board members from DB
     4. Return all board members
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_members_by_role(
         board_id=board_id, 
         role=role, 
@@ -131,7 +120,7 @@ async def get_all_kanban_board_members_endpoint(
 )
 async def get_current_user_endpoint(
     board_id: str,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get info about current user in the database.
@@ -142,9 +131,6 @@ async def get_current_user_endpoint(
     3. Call service to get current user from DB
     4. Return current user
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_current_user(
         user_id=user_id,
         board_id=board_id, 
@@ -158,7 +144,7 @@ async def get_current_user_endpoint(
 )
 async def add_kanban_board_member_endpoint(
     data: AddMemberSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Add a new member to a kanban board in the database.
@@ -169,9 +155,6 @@ async def add_kanban_board_member_endpoint(
     3. Call service to add board member to DB
     4. Return new board member
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await add_board_member(
         email=data.email,
         board_id=data.boardId, 
@@ -188,7 +171,7 @@ async def add_kanban_board_member_endpoint(
 )
 async def update_kanban_board_member_endpoint(
     data: UpdateKanbanBoardMemberSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id_creator: str = Depends(get_current_user_id),
 ):
     """
     Update a member of a kanban board in the database.
@@ -199,9 +182,6 @@ async def update_kanban_board_member_endpoint(
     3. Call service to update board member in DB
     4. Return message
     """
-    access_token = credantials.credentials
-    user_id_creator = await check_access_token(access_token)
-
     return await update_board_member(
         board_id=data.boardId,
         user_id=data.userId, 
@@ -216,7 +196,7 @@ async def update_kanban_board_member_endpoint(
 )
 async def delete_kanban_board_member_endpoint(
     data: RemoveKanbanBoardMemberSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    current_user_id: str = Depends(get_current_user_id),
 ):
     """
     Delete a member from a kanban board in the database.
@@ -226,9 +206,6 @@ async def delete_kanban_board_member_endpoint(
     2. Verify token and get user ID
     3. Call service to delete board member from DB
     """
-    access_token = credantials.credentials
-    current_user_id = await check_access_token(access_token)
-
     return await delete_board_member(
         user_id=data.userId, 
         board_id=data.boardId,
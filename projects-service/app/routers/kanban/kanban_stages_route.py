@@ -1,23 +1,25 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Schemas
 # ===== response:
 from app.schemas.response.kanban.stages.kanban_stage_schema import KanbanStageSchema
 from app.schemas.response.kanban.stages.all_kanban_stages_schema import AllKanbanStagesSchema
+from app.schemas.response.kanban.stages.kanban_stages_order_schema import KanbanStagesOrderSchema
 # ===== data:
 from app.schemas.data.kanban.stages.create_stage_schema import CreateKanbanStageSchema
 from app.schemas.data.kanban.stages.create_stage_relative_schema import KanbanStageCreateRelativeSchema
 from app.schemas.data.kanban.stages.move_stage_schema import MoveKanbanStageSchema
+from app.schemas.data.kanban.stages.reorder_stages_schema import ReorderKanbanStagesSchema
 from app.schemas.data.kanban.stages.update_stage_schema import UpdateKanbanStageSchema
 from app.schemas.data.kanban.stages.remove_stage import RemoveKanbanStage
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.kanban.stages.kanban_stage_create_service import create_stage
 from app.services.kanban.stages.insert_stage_relative_service import insert_stage_relative
 from app.services.kanban.stages.get_all_stages_service import get_all_stages
 from app.services.kanban.stages.move_stage_service import move_stage
+from app.services.kanban.stages.reorder_stages_service import reorder_stages
 from app.services.kanban.stages.update_stage_service import update_stage
 from app.services.kanban.stages.delete_stage_service import delete_stage
 
@@ -27,9 +29,6 @@ router = APIRouter(
     tags=["Kanban stage management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
 # ===== Stage GET ==========================================================
 # Route for getting all kanban stages
 @router.get(
@@ -38,7 +37,7 @@ security = HTTPBearer()
 )
 async def get_all_stages_endpoint(
     board_id: str,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get all kanban stages from the database.
@@ -49,9 +48,6 @@ async def get_all_stages_endpoint(
     3. Call service to get all kanban stages from DB
     4. Return all kanban stages
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_stages(
         board_id=board_id,
         user_id=user_id
@@ -65,7 +61,7 @@ async def get_all_stages_endpoint(
 )
 async def create_stage_endpoint(
     data: CreateKanbanStageSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new kanban stage in the database.
@@ -76,9 +72,6 @@ async def create_stage_endpoint(
     3. Call service to create a new kanban stage in DB
     4. Return created kanban stage
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_stage(
         board_id=data.boardId, 
         title=data.title,
@@ -92,7 +85,7 @@ async def create_stage_endpoint(
 )
 async def create_stage_relative_endpoint(
     data: KanbanStageCreateRelativeSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new kanban stage relative in the database.
@@ -103,9 +96,6 @@ async def create_stage_relative_endpoint(
     3. Call service to create a new kanban stage relative in DB
     4. Return created kanban stage
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await insert_stage_relative(
         board_id=data.boardId, 
         title=data.title, 
@@ -121,7 +111,7 @@ async def create_stage_relative_endpoint(
 )
 async def move_stage_endpoint(
     data: MoveKanbanStageSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Move a kanban stage in the database.
@@ -133,8 +123,6 @@ async def move_stage_endpoint(
     4. Return moved kanban stage
     """
 
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
 
     return await move_stage(
         board_id=data.boardId, 
@@ -143,6 +131,31 @@ async def move_stage_endpoint(
         user_id=user_id
     )
 
+# Route for setting the order of all kanban stages
+@router.put(
+    "/reorder-stages",
+    response_model=KanbanStagesOrderSchema
+)
+async def reorder_stages_endpoint(
+    data: ReorderKanbanStagesSchema,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    Set the order of all stages of a board (drag and drop).
+
+    Steps:
+    1. Extract access token
+    2. Verify token and get user ID
+    3. Call service to validate and save new order in DB (one bulk write)
+    4. Return new stage order and its version
+    """
+    return await reorder_stages(
+        board_id=data.boardId,
+        stage_ids=data.stageIds,
+        user_id=user_id,
+        version=data.version
+    )
+
 # Route for updating a kanban stage
 @router.put(
     "/update-stage",
@@ -150,7 +163,7 @@ async def move_stage_endpoint(
 )
 async def update_stage_endpoint(
     data: UpdateKanbanStageSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Update a kanban stage in the database.
@@ -161,9 +174,6 @@ async def update_stage_endpoint(
     3. Call service to update kanban stage in DB
     4. Return updated kanban stage
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_stage(
         board_id=data.boardId, 
         stage_id=data.stageId, 
@@ -178,7 +188,7 @@ async def update_stage_endpoint(
 )
 async def delete_stage_endpoint(
     data: RemoveKanbanStage,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Delete a kanban stage from the database.
@@ -188,9 +198,6 @@ async def delete_stage_endpoint(
     2. Verify token and get user ID
     3. Call service to delete kanban stage from DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_stage(
         stage_id=data.stageId,
         board_id=data.boardId,
@@ -1,8 +1,7 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Schemas
 # ===== response:
 from app.schemas.response.kanban.tasks.kanban_task_schema import KanbanTaskSchema
@@ -11,12 +10,17 @@ from app.schemas.data.kanban.tasks.kanban_task_create_schema import KanbanTaskCr
 from app.schemas.data.kanban.tasks.kanban_task_update_schema import KanbanTaskUpdateSchema
 from app.schemas.data.kanban.tasks.kanban_task_move_schema import KanbanTaskMoveSchema
 from app.schemas.data.kanban.tasks.kanban_task_move_btw_stages_schema import KanbanTaskMoveBtwStagesSchema
+from app.schemas.data.kanban.tasks.kanban_task_move_to_position_schema import KanbanTaskMoveToPositionSchema
 from app.schemas.data.kanban.tasks.kanban_task_remove_schema import KanbanTaskRemoveSchema
 # Services
 from app.services.kanban.tasks.create_task_service import create_task
 from app.services.kanban.tasks.get_all_tasks_service import get_all_tasks
 from app.services.kanban.tasks.update_task_service import update_task
-from app.services.kanban.tasks.move_task_service import move_task_in_stage, move_task_between_stages
+from app.services.kanban.tasks.move_task_service import (
+    move_task_in_stage,
+    move_task_between_stages,
+    move_task_to_position
+)
 from app.services.kanban.tasks.task_delete_service import delete_task
 
 # Router
@@ -25,9 +29,6 @@ router = APIRouter(
     tags=["Kanban task management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
 # ===== Tasks GET ==========================================================
 # Route for getting all tasks
 @router.get(
@@ -36,7 +37,7 @@ security = HTTPBearer()
 async def get_all_tasks_endpoint(
     stage_id: str,
     board_id: str,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get all tasks from the database.
@@ -47,9 +48,6 @@ async def get_all_tasks_endpoint(
     3. Call service to get all tasks from DB
     4. Return all tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_tasks(
         stage_id=stage_id,
         board_id=board_id,
@@ -64,7 +62,7 @@ async def get_all_tasks_endpoint(
 )
 async def create_task_endpoint(
     data: KanbanTaskCreateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new kanban task in the database.
@@ -75,9 +73,6 @@ async def create_task_endpoint(
     3. Call service to create a new kanban task in DB
     4. Return created kanban task
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_task(
         title=data.title, 
         stage_id=data.stageId, 
@@ -94,7 +89,7 @@ async def create_task_endpoint(
 )
 async def update_task_endpoint(
     data: KanbanTaskUpdateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Update a task in the database.
@@ -105,9 +100,6 @@ async def update_task_endpoint(
     3. Call service to update private task in DB
     4. Return updated private task
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_task(
         task_id=data.taskId, 
         title=data.title, 
@@ -122,7 +114,7 @@ async def update_task_endpoint(
 )
 async def move_task_endpoint(
     data: KanbanTaskMoveSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Move a task in the database.
@@ -134,8 +126,6 @@ async def move_task_endpoint(
     4. Return moved task
     """
 
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
 
     return await move_task_in_stage(
         task_id=data.taskId, 
@@ -151,7 +141,7 @@ async def move_task_endpoint(
 )
 async def move_task_between_stages_endpoint(
     data: KanbanTaskMoveBtwStagesSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Move a task in the database.
@@ -163,8 +153,6 @@ async def move_task_between_stages_endpoint(
     4. Return moved task
     """
 
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
 
     return await move_task_between_stages(
         task_id=data.taskId, 
@@ -173,6 +161,33 @@ async def move_task_between_stages_endpoint(
         user_id=user_id
     )
 
+# Route for move task to position (drag and drop)
+@router.put(
+    "/move-task",
+    response_model=KanbanTaskSchema
+)
+async def move_task_to_position_endpoint(
+    data: KanbanTaskMoveToPositionSchema,
+    user_id: str = Depends(get_current_user_id)
+):
+    """
+    Move a task to any position of any stage in the board.
+    Only the moved task is written.
+
+    Steps:
+    1. Extract access token
+    2. Verify token and get user ID
+    3. Call service to move task in DB
+    4. Return moved task
+    """
+    return await move_task_to_position(
+        task_id=data.taskId,
+        target_stage_id=data.targetStageId,
+        index=data.index,
+        board_id=data.boardId,
+        user_id=user_id
+    )
+
 # ===== Tasks DELETE ==========================================================
 # Route for delete task
 @router.delete(
@@ -180,7 +195,7 @@ async def move_task_between_stages_endpoint(
 )
 async def remove_task_endpoint(
     data: KanbanTaskRemoveSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Remove a task from the database.
@@ -190,9 +205,6 @@ async def remove_task_endpoint(
     2. Verify token and get user ID
     3. Call service to remove private task from DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_task(
         task_id=data.taskId,
         board_id=data.boardId,
@@ -1,6 +1,5 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Schemas
 # ===== Tasks Schemas =====
 # ===== data:
@@ -11,8 +10,8 @@ from app.schemas.data.private_tasks.private_task_remove_schema import PrivateTas
 from app.schemas.response.private_tasks.private_task import PrivateTaskSchema
 from app.schemas.response.private_tasks.private_tasks_paginated import PaginatedPrivateTasksSchema
 # =========================
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 # ====== Tasks Services ======
 from app.services.private_tasks.create_private_task_service import create_private_task
@@ -39,10 +38,6 @@ router = APIRouter(
     tags=["Private tasks management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
-
 # ===== Tasks GET ==========================================================
 # Route for all tasks (paginated)
 @router.get(
@@ -52,7 +47,7 @@ security = HTTPBearer()
 async def get_all_private_tasks_endpoint(
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all private tasks from the database with pagination.
@@ -63,9 +58,6 @@ async def get_all_private_tasks_endpoint(
     3. Call service to get all private tasks from DB
     4. Return all private tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_private_tasks_paginated(
         page=page, 
         limit=limit, 
@@ -81,7 +73,7 @@ async def find_tasks_by_title_endpoint(
     title: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Find tasks by title from the database with pagination.
@@ -92,9 +84,6 @@ async def find_tasks_by_title_endpoint(
     3. Call service to find tasks by title from DB
     4. Return found tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await find_task_by_title(
         title=title, 
         user_id=user_id, 
@@ -111,7 +100,7 @@ async def find_tasks_by_description_endpoint(
     description: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Find tasks by description from the database with pagination.
@@ -122,9 +111,6 @@ async def find_tasks_by_description_endpoint(
     3. Call service to find tasks by description from DB
     4. Return found tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await find_task_by_description(
         description=description, 
         user_id=user_id, 
@@ -141,7 +127,7 @@ async def find_tasks_by_duedate_endpoint(
     due_date: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Find tasks by due date from the database with pagination.
@@ -152,9 +138,6 @@ async def find_tasks_by_duedate_endpoint(
     3. Call service to find tasks by due date from DB
     4. Return found tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await find_task_by_duedate(
         due_date=due_date, 
         user_id=user_id, 
@@ -171,7 +154,7 @@ async def find_tasks_by_month_endpoint(
     month: int,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Find tasks by month from the database with pagination.
@@ -182,9 +165,6 @@ async def find_tasks_by_month_endpoint(
     3. Call service to find tasks by month from DB
     4. Return found tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await find_task_by_month( 
         month=month, 
         user_id=user_id, 
@@ -197,7 +177,7 @@ async def find_tasks_by_month_endpoint(
     "/get-all-tasks-counted",
 )
 async def get_all_tasks_counted_endpoint(
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all tasks from the database.
@@ -208,9 +188,6 @@ async def get_all_tasks_counted_endpoint(
     3. Call service to get all tasks from DB
     4. Return all tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_private_tasks_counted(user_id=user_id)
 
 # Get all tasks completed
@@ -218,7 +195,7 @@ async def get_all_tasks_counted_endpoint(
     "/get-all-tasks-completed-counted",
 )
 async def get_all_tasks_completed_counted_endpoint(
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all tasks from the database.
@@ -229,9 +206,6 @@ async def get_all_tasks_completed_counted_endpoint(
     3. Call service to get all tasks from DB
     4. Return all tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_private_completed_tasks_counted(user_id=user_id)
 
 # Get all tasks in current month
@@ -239,7 +213,7 @@ async def get_all_tasks_completed_counted_endpoint(
     "/get-all-tasks-current-month-counted",
 )
 async def get_all_tasks_current_month_counted_endpoint(
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all tasks from the database.
@@ -250,9 +224,6 @@ async def get_all_tasks_current_month_counted_endpoint(
     3. Call service to get all tasks from DB
     4. Return all tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_private_tasks_by_current_month(user_id=user_id)
 
 # Get all tasks in current month completed
@@ -260,7 +231,7 @@ async def get_all_tasks_current_month_counted_endpoint(
     "/get-all-tasks-current-month-completed-counted",
 )
 async def get_all_tasks_current_month_completed_counted_endpoint(
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Get all tasks from the database.
@@ -271,9 +242,6 @@ async def get_all_tasks_current_month_completed_counted_endpoint(
     3. Call service to get all tasks from DB
     4. Return all tasks
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_private_completed_tasks_by_current_month(user_id=user_id)
 
 
@@ -285,7 +253,7 @@ async def get_all_tasks_current_month_completed_counted_endpoint(
 )
 async def create_private_task_endpoint(
     data: PrivateTaskCreateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(get_current_user_id),
 ):
     """
     Create a new private task.
@@ -296,9 +264,6 @@ async def create_private_task_endpoint(
     3. Call service to create private task in DB
     4. Return created private task
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_private_task(
         data=data, 
         user_id=user_id
@@ -312,7 +277,7 @@ async def create_private_task_endpoint(
 )
 async def update_private_task_endpoint(
     data: PrivateTaskUpdateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Update a task in the database.
@@ -323,9 +288,6 @@ async def update_private_task_endpoint(
     3. Call service to update private task in DB
     4. Return updated private task
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_private_task(
         task_id=data.taskId, 
         title=data.title, 
@@ -341,7 +303,7 @@ async def update_private_task_endpoint(
 )
 async def remove_private_task_endpoint(
     data: PrivateTaskRemoveSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Remove a task from the database.
@@ -351,9 +313,6 @@ async def remove_private_task_endpoint(
     2. Verify token and get user ID
     3. Call service to remove private task from DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await remove_private_task(
         task_id=data.taskId, 
         user_id=user_id
@@ -1,9 +1,8 @@
 # Imports
 from fastapi import Depends, APIRouter
 from typing import Annotated
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Schemas
 # ===== response:
 from app.schemas.response.workspaces.members.workspace_member import WorkspaceProjectMemberSchema
@@ -28,9 +27,6 @@ router = APIRouter(
     tags=["Workspace project member management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
 # ==== Project GET ==========================================================
 # Route for getting all members of a project
 @router.get(
@@ -40,7 +36,7 @@ async def get_all_project_members_endpoint(
     project_id: str,
     limit: int = 10,
     page: int = 1, 
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     '''
     Get all members of a project
@@ -51,9 +47,6 @@ async def get_all_project_members_endpoint(
     3. Call service to get all project members from DB
     4. Return all project members
     '''
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-    
     return await get_all_project_members(
         project_id=project_id,
         user_id=user_id,
@@ -71,10 +64,8 @@ async def get_member_by_email_endpoint(
     project_id: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
 
     return await get_member_by_email(
         email=email,
@@ -92,10 +83,8 @@ async def get_members_by_role_endpoint(
     project_id: str,
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
 
     return await get_members_by_role(
         role=role,
@@ -111,10 +100,8 @@ async def get_members_by_role_endpoint(
 )
 async def get_current_user_endpoint(
     project_id: str,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
 
     return await get_current_user(
         project_id=project_id,
@@ -128,7 +115,7 @@ async def get_current_user_endpoint(
 )
 async def add_project_member_endpoint(
     data: WorkspaceProjectMemberAddSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Add a new member to a project in the database.
@@ -138,9 +125,6 @@ async def add_project_member_endpoint(
     2. Verify token and get user ID
     3. Call service to add member to project in DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await add_project_member(
         email=data.email,
         project_id=data.projectId,
@@ -158,7 +142,7 @@ async def add_project_member_endpoint(
 )
 async def update_project_member_role_endpoint(
     data: WorkspaceProjectMemberUpdateSchema, 
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id_from_token: str = Depends(get_current_user_id)
 ):
     '''
     Update the role of a member in a project
@@ -169,8 +153,6 @@ async def update_project_member_role_endpoint(
     3. Call service to update project member role in DB
     '''
     
-    access_token = credantials.credentials
-    user_id_from_token = await check_access_token(access_token)
     
     return await update_project_member_role(
         project_id=data.projectId,
@@ -186,7 +168,7 @@ async def update_project_member_role_endpoint(
 )
 async def delete_project_member_endpoint(
     data: WorkspaceProjectMemberDeleteSchema, 
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id_from_token: str = Depends(get_current_user_id)
 ):
     '''
     Delete a member from a project
@@ -197,8 +179,6 @@ async def delete_project_member_endpoint(
     3. Call service to delete project member from DB
     '''
     
-    access_token = credantials.credentials
-    user_id_from_token = await check_access_token(access_token)
     
     return await delete_project_member(
         project_id=data.projectId,
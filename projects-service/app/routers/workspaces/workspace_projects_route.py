@@ -1,9 +1,8 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Schemas
 # ===== response:
 from app.schemas.response.workspaces.projects.workspace_project import WorkspaceProjectSchema
@@ -25,9 +24,6 @@ router = APIRouter(
     tags=["Workspace project management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
 # ==== Project GET ==========================================================
 # Route for getting all projects
 @router.get(
@@ -37,7 +33,7 @@ security = HTTPBearer()
 async def get_all_projects_endpoint(
     page: int = 1,
     limit: int = 10,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get all projects from the database.
@@ -48,9 +44,6 @@ async def get_all_projects_endpoint(
     3. Call service to get all projects from DB
     4. Return all projects
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_projects(
         user_id=user_id,
         page=page,
@@ -62,7 +55,7 @@ async def get_all_projects_endpoint(
     "/get-projects-count",
 )
 async def get_projects_count_endpoint(
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get all projects from the database.
@@ -73,9 +66,6 @@ async def get_projects_count_endpoint(
     3. Call service to get all projects from DB
     4. Return all projects
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_projects_count(
         user_id=user_id
     )
@@ -90,7 +80,7 @@ async def get_project_by_title_endpoint(
     page: int = 1,
     limit: int = 10,
     title: Optional[str] = None,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get a project by title or description from the database.
@@ -101,9 +91,6 @@ async def get_project_by_title_endpoint(
     3. Call service to get project by title or description from DB
     4. Return project
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_project_by_title(
         title=title,
         limit=limit,
@@ -119,7 +106,7 @@ async def get_project_by_title_endpoint(
 )
 async def create_project_endpoint(
     data: WorkspaceProjectCreateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new project in the database.
@@ -129,9 +116,6 @@ async def create_project_endpoint(
     2. Verify token and get user ID
     3. Call service to create project in DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_project(
         title=data.title,
         email=data.email,
@@ -147,7 +131,7 @@ async def create_project_endpoint(
 )
 async def update_project_endpoint(
     data: WorkspaceProjectUpdateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Update a project in the database.
@@ -158,9 +142,6 @@ async def update_project_endpoint(
     3. Call service to update project in DB
     4. Return updated project
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_project(
         user_id=user_id,
         project_id=data.projectId, 
@@ -175,7 +156,7 @@ async def update_project_endpoint(
 )
 async def delete_project_endpoint(
     data: WorkspaceProjectDeleteSchema, 
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Delete a project from the database.
@@ -186,9 +167,6 @@ async def delete_project_endpoint(
     3. Call service to delete project from DB
     4. Return deleted project
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_project(
         project_id=data.projectId,
         user_id=user_id
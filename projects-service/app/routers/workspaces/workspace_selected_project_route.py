@@ -1,9 +1,8 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.workspace.selected_project.set_selected_project_service import set_selected_project_service, get_selected_project, clear_selected_project_service
 from app.services.workspace.selected_project.get_count_stages_selected_project_service import get_stages_count, get_stages_date_range
@@ -17,15 +16,13 @@ router = APIRouter(
     tags=["Workspace selected project management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
 
 # Route for getting selected project
 @router.get(
     "/get-selected-project",
 )
 async def get_selected_project_endpoint(
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get selected project from the database.
@@ -36,9 +33,6 @@ async def get_selected_project_endpoint(
     3. Call service to get selected project from DB
     4. Return selected project
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_selected_project(user_id=user_id)
 
 # Route for create or update selected project
@@ -47,7 +41,7 @@ async def get_selected_project_endpoint(
 )
 async def set_selected_project_endpoint(
     data: SelectedProject,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Set selected project in the database.
@@ -57,9 +51,6 @@ async def set_selected_project_endpoint(
     2. Verify token and get user ID
     3. Call service to set selected project in DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await set_selected_project_service(
         userId=user_id,
         workspaceId=data.workspaceId,
@@ -71,7 +62,7 @@ async def set_selected_project_endpoint(
     "/clear-selected-project",
 )
 async def clear_selected_project_endpoint(
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Clear selected project from the database.
@@ -81,9 +72,6 @@ async def clear_selected_project_endpoint(
     2. Verify token and get user ID
     3. Call service to clear selected project from DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await clear_selected_project_service(userId=user_id)
 
 # Route for getting count of selected project stages
@@ -92,7 +80,7 @@ async def clear_selected_project_endpoint(
 )
 async def get_stages_count_endpoint(
     projectId: Optional[str] = None,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get count of selected project stages from the database.
@@ -103,9 +91,6 @@ async def get_stages_count_endpoint(
     3. Call service to get count of selected project stages from DB
     4. Return count of selected project stages
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_stages_count(
         user_id=user_id,
         project_id=projectId
@@ -117,7 +102,7 @@ async def get_stages_count_endpoint(
 )
 async def get_stages_date_range_endpoint(
     projectId: Optional[str] = None,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get create date and due date of selected project stages from the database.
@@ -128,9 +113,6 @@ async def get_stages_date_range_endpoint(
     3. Call service to get create date and due date of selected project stages from DB
     4. Return create date and due date of selected project stages
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_stages_date_range(
         user_id=user_id,
         project_id=projectId
@@ -142,7 +124,7 @@ async def get_stages_date_range_endpoint(
 )
 async def get_project_tasks_stats_endpoint(
     projectId: Optional[str] = None,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get count of selected project stages from the database.
@@ -153,9 +135,6 @@ async def get_project_tasks_stats_endpoint(
     3. Call service to get count of selected project stages from DB
     4. Return count of selected project stages
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_project_tasks_stats(
         user_id=user_id,
         project_id=projectId
@@ -1,8 +1,7 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Schemas
 # ===== response:
 from app.schemas.response.workspaces.stages.workspace_stage_schema import WorkspaceStageSchema
@@ -27,9 +26,6 @@ router = APIRouter(
     tags=["Workspace stage management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
 # ===== Stage GET ==========================================================
 # Route for getting all kanban stages
 @router.get(
@@ -38,7 +34,7 @@ security = HTTPBearer()
 )
 async def get_all_stages_endpoint(
     project_id: str,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get all kanban stages from the database.
@@ -49,9 +45,6 @@ async def get_all_stages_endpoint(
     3. Call service to get all kanban stages from DB
     4. Return all kanban stages
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_stages(
         project_id=project_id,
         user_id=user_id
@@ -65,7 +58,7 @@ async def get_all_stages_endpoint(
 )
 async def create_stage_endpoint(
     data: WorkspaceStageCreateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new kanban stage in the database.
@@ -76,9 +69,6 @@ async def create_stage_endpoint(
     3. Call service to create a new kanban stage in DB
     4. Return created kanban stage
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_stage(
         title=data.title,
         description=data.description,
@@ -95,7 +85,7 @@ async def create_stage_endpoint(
 )
 async def insert_stage_relative_endpoint(
     data: WorkspaceInsertStageRelativeSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new kanban stage in the database.
@@ -106,9 +96,6 @@ async def insert_stage_relative_endpoint(
     3. Call service to create a new kanban stage in DB
     4. Return created kanban stage
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await insert_stage_relative(
         project_id=data.projectId,
         title=data.title,
@@ -127,7 +114,7 @@ async def insert_stage_relative_endpoint(
 )
 async def update_stage_endpoint(
     data: WorkspaceStageUpdateSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Update a kanban stage in the database.
@@ -138,9 +125,6 @@ async def update_stage_endpoint(
     3. Call service to update kanban stage in DB
     4. Return updated kanban stage
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_stage(
         stage_id=data.stageId,
         title=data.title,
@@ -157,7 +141,7 @@ async def update_stage_endpoint(
 )
 async def move_stage_endpoint(
     data: WorkspaceMoveStageSchema,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Move a kanban stage in the database.
@@ -168,9 +152,6 @@ async def move_stage_endpoint(
     3. Call service to move kanban stage in DB
     4. Return moved kanban stage
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await move_stage(
         project_id=data.projectId, 
         stage_id=data.stageId, 
@@ -185,7 +166,7 @@ async def move_stage_endpoint(
 )
 async def delete_stage_endpoint(
     data: WorkspaceStageDelete,
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Delete a kanban stage from the database.
@@ -195,9 +176,6 @@ async def delete_stage_endpoint(
     2. Verify token and get user ID
     3. Call service to delete kanban stage from DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_stage(
         stage_id=data.stageId,
         project_id=data.projectId,
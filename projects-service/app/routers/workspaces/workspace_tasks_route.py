@@ -1,8 +1,7 @@
 # Imports
 from fastapi import Depends, APIRouter
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-# Utils
-from app.utils.check_access_token import check_access_token
+# Dependencies
+from app.dependencies.user_dependency import get_current_user_id
 # Schemas
 # ===== response:
 from app.schemas.response.workspaces.tasks.workspace_task_schema import WorkspaceTaskSchema
@@ -23,10 +22,6 @@ router = APIRouter(
     tags=["Workspace task management service"]
 )
 
-# Security scheme for access token
-security = HTTPBearer()
-
-
 # ===== Task GET ==========================================================
 # Route for getting all tasks
 @router.get(
@@ -36,7 +31,7 @@ security = HTTPBearer()
 async def get_all_tasks_route(
     project_id: str,
     stage_id: str,
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get all tasks in the database.
@@ -47,9 +42,6 @@ async def get_all_tasks_route(
     3. Call service to get all tasks in DB
     4. Return list of tasks
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_all_tasks(
         project_id=project_id,
         stage_id=stage_id,
@@ -64,7 +56,7 @@ async def get_all_tasks_route(
 )
 async def create_task_route(
     workspace_task: WorkspaceCreateTaskSchema, 
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Create a new task in the database.
@@ -75,9 +67,6 @@ async def create_task_route(
     3. Call service to create a new task in DB
     4. Return created task
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await create_task(
         task_data=workspace_task,
         user_id=user_id
@@ -92,7 +81,7 @@ async def create_task_route(
 )
 async def update_task_route(
     workspace_task: WorkspaceUpdateTaskSchema, 
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Update a task in the database.
@@ -103,9 +92,6 @@ async def update_task_route(
     3. Call service to update task in DB
     4. Return updated task
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await update_task(
         data=workspace_task,
         user_id=user_id
@@ -118,7 +104,7 @@ async def update_task_route(
 )
 async def remove_task_route(
     data: WorkspaceDeleteTaskSchema, 
-    credantials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Remove a task from the database.
@@ -128,9 +114,6 @@ async def remove_task_route(
     2. Verify token and get user ID
     3. Call service to remove task from DB
     """
-    access_token = credantials.credentials
-    user_id = await check_access_token(access_token)
-
     return await delete_task(
         task_id=data.taskId,
         project_id=data.projectId,
@@ -0,0 +1,23 @@
+# Imports
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+# =============================
+# ReorderKanbanStages schema - request
+# =============================
+class ReorderKanbanStagesSchema(BaseModel):
+    boardId: str
+    stageIds: List[str] = Field(min_length=1)   # Every stage of the board, in the new order
+    version: Optional[int] = None               # Expected stage order version (optional check)
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "boardId": "boardId",
+                    "stageIds": ["stageId1", "stageId2", "stageId3"],
+                    "version": 4
+                }
+            ]
+        }
+    }
@@ -0,0 +1,24 @@
+# Imports
+from pydantic import BaseModel, Field
+
+# ============================================================
+# KanbanTaskMoveToPosition schema
+# ============================================================
+class KanbanTaskMoveToPositionSchema(BaseModel):
+    taskId: str
+    targetStageId: str
+    index: int = Field(ge=0)    # Position in target stage, 0 = top
+    boardId: str
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {
+                    "taskId": "taskId",
+                    "targetStageId": "targetStageId",
+                    "index": 0,
+                    "boardId": "boardId"
+                }
+            ]
+        }
+    }
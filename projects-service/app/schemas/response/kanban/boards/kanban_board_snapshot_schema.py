@@ -0,0 +1,23 @@
+# Imports
+from pydantic import BaseModel, Field
+from typing import List
+# Schemas
+from app.schemas.response.kanban.boards.kanban_board_schema import KanbanBoardSchema
+from app.schemas.response.kanban.stages.kanban_stage_schema import KanbanStageSchema
+from app.schemas.response.kanban.tasks.kanban_task_schema import KanbanTaskSchema
+
+# ==========================================
+# KanbanSnapshotStage schema - stage + tasks
+# ==========================================
+class KanbanSnapshotStageSchema(KanbanStageSchema):
+    tasks: List[KanbanTaskSchema] = Field(default_factory=list)    # Tasks in order
+
+
+# ======================================
+# KanbanBoardSnapshot schema - response
+# ======================================
+class KanbanBoardSnapshotSchema(BaseModel):
+    board: KanbanBoardSchema                                                # Board data
+    role: str                                                               # Role of the caller
+    stagesVersion: int = 0                                                  # Stage order version
+    stages: List[KanbanSnapshotStageSchema] = Field(default_factory=list)   # Stages in order
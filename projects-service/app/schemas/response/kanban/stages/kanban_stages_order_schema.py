@@ -0,0 +1,12 @@
+# Imports
+from pydantic import BaseModel, Field
+from typing import List
+# Schemas
+from app.schemas.response.kanban.stages.kanban_stage_schema import KanbanStageSchema
+
+# ================================
+# KanbanStagesOrder schema - response
+# ================================
+class KanbanStagesOrderSchema(BaseModel):
+    version: int                                                    # Stage order version
+    items: List[KanbanStageSchema] = Field(default_factory=list)   # Stages in new order
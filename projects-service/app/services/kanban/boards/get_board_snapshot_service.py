@@ -0,0 +1,102 @@
+# Imports
+from fastapi import HTTPException
+from bson import ObjectId
+import asyncio
+# Models
+from app.models import (
+    KanbanBoardModel,
+    KanbanStageModel,
+    KanbanTaskModel
+)
+# Schemas
+from app.schemas.response.kanban.boards.kanban_board_schema import KanbanBoardSchema
+from app.schemas.response.kanban.tasks.kanban_task_schema import KanbanTaskSchema
+from app.schemas.response.kanban.boards.kanban_board_snapshot_schema import (
+    KanbanBoardSnapshotSchema,
+    KanbanSnapshotStageSchema
+)
+# Utils
+from app.utils.membership_cache import get_board_member
+
+# ==========================================
+# Get whole board (board, stages, tasks)
+# Parameters:
+# - board_id: The ID of the board
+# - user_id: The ID of the user
+# Returns:
+# - Board with ordered stages, their ordered tasks and caller role
+#
+# One membership check, then board, stages and tasks are read
+# concurrently. Tasks of the whole board come from one query on the
+# (boardId, stageId, order) index: sort (stageId desc, order asc) is
+# that index scanned backwards, so no in-memory sort is needed.
+# ==========================================
+async def get_board_snapshot(
+    board_id: str,
+    user_id: str
+) -> KanbanBoardSnapshotSchema:
+
+    # ===== Validation and error handling =====
+    if not board_id:
+        raise HTTPException(status_code=400, detail="Board ID is required")
+
+    if not ObjectId.is_valid(board_id):
+        raise HTTPException(status_code=400, detail="Invalid board ID")
+
+    if not user_id:
+        raise HTTPException(status_code=400, detail="User ID is required")
+
+    # ===== Current user handling =====
+    # Check role of current user
+    user = await get_board_member(board_id, user_id)
+
+    if not user:
+        raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
+
+    # ===== Business logic =====
+    board, stages, tasks = await asyncio.gather(
+        KanbanBoardModel.get(ObjectId(board_id)),
+        KanbanStageModel.find({
+            "boardId": board_id
+        }).sort("order").to_list(),
+        KanbanTaskModel.find({
+            "boardId": board_id
+        }).sort([("stageId", -1), ("order", 1)]).to_list()
+    )
+
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    # Group tasks by stage (already in order inside each stage)
+    tasks_by_stage = {}
+    for task in tasks:
+        tasks_by_stage.setdefault(task.stageId, []).append(
+            KanbanTaskSchema(
+                id=str(task.id),
+                title=task.title,
+                description=task.description,
+                order=task.order,
+                stageId=task.stageId,
+                boardId=task.boardId
+            )
+        )
+
+    # Build response
+    return KanbanBoardSnapshotSchema(
+        board=KanbanBoardSchema(
+            id=str(board.id),
+            title=board.title,
+            createdAt=board.createdAt
+        ),
+        role=user.role,
+        stagesVersion=board.stagesVersion,
+        stages=[
+            KanbanSnapshotStageSchema(
+                id=str(stage.id),
+                title=stage.title,
+                order=stage.order,
+                createdAt=stage.createdAt,
+                tasks=tasks_by_stage.get(str(stage.id), [])
+            ) for stage in stages
+        ]
+    )
@@ -8,6 +8,8 @@ from app.models import (
     KanbanTaskModel, 
     KanbanBoardMemberModel,
 )
+# Utils
+from app.utils.membership_cache import invalidate_board_member
 
 # ========================================================
 # Remove board function
@@ -58,6 +60,7 @@ async def remove_board(board_id: str, user_id: str) -> dict:
     await KanbanBoardMemberModel.find({
         "boardId": board_id
     }).delete()
+    invalidate_board_member(board_id)
 
     # Remove task
     await board.delete()
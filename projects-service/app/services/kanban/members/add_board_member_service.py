@@ -6,6 +6,8 @@ import re
 from app.models import KanbanBoardMemberModel, KanbanBoardModel
 # Schemas
 from app.schemas.response.kanban.members.kanban_board_member_schema import KanbanBoardMemberSchema
+# Utils
+from app.utils.membership_cache import get_board_member, invalidate_board_member
 
 # ==================================================
 # Function add board member
@@ -82,16 +84,14 @@ async def add_board_member(
 
         # Save board member
         await board_member.save()
+        invalidate_board_member(board_id, user_id)
 
         # Return board member
         return board_member
     
     # ===== Verify creator =====
 
-    creator = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id_creator
-    })
+    creator = await get_board_member(board_id, user_id_creator)
 
     if not creator:
         raise HTTPException(403, "You are not a member of this board")
@@ -134,6 +134,7 @@ async def add_board_member(
 
     # Save board member
     await board_member.save()
+    invalidate_board_member(board_id, user_id)
 
     # Return board member
     return board_member
\ No newline at end of file
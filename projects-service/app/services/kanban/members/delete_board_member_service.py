@@ -4,6 +4,8 @@ from bson import ObjectId
 
 # Models
 from app.models import KanbanBoardMemberModel
+# Utils
+from app.utils.membership_cache import get_board_member, invalidate_board_member
 
 
 # =================================================
@@ -28,10 +30,7 @@ async def delete_board_member(
 
     # ================= VERIFY CREATOR =================
 
-    creator = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id_creator
-    })
+    creator = await get_board_member(board_id, user_id_creator)
 
     if not creator:
         raise HTTPException(
@@ -54,6 +53,7 @@ async def delete_board_member(
             "boardId": board_id,
             "userId": user_id
         }).delete()
+        invalidate_board_member(board_id, user_id)
 
         return {"message": "You have been removed from the board successfully"}
 
@@ -95,5 +95,6 @@ async def delete_board_member(
     # ================= DELETE =================
 
     await board_member.delete()
+    invalidate_board_member(board_id, user_id)
 
     return {"message": "Board member removed successfully"}
\ No newline at end of file
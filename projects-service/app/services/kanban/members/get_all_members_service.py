@@ -9,6 +9,8 @@ from app.schemas.response.kanban.members.kanban_board_members_paginated_schema i
     KanbanBoardMembersPaginatedSchema, 
     PaginationMetaSchema
 )
+# Utils
+from app.utils.membership_cache import get_board_member
 
 # ==========================================
 # Get all members by board_id
@@ -47,10 +49,7 @@ async def get_all_members(
 
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not a member of this board")
@@ -1,10 +1,10 @@
 # Imports
 from fastapi import HTTPException
 from bson import ObjectId
-# Models
-from app.models import KanbanBoardMemberModel
 # Schemas
 from app.schemas.response.kanban.members.kanban_board_member_schema import KanbanBoardMemberSchema
+# Utils
+from app.utils.membership_cache import get_board_member
 
 # ==========================================
 # Get current user
@@ -25,10 +25,7 @@ async def get_current_user(
     if not ObjectId.is_valid(board_id):
         raise HTTPException(status_code=400, detail="Invalid board ID")
 
-    board_member = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id
-    })
+    board_member = await get_board_member(board_id, user_id)
 
     if not board_member:
         raise HTTPException(status_code=404, detail="Board member not found")
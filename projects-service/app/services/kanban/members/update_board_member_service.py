@@ -3,6 +3,8 @@ from fastapi import HTTPException
 from bson import ObjectId
 # Models
 from app.models import KanbanBoardMemberModel
+# Utils
+from app.utils.membership_cache import get_board_member, invalidate_board_member
 
 # =================================================
 # Update board member
@@ -40,10 +42,7 @@ async def update_board_member(
 
 
     # ===== Get current user (who performs update) =====
-    current_user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id_creator
-    })
+    current_user = await get_board_member(board_id, user_id_creator)
 
     if not current_user:
         raise HTTPException(status_code=403, detail="You are not a board member")
@@ -83,5 +82,6 @@ async def update_board_member(
     # ===== Update role =====
     board_member.role = role
     await board_member.save()
+    invalidate_board_member(board_id, user_id)
 
     return {"message": "Board member role updated successfully"}
\ No newline at end of file
@@ -2,7 +2,10 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import KanbanStageModel, KanbanTaskModel, KanbanBoardMemberModel
+from app.models import KanbanStageModel, KanbanTaskModel
+# Utils
+from app.utils.membership_cache import get_board_member
+from app.utils.stages_version import bump_stages_version
 
 # =================================
 # Delete a kanban stage from the DB
@@ -24,10 +27,7 @@ async def delete_stage(
     
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -52,5 +52,6 @@ async def delete_stage(
 
     # Delete stage
     await stage.delete()
+    await bump_stages_version(board_id)
 
     return {"message": f"Stage '{stage.title}' deleted successfully"}
\ No newline at end of file
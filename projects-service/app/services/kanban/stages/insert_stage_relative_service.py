@@ -2,9 +2,13 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import KanbanStageModel, KanbanBoardMemberModel
+from app.models import KanbanStageModel
 # Schemas
 from app.schemas.response.kanban.stages.kanban_stage_schema import KanbanStageSchema
+# Utils
+from app.utils.membership_cache import get_board_member
+from app.utils.stages_version import bump_stages_version
+from app.utils.order_renormalize import ReferenceNotFoundError, relative_order
 
 # ==========================
 # Insert a new kanban stage
@@ -47,10 +51,7 @@ async def insert_stage_relative(
 
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -78,31 +79,19 @@ async def insert_stage_relative(
     if not reference_stage:
         raise HTTPException(status_code=404, detail="Stage not found")
 
-    # Fing neighbour depending on position
-    if position == "after":
-        next_stage = await KanbanStageModel.find({
-            "boardId": board_id,
-            "order": {"$gt": reference_stage.order}
-        }).sort("order").first_or_none()
-
-        if next_stage:
-            new_order = (next_stage.order + reference_stage.order) / 2
-        else:
-            new_order = reference_stage.order + 1000.0
-    
-    elif position == "before":
-        prev_stage = await KanbanStageModel.find({
-            "boardId": board_id,
-            "order": {"$lt": reference_stage.order}
-        }).sort("-order").first_or_none()
-
-        if prev_stage:
-            new_order = (prev_stage.order + reference_stage.order) / 2
-        else:
-            new_order = reference_stage.order - 1000.0
-
-    else:
-        raise HTTPException(status_code=400, detail="Invalid position")
+    # Order between reference and its neighbour
+    # (board orders are renormalized first on collision / too small gap,
+    # which changes the stage order version too)
+    try:
+        new_order = await relative_order(
+            KanbanStageModel,
+            {"boardId": board_id},
+            reference_stage,
+            position,
+            on_renormalize=lambda: bump_stages_version(board_id)
+        )
+    except ReferenceNotFoundError:
+        raise HTTPException(status_code=404, detail="Stage not found")
 
     # Create new stage
     stage = KanbanStageModel(
@@ -112,6 +101,7 @@ async def insert_stage_relative(
     )
 
     await stage.insert()
+    await bump_stages_version(board_id)
 
     return KanbanStageSchema(
         id=str(stage.id),
@@ -2,9 +2,12 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import KanbanStageModel, KanbanBoardMemberModel
+from app.models import KanbanStageModel
 # Schemas
 from app.schemas.response.kanban.stages.kanban_stage_schema import KanbanStageSchema
+# Utils
+from app.utils.membership_cache import get_board_member
+from app.utils.stages_version import bump_stages_version
 
 # =========================
 # Create a new kanban stage
@@ -44,10 +47,7 @@ async def create_stage(
 
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -85,6 +85,7 @@ async def create_stage(
 
     # Insert into DB
     await stage.insert()
+    await bump_stages_version(board_id)
 
     # Return stage
     return KanbanStageSchema(
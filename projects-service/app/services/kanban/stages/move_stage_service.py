@@ -2,7 +2,10 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import KanbanStageModel, KanbanBoardMemberModel
+from app.models import KanbanStageModel
+# Utils
+from app.utils.membership_cache import get_board_member
+from app.utils.stages_version import bump_stages_version
 
 # ====================================
 # Move a kanban stage in the database
@@ -35,10 +38,7 @@ async def move_stage(
     
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -86,5 +86,6 @@ async def move_stage(
 
     await stage.save()
     await target_stage.save()
+    await bump_stages_version(board_id)
 
     return {"message": "Stage moved successfully"}
\ No newline at end of file
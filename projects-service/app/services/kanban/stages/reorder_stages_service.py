@@ -0,0 +1,106 @@
+# Imports
+from fastapi import HTTPException
+from bson import ObjectId
+from typing import List, Optional
+from pymongo import UpdateOne
+# Models
+from app.models import KanbanStageModel
+# Schemas
+from app.schemas.response.kanban.stages.kanban_stage_schema import KanbanStageSchema
+from app.schemas.response.kanban.stages.kanban_stages_order_schema import KanbanStagesOrderSchema
+# Utils
+from app.utils.membership_cache import get_board_member
+from app.utils.order_rank import RANK_STEP
+from app.utils.stages_version import bump_stages_version
+
+# ====================================
+# Reorder all stages of a board
+# Parameters:
+# - board_id: The ID of the board
+# - stage_ids: Every stage ID of the board in the new order
+# - user_id: The ID of the user
+# - version: Expected stage order version (optional)
+# Returns:
+# - new version and stages in the new order
+# ====================================
+async def reorder_stages(
+    board_id: str,
+    stage_ids: List[str],
+    user_id: str,
+    version: Optional[int] = None
+) -> KanbanStagesOrderSchema:
+
+    # ===== Validation and error handling =====
+    if not board_id:
+        raise HTTPException(status_code=400, detail="Board ID is required")
+
+    if not ObjectId.is_valid(board_id):
+        raise HTTPException(status_code=400, detail="Invalid board ID")
+
+    if not stage_ids:
+        raise HTTPException(status_code=400, detail="Stage IDs are required")
+
+    if not all(ObjectId.is_valid(stage_id) for stage_id in stage_ids):
+        raise HTTPException(status_code=400, detail="Invalid stage ID")
+
+    if len(set(stage_ids)) != len(stage_ids):
+        raise HTTPException(status_code=400, detail="Stage IDs must be unique")
+
+    if not user_id:
+        raise HTTPException(status_code=400, detail="User ID is required")
+
+    # ===== Current user handling =====
+    # Check role of current user
+    user = await get_board_member(board_id, user_id)
+
+    if not user:
+        raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
+
+    if user.role == "viewer":
+        raise HTTPException(status_code=403, detail="You cannot move stage in this board")
+
+    # ===== Business logic =====
+    stages = await KanbanStageModel.find({
+        "boardId": board_id
+    }).to_list()
+
+    stages_by_id = {str(stage.id): stage for stage in stages}
+
+    # New order must contain every stage of the board exactly once
+    if set(stage_ids) != set(stages_by_id):
+        raise HTTPException(status_code=400, detail="Stage IDs must match all stages of the board")
+
+    # Claim new version first: concurrent reorders with the same version get 409
+    new_version = await bump_stages_version(board_id, version)
+
+    if new_version is None:
+        raise HTTPException(status_code=409, detail="Stage order was changed, reload the board")
+
+    # Only stages with another position are written, all in one bulk write
+    operations = []
+
+    for index, stage_id in enumerate(stage_ids):
+        stage = stages_by_id[stage_id]
+        order = (index + 1) * RANK_STEP
+
+        if stage.order != order:
+            stage.order = order
+            operations.append(
+                UpdateOne({"_id": stage.id}, {"$set": {"order": order}})
+            )
+
+    if operations:
+        await KanbanStageModel.get_pymongo_collection().bulk_write(operations, ordered=False)
+
+    # Return new order
+    return KanbanStagesOrderSchema(
+        version=new_version,
+        items=[
+            KanbanStageSchema(
+                id=stage_id,
+                title=stages_by_id[stage_id].title,
+                order=stages_by_id[stage_id].order,
+                createdAt=stages_by_id[stage_id].createdAt
+            ) for stage_id in stage_ids
+        ]
+    )
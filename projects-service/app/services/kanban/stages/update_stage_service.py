@@ -2,9 +2,11 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import KanbanStageModel, KanbanBoardMemberModel
+from app.models import KanbanStageModel
 # Schemas
 from app.schemas.response.kanban.stages.kanban_stage_schema import KanbanStageSchema
+# Utils
+from app.utils.membership_cache import get_board_member
 
 async def update_stage(
     board_id: str,
@@ -45,10 +47,7 @@ async def update_stage(
     
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -3,9 +3,12 @@ from fastapi import HTTPException
 from bson import ObjectId
 from typing import Optional
 # Models
-from app.models import KanbanTaskModel, KanbanBoardMemberModel
+from app.models import KanbanTaskModel
 # Schemas
 from app.schemas.response.kanban.tasks.kanban_task_schema import KanbanTaskSchema
+# Utils
+from app.utils.order_rank import rank_between
+from app.utils.membership_cache import get_board_member
 
 # ==================================
 # Function create task
@@ -49,10 +52,7 @@ async def create_task(
     
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -73,14 +73,12 @@ async def create_task(
 
     # Find last task in stage
     last_task = await KanbanTaskModel.find({
+        "boardId": board_id,
         "stageId": stage_id
     }).sort("-order").first_or_none()
 
-    # If tasks not exist
-    if not last_task:
-        new_order = 1000.0
-    else:
-        new_order = last_task.order + 1000.0
+    # New task goes after the last one
+    new_order = rank_between(last_task.order if last_task else None, None)
 
     # Create task
     task = KanbanTaskModel(
@@ -2,7 +2,23 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import KanbanTaskModel, KanbanBoardMemberModel
+from app.models import KanbanTaskModel, KanbanStageModel
+# Schemas
+from app.schemas.response.kanban.tasks.kanban_task_schema import KanbanTaskSchema
+# Services
+from app.services.kanban.tasks.rebalance_tasks_service import (
+    rebalance_stage_tasks,
+    schedule_stage_rebalance
+)
+# Utils
+from app.utils.order_rank import rank_between, gap_too_small, REBALANCE_GAP
+from app.utils.membership_cache import get_board_member
+
+'''
+Task moves write only the moved task: it gets a fractional rank between its new
+neighbours (app/utils/order_rank.py). Neighbours are read with range / skip queries
+on the (boardId, stageId, order) index instead of loading the whole stage.
+'''
 
 
 # ==================================
@@ -38,10 +54,7 @@ async def move_task_in_stage(
     
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -50,46 +63,52 @@ async def move_task_in_stage(
         raise HTTPException(status_code=403, detail="You cant move tasks in stages in this board")
 
     # ===== Business logic =====
-    # Get all tasks sorted
-    tasks = await KanbanTaskModel.find(
-        KanbanTaskModel.stageId == stage_id
-    ).sort("order").to_list()
-
-    if not tasks:
-        raise HTTPException(status_code=404, detail="No tasks found")
-
-    # Find index of current task
-    task_index = None
-    for index, task in enumerate(tasks):
-        if str(task.id) == task_id:
-            task_index = index
-            break
-
-    if task_index is None:
+    # Get task
+    task = await KanbanTaskModel.find_one({
+        "_id": ObjectId(task_id),
+        "boardId": board_id,
+        "stageId": stage_id
+    })
+
+    if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    # Determine target index
+    # Two nearest tasks in move direction: the task goes between them
     if direction == "up":
-        if task_index == 0:
+        neighbours = await KanbanTaskModel.find({
+            "boardId": board_id,
+            "stageId": stage_id,
+            "order": {"$lt": task.order}
+        }).sort("-order").limit(2).to_list()
+
+        if not neighbours:
             return {"message": "Already at top"}
-        target_index = task_index - 1
-    elif direction == "down":
-        if task_index == len(tasks) - 1:
-            return {"message": "Already at bottom"}
-        target_index = task_index + 1
+
+        after = neighbours[0].order
+        before = neighbours[1].order if len(neighbours) > 1 else None
     else:
-        raise HTTPException(status_code=400, detail="Invalid direction")
+        neighbours = await KanbanTaskModel.find({
+            "boardId": board_id,
+            "stageId": stage_id,
+            "order": {"$gt": task.order}
+        }).sort("order").limit(2).to_list()
 
-    # Swap tasks
-    task = tasks[task_index]
-    target_task = tasks[target_index]
+        if not neighbours:
+            return {"message": "Already at bottom"}
+
+        before = neighbours[0].order
+        after = neighbours[1].order if len(neighbours) > 1 else None
+
+    # Ranks too dense for a midpoint: re-space stage, then swap places by rank
+    if gap_too_small(before, after):
+        await rebalance_stage_tasks(board_id, stage_id)
+        return await move_task_in_stage(task_id, stage_id, direction, user_id, board_id)
 
-    # Proper swap
-    task.order, target_task.order = target_task.order, task.order
+    # Save changes (only this task is written)
+    await task.set({KanbanTaskModel.order: rank_between(before, after)})
 
-    # Save changes
-    await task.save()
-    await target_task.save()
+    if gap_too_small(before, after, REBALANCE_GAP):
+        schedule_stage_rebalance(board_id, stage_id)
 
     return {"message": "Task in stage moved successfully"}
 
@@ -122,10 +141,7 @@ async def move_task_between_stages(
     
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -135,33 +151,156 @@ async def move_task_between_stages(
 
     # ===== Business logic =====
     # Get task
-    task = await KanbanTaskModel.find_one({"_id": ObjectId(task_id)})
+    task = await KanbanTaskModel.find_one({
+        "_id": ObjectId(task_id),
+        "boardId": board_id
+    })
 
     # Raise if task not found
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    # Get all target tasks
-    target_tasks = await KanbanTaskModel.find({
+    # First task of target stage: moved task goes on top of it
+    first_task = await KanbanTaskModel.find({
+        "boardId": board_id,
         "stageId": target_stage_id
-    }).sort("order").to_list()
+    }).sort("order").first_or_none()
 
-    min_order = 0
+    # Move task (only this task is written)
+    await task.set({
+        KanbanTaskModel.stageId: target_stage_id,
+        KanbanTaskModel.order: rank_between(None, first_task.order if first_task else None)
+    })
 
-    # Get min order
-    if target_tasks:
-        min_order = target_tasks[0].order
+    # Return response
+    return {"message": "Task moved between stages successfully"}
 
-        for t in target_tasks:
-            t.order += 1
-            await t.save()
-    
-    # Move task
-    task.stageId = target_stage_id
-    task.order = min_order
 
-    # Save changes
-    await task.save()
+# ==================================
+# Move task to position (drag and drop)
+# Parameters:
+# - task_id: The ID of the moved task
+# - target_stage_id: Stage where the task is dropped (same or other stage)
+# - index: Position in the target stage (0 = top), counted without the moved task
+# - user_id: The ID of the user
+# - board_id: The ID of the board
+# Returns:
+# - The moved task
+# ==================================
+async def move_task_to_position(
+    task_id: str,
+    target_stage_id: str,
+    index: int,
+    user_id: str,
+    board_id: str
+) -> KanbanTaskSchema:
 
-    # Return response
-    return {"message": "Task moved between stages successfully"}
\ No newline at end of file
+    # ===== Validation and error handling =====
+    if not task_id:
+        raise HTTPException(status_code=400, detail="Task ID is required")
+
+    if not target_stage_id:
+        raise HTTPException(status_code=400, detail="Target stage ID is required")
+
+    if not ObjectId.is_valid(task_id):
+        raise HTTPException(status_code=400, detail="Invalid task ID")
+
+    if not ObjectId.is_valid(target_stage_id):
+        raise HTTPException(status_code=400, detail="Invalid target stage ID")
+
+    if index < 0:
+        raise HTTPException(status_code=400, detail="Index must not be negative")
+
+    if not user_id:
+        raise HTTPException(status_code=400, detail="User ID is required")
+
+    # ===== Current user handling =====
+    # Check role of current user
+    user = await get_board_member(board_id, user_id)
+
+    if not user:
+        raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
+
+    if user.role == "viewer":
+        raise HTTPException(status_code=403, detail="You cant move tasks in this board")
+
+    # ===== Business logic =====
+    # Get task
+    task = await KanbanTaskModel.find_one({
+        "_id": ObjectId(task_id),
+        "boardId": board_id
+    })
+
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    # Target stage must be on the same board
+    stage = await KanbanStageModel.find_one({
+        "_id": ObjectId(target_stage_id),
+        "boardId": board_id
+    })
+
+    if not stage:
+        raise HTTPException(status_code=404, detail="Stage not found")
+
+    before, after = await _neighbour_ranks(task, target_stage_id, index, board_id)
+
+    # Ranks too dense for a midpoint: re-space stage first (rare)
+    if gap_too_small(before, after):
+        await rebalance_stage_tasks(board_id, target_stage_id)
+        before, after = await _neighbour_ranks(task, target_stage_id, index, board_id)
+
+    # Save changes (only this task is written)
+    await task.set({
+        KanbanTaskModel.stageId: target_stage_id,
+        KanbanTaskModel.order: rank_between(before, after)
+    })
+
+    if gap_too_small(before, after, REBALANCE_GAP):
+        schedule_stage_rebalance(board_id, target_stage_id)
+
+    # Return moved task
+    return KanbanTaskSchema(
+        id=str(task.id),
+        title=task.title,
+        description=task.description,
+        order=task.order,
+        stageId=task.stageId,
+        boardId=task.boardId
+    )
+
+
+# ==================================
+# Ranks of tasks around a position
+# Returns:
+# - (rank before, rank after), None where there is no neighbour
+# ==================================
+async def _neighbour_ranks(
+    task: KanbanTaskModel,
+    stage_id: str,
+    index: int,
+    board_id: str
+) -> tuple:
+
+    # Other tasks of the stage (moved task does not count in index)
+    query = {
+        "boardId": board_id,
+        "stageId": stage_id,
+        "_id": {"$ne": task.id}
+    }
+
+    if index == 0:
+        first = await KanbanTaskModel.find(query).sort("order").first_or_none()
+        return None, first.order if first else None
+
+    # Task at index - 1 and the one after it
+    neighbours = await KanbanTaskModel.find(query).sort("order").skip(index - 1).limit(2).to_list()
+
+    if not neighbours:
+        # Index past the end: drop at the bottom
+        last = await KanbanTaskModel.find(query).sort("-order").first_or_none()
+        return last.order if last else None, None
+
+    after = neighbours[1].order if len(neighbours) > 1 else None
+
+    return neighbours[0].order, after
@@ -0,0 +1,76 @@
+# Imports
+import asyncio
+import logging
+# Models
+from app.models import KanbanTaskModel
+# Utils
+from app.utils.order_renormalize import renormalize_orders
+
+'''
+Task rank rebalance
+
+Re-spaces the ranks of all tasks in one stage to RANK_STEP, RANK_STEP * 2, ...
+keeping their current order. Needed only when repeated midpoint inserts made
+a gap too small (see app/utils/order_rank.py). All updates go in one bulk write
+(app/utils/order_renormalize.py).
+'''
+
+logger = logging.getLogger(__name__)
+
+# Stages with a rebalance running / scheduled (one per stage at a time)
+_pending_stages: set[str] = set()
+# Strong references so running tasks are not garbage collected
+_rebalance_tasks: set[asyncio.Task] = set()
+
+
+# ==================================
+# Rebalance one stage
+# Parameters:
+# - board_id: The ID of the board
+# - stage_id: The ID of the stage
+# Returns:
+# - number of tasks holding their new rank (tasks moved meanwhile are skipped)
+# ==================================
+async def rebalance_stage_tasks(
+    board_id: str,
+    stage_id: str
+) -> int:
+
+    orders = await renormalize_orders(
+        KanbanTaskModel,
+        {"boardId": board_id, "stageId": stage_id}
+    )
+
+    return len(orders)
+
+
+# ==================================
+# Rebalance in background
+# Starts rebalance of the stage after the response,
+# unless one is already pending for this stage
+# ==================================
+async def _rebalance_in_background(
+    board_id: str,
+    stage_id: str
+) -> None:
+    try:
+        await rebalance_stage_tasks(board_id, stage_id)
+    except Exception:
+        # Not critical: next dense insert schedules it again
+        logger.exception("Task rank rebalance failed for stage %s", stage_id)
+    finally:
+        _pending_stages.discard(stage_id)
+
+
+def schedule_stage_rebalance(
+    board_id: str,
+    stage_id: str
+) -> None:
+    if stage_id in _pending_stages:
+        return
+
+    _pending_stages.add(stage_id)
+
+    task = asyncio.create_task(_rebalance_in_background(board_id, stage_id))
+    _rebalance_tasks.add(task)
+    task.add_done_callback(_rebalance_tasks.discard)
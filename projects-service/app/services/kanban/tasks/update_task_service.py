@@ -3,9 +3,11 @@ from fastapi import HTTPException
 from bson import ObjectId
 from typing import Optional
 # Models
-from app.models import KanbanTaskModel, KanbanBoardMemberModel
+from app.models import KanbanTaskModel
 # Schemas
 from app.schemas.response.kanban.tasks.kanban_task_schema import KanbanTaskSchema
+# Utils
+from app.utils.membership_cache import get_board_member
 
 
 # Function update task
@@ -38,10 +40,7 @@ async def update_task(
     
     # ===== Current user handling =====
     # Check role of current user
-    user = await KanbanBoardMemberModel.find_one({
-        "boardId": board_id,
-        "userId": user_id,
-    })
+    user = await get_board_member(board_id, user_id)
     # Raise if user not found
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this board or this board does not exist")
@@ -4,6 +4,8 @@ from bson import ObjectId
 
 # Models
 from app.models import WorkspaceProjectMemberModel, WorkspaceProjectModel
+# Utils
+from app.utils.membership_cache import get_project_member, invalidate_project_member
 
 # ==================================================
 # Function add project member
@@ -64,15 +66,13 @@ async def add_project_member(
         )
 
         await project_member.save()
+        invalidate_project_member(project_id, user_id)
 
         return project_member
 
     # ================= VERIFY CREATOR =================
 
-    creator = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id_creator
-    })
+    creator = await get_project_member(project_id, user_id_creator)
 
     if not creator:
         raise HTTPException(
@@ -133,6 +133,7 @@ async def add_project_member(
     )
 
     await project_member.save()
+    invalidate_project_member(project_id, user_id)
 
     return {
         "message": "Project member created successfully"
@@ -6,6 +6,8 @@ from bson import ObjectId
 from app.models import WorkspaceProjectMemberModel
 
 from app.services.workspace.selected_project.set_selected_project_service import clear_selected_project_service
+# Utils
+from app.utils.membership_cache import get_project_member, invalidate_project_member
 
 # =================================================
 # Delete or leave project member
@@ -29,10 +31,7 @@ async def delete_project_member(
         raise HTTPException(status_code=400, detail="Invalid project ID")
 
     # ================= FETCH REQUESTER =================
-    requester = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id_requester
-    })
+    requester = await get_project_member(project_id, user_id_requester)
 
     if not requester:
         raise HTTPException(status_code=403, detail="You are not a member of this project")
@@ -51,6 +50,7 @@ async def delete_project_member(
             "projectId": project_id,
             "userId": user_id
         }).delete()
+        invalidate_project_member(project_id, user_id)
 
         # Clear selected project
         await clear_selected_project_service(user_id)
@@ -91,5 +91,6 @@ async def delete_project_member(
 
     # ================= DELETE =================
     await member_to_delete.delete()
+    invalidate_project_member(project_id, user_id)
 
     return {"message": "Project member removed successfully"}
\ No newline at end of file
@@ -11,6 +11,8 @@ from app.schemas.response.workspaces.members.workspace_members_paginated import
     WorkspaceProjectMembersPaginatedSchema,
     PaginationMetaSchema
 )
+# Utils
+from app.utils.membership_cache import get_project_member
 
 
 # ==========================================
@@ -45,10 +47,7 @@ async def get_all_project_members(
 
     # ================= PERMISSION CHECK =================
 
-    current_user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id
-    })
+    current_user = await get_project_member(project_id, user_id)
 
     if not current_user:
         raise HTTPException(
@@ -1,10 +1,10 @@
 # Imports
 from fastapi import HTTPException
 from bson import ObjectId
-# Models
-from app.models import WorkspaceProjectMemberModel
 # Schemas
 from app.schemas.response.workspaces.members.workspace_member import WorkspaceProjectMemberSchema
+# Utils
+from app.utils.membership_cache import get_project_member
 
 # ==========================================
 # Get current user
@@ -25,10 +25,7 @@ async def get_current_user(
     if not ObjectId.is_valid(project_id):
         raise HTTPException(status_code=400, detail="Invalid project ID")
 
-    project_member = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id
-    })
+    project_member = await get_project_member(project_id, user_id)
 
     if not project_member:
         raise HTTPException(status_code=404, detail="Project member not found")
@@ -7,6 +7,8 @@ from app.models import WorkspaceProjectMemberModel
 
 # Schemas
 from app.schemas.response.workspaces.members.workspace_member import WorkspaceProjectMemberSchema
+# Utils
+from app.utils.membership_cache import get_project_member, invalidate_project_member
 
 
 # =================================================
@@ -42,10 +44,7 @@ async def update_project_member_role(
 
     # ================= VERIFY CREATOR =================
 
-    creator = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id_creator
-    })
+    creator = await get_project_member(project_id, user_id_creator)
 
     if not creator:
         raise HTTPException(
@@ -92,6 +91,7 @@ async def update_project_member_role(
 
     project_member.role = role
     await project_member.save()
+    invalidate_project_member(project_id, user_id)
 
     return WorkspaceProjectMemberSchema(
         projectId=project_member.projectId,
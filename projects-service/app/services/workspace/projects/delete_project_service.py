@@ -8,6 +8,8 @@ from app.models import (
     WorkspaceProjectMemberModel,
     WorkspaceTaskModel
 )
+# Utils
+from app.utils.membership_cache import invalidate_project_member
 
 async def delete_project(project_id: str, user_id: str) -> dict:
 
@@ -43,6 +45,7 @@ async def delete_project(project_id: str, user_id: str) -> dict:
     await WorkspaceProjectMemberModel.find({
         "projectId": project_id
     }).delete()
+    invalidate_project_member(project_id)
 
     # Delete all tasks
     await WorkspaceTaskModel.find({
@@ -1,6 +1,8 @@
 # Imports
 from bson import ObjectId
-from app.models import WorkspaceTaskModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceTaskModel
+# Utils
+from app.utils.membership_cache import get_project_member
 
 async def get_project_tasks_stats(
     project_id: str,
@@ -16,10 +18,7 @@ async def get_project_tasks_stats(
         }
 
     # Access check
-    user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user = await get_project_member(project_id, user_id)
 
     if not user:
         return {
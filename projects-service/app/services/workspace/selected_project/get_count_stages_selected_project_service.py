@@ -1,6 +1,8 @@
 # Imports
 from bson import ObjectId
-from app.models import WorkspaceStageModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceStageModel
+# Utils
+from app.utils.membership_cache import get_project_member
 
 async def get_stages_count(
     project_id: str,
@@ -10,10 +12,7 @@ async def get_stages_count(
         return None
 
     # Access check
-    user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user = await get_project_member(project_id, user_id)
 
     if not user:
         return None
@@ -33,10 +32,7 @@ async def get_stages_date_range(
         return {"startDate": "", "endDate": ""}
 
     # Access check
-    user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user = await get_project_member(project_id, user_id)
 
     if not user:
         return {"startDate": "", "endDate": ""}
@@ -2,10 +2,12 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import WorkspaceStageModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceStageModel
 # Schemas
 from app.schemas.response.workspaces.stages.workspace_stage_schema import WorkspaceStageSchema
 from app.schemas.response.workspaces.stages.workspace_stage_get_all_schema import WorkspaceGetAllStagesSchema
+# Utils
+from app.utils.membership_cache import get_project_member
 
 # =========================
 # Get all workspace stages
@@ -25,10 +27,7 @@ async def get_all_stages(
 
     # ===== Current user handling =====
     # Check role of current user
-    user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user = await get_project_member(project_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this workspace or this workspace does not exist")
@@ -5,7 +5,7 @@ from typing import Optional
 from datetime import datetime
 
 # Models
-from app.models import WorkspaceStageModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceStageModel
 
 # Schemas
 from app.schemas.response.workspaces.stages.workspace_stage_schema import WorkspaceStageSchema
@@ -13,6 +13,8 @@ from app.schemas.response.workspaces.stages.workspace_stage_schema import Worksp
 # Utils
 from app.utils.time_converter import convert_to_datetime
 from app.utils.current_date import get_current_date  # auto datetime
+from app.utils.membership_cache import get_project_member
+from app.utils.order_renormalize import ReferenceNotFoundError, relative_order
 
 async def insert_stage_relative(
     project_id: str,
@@ -44,10 +46,7 @@ async def insert_stage_relative(
         raise HTTPException(status_code=400, detail="Position must be 'before' or 'after'")
 
     # ===== Access check =====
-    user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user = await get_project_member(project_id, user_id)
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this project")
     if user.role == "viewer":
@@ -70,19 +69,16 @@ async def insert_stage_relative(
         raise HTTPException(status_code=404, detail="Reference stage not found")
 
     # ===== Calculate order =====
-    if position == "after":
-        next_stage = await WorkspaceStageModel.find({
-            "projectId": project_id,
-            "order": {"$gt": reference_stage.order}
-        }).sort("order").first_or_none()
-        new_order = (next_stage.order + reference_stage.order) / 2 if next_stage else reference_stage.order + 1000.0
-
-    elif position == "before":
-        prev_stage = await WorkspaceStageModel.find({
-            "projectId": project_id,
-            "order": {"$lt": reference_stage.order}
-        }).sort("-order").first_or_none()
-        new_order = (prev_stage.order + reference_stage.order) / 2 if prev_stage else reference_stage.order - 1000.0
+    # Project orders are renormalized first on collision / too small gap
+    try:
+        new_order = await relative_order(
+            WorkspaceStageModel,
+            {"projectId": project_id},
+            reference_stage,
+            position
+        )
+    except ReferenceNotFoundError:
+        raise HTTPException(status_code=404, detail="Reference stage not found")
 
     # ===== Handle dates =====
     if created_at:
@@ -2,7 +2,9 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import WorkspaceStageModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceStageModel
+# Utils
+from app.utils.membership_cache import get_project_member
 
 # ===================================
 # Move a workspace stage in the DB
@@ -32,10 +34,7 @@ async def move_stage(
         raise HTTPException(status_code=400, detail="Invalid stage ID")
 
     # Check current user
-    user =  await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user =  await get_project_member(project_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this project")
@@ -5,7 +5,7 @@ from typing import Optional
 from datetime import datetime
 
 # Models
-from app.models import WorkspaceStageModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceStageModel
 
 # Schemas
 from app.schemas.response.workspaces.stages.workspace_stage_schema import WorkspaceStageSchema
@@ -13,6 +13,7 @@ from app.schemas.response.workspaces.stages.workspace_stage_schema import Worksp
 # Utils
 from app.utils.time_converter import convert_to_datetime
 from app.utils.current_date import get_current_date  # auto datetime
+from app.utils.membership_cache import get_project_member
 
 # =========================
 # Create a new workspace stage
@@ -27,10 +28,7 @@ async def create_stage(
 ) -> WorkspaceStageSchema:
     
     # ===== Access check =====
-    user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user = await get_project_member(project_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this project")
@@ -5,8 +5,9 @@ from typing import Optional
 # Utils
 from app.utils.time_converter import convert_to_datetime
 from app.utils.current_date import get_current_date
+from app.utils.membership_cache import get_project_member
 # Models
-from app.models import WorkspaceTaskModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceTaskModel
 # Schemas
 from app.schemas.response.workspaces.tasks.workspace_task_schema import WorkspaceTaskSchema
 from app.schemas.data.workspace.tasks.workspace_create_task_schema import WorkspaceCreateTaskSchema
@@ -18,10 +19,7 @@ async def create_task(
 ) -> WorkspaceTaskSchema:
     
     # ===== Access check =====
-    user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": task_data.projectId,
-        "userId": user_id,
-    })
+    user = await get_project_member(task_data.projectId, user_id)
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this project")
     if user.role == "viewer":
@@ -2,7 +2,9 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import WorkspaceTaskModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceTaskModel
+# Utils
+from app.utils.membership_cache import get_project_member
 
 
 # ===============================
@@ -17,10 +19,7 @@ async def delete_task(
     # ===== Validation and error handling =====
 
     # Check current user
-    user =  await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user =  await get_project_member(project_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this project")
@@ -2,10 +2,12 @@
 from fastapi import HTTPException
 from bson import ObjectId
 # Models
-from app.models import WorkspaceTaskModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceTaskModel
 # Schemas
 from app.schemas.response.workspaces.tasks.workspace_task_list_schema import WorkspaceTaskListSchema
 from app.schemas.response.workspaces.tasks.workspace_task_schema import WorkspaceTaskSchema
+# Utils
+from app.utils.membership_cache import get_project_member
 
 async def get_all_tasks(
     project_id: str,
@@ -16,10 +18,7 @@ async def get_all_tasks(
     # ===== Validation and error handling =====
 
     # Check current user
-    user =  await WorkspaceProjectMemberModel.find_one({
-        "projectId": project_id,
-        "userId": user_id,
-    })
+    user =  await get_project_member(project_id, user_id)
 
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this project")
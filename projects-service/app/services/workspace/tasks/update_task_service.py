@@ -4,8 +4,9 @@ from bson import ObjectId
 from typing import Optional
 # Utils
 from app.utils.time_converter import convert_to_datetime
+from app.utils.membership_cache import get_project_member
 # Models
-from app.models import WorkspaceTaskModel, WorkspaceProjectMemberModel
+from app.models import WorkspaceTaskModel
 # Schemas
 from app.schemas.response.workspaces.tasks.workspace_task_schema import WorkspaceTaskSchema
 from app.schemas.data.workspace.tasks.workspace_update_task_schema import WorkspaceUpdateTaskSchema
@@ -17,10 +18,7 @@ async def update_task(
 ) -> WorkspaceTaskSchema:
     
     # ===== Access check =====
-    user = await WorkspaceProjectMemberModel.find_one({
-        "projectId": data.projectId,
-        "userId": user_id,
-    })
+    user = await get_project_member(data.projectId, user_id)
     if not user:
         raise HTTPException(status_code=403, detail="You are not member of this project")
     if user.role == "viewer":
@@ -0,0 +1,156 @@
+# =========================
+# In-memory collection for service tests
+# =========================
+
+# Imports
+from typing import Optional
+from pymongo import ReturnDocument
+
+'''
+Small stand-in for a MongoDB collection, enough for the order / rank services:
+
+- filters: equality, $in, $ne, $gte, $lte
+- find (+ sort, async iteration), find_one, find_one_and_update ($inc / $set)
+- bulk_write with UpdateOne ($set)
+- Beanie queries of a bound model: find(...).sort(...).first_or_none() / to_list(),
+  find_one(...)
+
+on_bulk_write(documents) runs before a bulk write is applied: tests use it to change
+documents between the read and the write, like a concurrent request would.
+'''
+
+_OPERATORS = {
+    "$in": lambda value, argument: value in argument,
+    "$ne": lambda value, argument: value != argument,
+    "$gte": lambda value, argument: value is not None and value >= argument,
+    "$lte": lambda value, argument: value is not None and value <= argument,
+}
+
+
+def _match_value(value, condition) -> bool:
+    if isinstance(condition, dict):
+        return all(_OPERATORS[operator](value, argument) for operator, argument in condition.items())
+
+    return value == condition
+
+
+def matches(document: dict, query: dict) -> bool:
+    return all(_match_value(document.get(field), value) for field, value in query.items())
+
+
+def _sorted(documents: list, keys: list[tuple[str, int]], get) -> list:
+    for field, direction in reversed(keys):
+        documents = sorted(documents, key=lambda document: get(document, field), reverse=direction < 0)
+    return documents
+
+
+# =========================
+# PyMongo side
+# =========================
+class InMemoryCursor:
+    def __init__(self, documents: list[dict]):
+        self._documents = documents
+
+    def sort(self, keys: list[tuple[str, int]]):
+        self._documents = _sorted(self._documents, keys, lambda document, field: document.get(field))
+        return self
+
+    def __aiter__(self):
+        self._iterator = iter(self._documents)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class InMemoryCollection:
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+        self.operations = []
+        self.on_bulk_write = None
+
+    def _project(self, document: dict, projection: Optional[dict]) -> dict:
+        if not projection:
+            return dict(document)
+
+        fields = {"_id", *projection}
+        return {field: document[field] for field in fields if field in document}
+
+    def find(self, query: dict, projection: Optional[dict] = None) -> InMemoryCursor:
+        return InMemoryCursor([
+            self._project(document, projection)
+            for document in self.documents if matches(document, query)
+        ])
+
+    async def find_one(self, query: dict, projection: Optional[dict] = None) -> Optional[dict]:
+        for document in self.documents:
+            if matches(document, query):
+                return self._project(document, projection)
+        return None
+
+    async def find_one_and_update(self, query: dict, update: dict, projection=None, return_document=ReturnDocument.BEFORE):
+        for document in self.documents:
+            if matches(document, query):
+                before = self._project(document, projection)
+
+                for field, amount in update.get("$inc", {}).items():
+                    document[field] = (document.get(field) or 0) + amount
+                document.update(update.get("$set", {}))
+
+                return self._project(document, projection) if return_document == ReturnDocument.AFTER else before
+        return None
+
+    async def bulk_write(self, operations, ordered: bool = True):
+        if self.on_bulk_write:
+            self.on_bulk_write(self.documents)
+
+        self.operations.extend(operations)
+
+        for operation in operations:
+            for document in self.documents:
+                if matches(document, operation._filter):
+                    document.update(operation._doc["$set"])
+
+
+# =========================
+# Beanie side
+# =========================
+class InMemoryQuery:
+    def __init__(self, model, collection: InMemoryCollection, query: dict):
+        self._model = model
+        self._documents = [document for document in collection.documents if matches(document, query)]
+
+    def sort(self, keys: list[tuple[str, int]]):
+        self._documents = _sorted(self._documents, keys, lambda document, field: document.get(field))
+        return self
+
+    def _build(self, document: dict):
+        fields = {key: value for key, value in document.items() if key != "_id"}
+        return self._model.model_construct(id=document["_id"], **fields)
+
+    async def first_or_none(self):
+        return self._build(self._documents[0]) if self._documents else None
+
+    async def to_list(self):
+        return [self._build(document) for document in self._documents]
+
+
+def bind_model(model, documents: list[dict], monkeypatch) -> InMemoryCollection:
+    """
+    Serves model.get_pymongo_collection(), model.find() and model.find_one()
+    from an in-memory collection (documents are plain dicts with "_id").
+    """
+    collection = InMemoryCollection(documents)
+
+    monkeypatch.setattr(model, "get_pymongo_collection", classmethod(lambda cls: collection))
+    monkeypatch.setattr(model, "find", classmethod(lambda cls, query: InMemoryQuery(cls, collection, query)))
+
+    async def find_one(cls, query: dict):
+        return await InMemoryQuery(cls, collection, query).first_or_none()
+
+    monkeypatch.setattr(model, "find_one", classmethod(find_one))
+
+    return collection
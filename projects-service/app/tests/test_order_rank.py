@@ -0,0 +1,120 @@
+# =========================
+# Order rank / renormalization tests
+# =========================
+
+# Imports
+import asyncio
+from bson import ObjectId
+# Models
+from app.models import KanbanTaskModel
+# Services
+from app.services.kanban.tasks.rebalance_tasks_service import rebalance_stage_tasks
+# Utils
+from app.utils.order_rank import RANK_STEP, REBALANCE_GAP, MIN_RANK_GAP, rank_between, gap_too_small
+# Tests
+from app.tests.in_memory_collection import InMemoryCollection, bind_model
+
+'''
+Run: python -m pytest app/tests (from projects-service)
+
+The rebalance path runs against the in-memory collection
+(app/tests/in_memory_collection.py), no MongoDB needed.
+'''
+
+
+def _stage(documents: list[dict], monkeypatch) -> InMemoryCollection:
+    return bind_model(KanbanTaskModel, documents, monkeypatch)
+
+
+def _task(order: float, stage_id: str = "s1") -> dict:
+    return {"_id": ObjectId(), "boardId": "b1", "stageId": stage_id, "order": order}
+
+
+# =========================
+# rank_between / gap_too_small
+# =========================
+def test_rank_between_empty_list():
+    assert rank_between(None, None) == RANK_STEP
+
+
+def test_rank_between_ends():
+    assert rank_between(None, 500.0) == 500.0 - RANK_STEP
+    assert rank_between(500.0, None) == 500.0 + RANK_STEP
+
+
+def test_rank_between_midpoint():
+    assert rank_between(1000.0, 2000.0) == 1500.0
+    assert 1000.0 < rank_between(1000.0, 1000.0 + 2 * MIN_RANK_GAP) < 1000.0 + 2 * MIN_RANK_GAP
+
+
+def test_gap_too_small():
+    assert not gap_too_small(None, 1000.0)
+    assert not gap_too_small(1000.0, None)
+    assert not gap_too_small(1000.0, 2000.0, REBALANCE_GAP)
+    assert gap_too_small(1000.0, 1000.0)
+    assert gap_too_small(1000.0, 1000.0 + REBALANCE_GAP / 2, REBALANCE_GAP)
+    assert not gap_too_small(1000.0, 1000.0 + REBALANCE_GAP / 2)
+
+
+def test_repeated_midpoints_reach_rebalance_gap():
+    before, after = RANK_STEP, 2 * RANK_STEP
+    inserts = 0
+
+    while not gap_too_small(before, after, REBALANCE_GAP):
+        after = rank_between(before, after)
+        inserts += 1
+
+    assert 15 < inserts < 25
+    assert not gap_too_small(before, after)
+
+
+# =========================
+# Rebalance path
+# =========================
+def test_rebalance_respaces_stage_in_order(monkeypatch):
+    tasks = [_task(5.0), _task(5.0 + 1e-12), _task(5.0 + 1e-12), _task(7.0), _task(1.0, "s2")]
+    collection = _stage(tasks, monkeypatch)
+
+    count = asyncio.run(rebalance_stage_tasks("b1", "s1"))
+
+    assert count == 4
+    stage = sorted((task for task in tasks if task["stageId"] == "s1"), key=lambda task: task["order"])
+    assert [task["order"] for task in stage] == [RANK_STEP, 2 * RANK_STEP, 3 * RANK_STEP, 4 * RANK_STEP]
+    assert stage[0] is tasks[0] and stage[3] is tasks[3]
+    # Other stages are not touched
+    assert tasks[4]["order"] == 1.0
+    assert len(collection.operations) == 4
+
+
+def test_rebalance_skips_tasks_already_in_place(monkeypatch):
+    tasks = [_task(RANK_STEP), _task(RANK_STEP + 1e-6), _task(3 * RANK_STEP)]
+    collection = _stage(tasks, monkeypatch)
+
+    asyncio.run(rebalance_stage_tasks("b1", "s1"))
+
+    assert [task["order"] for task in tasks] == [RANK_STEP, 2 * RANK_STEP, 3 * RANK_STEP]
+    assert len(collection.operations) == 1
+
+
+def test_rebalance_keeps_concurrent_moves(monkeypatch):
+    tasks = [_task(1.0), _task(2.0), _task(3.0)]
+    collection = _stage(tasks, monkeypatch)
+
+    def move_between_read_and_write(documents):
+        # Task moved to another stage and another task moved to the top of the stage
+        documents[0].update(stageId="s2", order=RANK_STEP)
+        documents[2]["order"] = 0.5
+
+    collection.on_bulk_write = move_between_read_and_write
+
+    count = asyncio.run(rebalance_stage_tasks("b1", "s1"))
+
+    # Only the task that still had the order that was read got its new rank
+    assert count == 1
+
+    assert tasks[0]["stageId"] == "s2" and tasks[0]["order"] == RANK_STEP
+    assert tasks[1]["order"] == 2 * RANK_STEP
+    assert tasks[2]["order"] == 0.5
+    # Every update is conditional on the list and the order that was read
+    for operation in collection.operations:
+        assert set(operation._filter) == {"boardId", "stageId", "_id", "order"}
@@ -0,0 +1,140 @@
+# =========================
+# Stage reorder / relative insert tests
+# =========================
+
+# Imports
+import asyncio
+import pytest
+from types import SimpleNamespace
+from bson import ObjectId
+from fastapi import HTTPException
+# Models
+from app.models import KanbanBoardModel, KanbanStageModel
+# Services
+from app.services.kanban.stages import insert_stage_relative_service, reorder_stages_service
+# Utils
+from app.utils.order_rank import RANK_STEP
+from app.utils.order_renormalize import relative_order
+# Tests
+from app.tests.in_memory_collection import InMemoryCollection, bind_model
+
+'''
+Run: python -m pytest app/tests (from projects-service)
+
+Stages and boards live in the in-memory collection (app/tests/in_memory_collection.py),
+the current user is an editor of the board.
+'''
+
+BOARD_ID = str(ObjectId())
+
+
+def _board(monkeypatch, orders: list[float], version: int = 3) -> tuple[list[dict], InMemoryCollection, list[dict]]:
+    """
+    Binds a board with stages at the given orders (ObjectIds in list order).
+    Returns board documents, stages collection and stage documents.
+    """
+    boards = [{"_id": ObjectId(BOARD_ID), "userId": "u1", "title": "Board", "stagesVersion": version}]
+    stages = [
+        {"_id": ObjectId(), "boardId": BOARD_ID, "title": f"Stage {index}", "order": order}
+        for index, order in enumerate(orders)
+    ]
+
+    bind_model(KanbanBoardModel, boards, monkeypatch)
+    collection = bind_model(KanbanStageModel, stages, monkeypatch)
+
+    async def editor(board_id, user_id):
+        return SimpleNamespace(role="editor")
+
+    for module in (reorder_stages_service, insert_stage_relative_service):
+        monkeypatch.setattr(module, "get_board_member", editor)
+
+    return boards, collection, stages
+
+
+def _ids(stages: list[dict], *positions: int) -> list[str]:
+    return [str(stages[position]["_id"]) for position in positions]
+
+
+def _reorder(stage_ids: list[str], version=None):
+    return asyncio.run(reorder_stages_service.reorder_stages(BOARD_ID, stage_ids, "u1", version))
+
+
+# =========================
+# Reorder
+# =========================
+def test_reorder_requires_every_stage_once(monkeypatch):
+    _, collection, stages = _board(monkeypatch, [1000.0, 2000.0, 3000.0])
+
+    for stage_ids in (_ids(stages, 0, 1), _ids(stages, 0, 1, 2) + [str(ObjectId())]):
+        with pytest.raises(HTTPException) as error:
+            _reorder(stage_ids)
+
+        assert error.value.status_code == 400
+
+    with pytest.raises(HTTPException) as error:
+        _reorder(_ids(stages, 0, 0, 1))
+
+    assert error.value.status_code == 400
+    assert collection.operations == []
+
+
+def test_reorder_stale_version_conflicts(monkeypatch):
+    boards, collection, stages = _board(monkeypatch, [1000.0, 2000.0, 3000.0], version=3)
+
+    with pytest.raises(HTTPException) as error:
+        _reorder(_ids(stages, 2, 1, 0), version=2)
+
+    assert error.value.status_code == 409
+    assert boards[0]["stagesVersion"] == 3
+    assert collection.operations == []
+
+
+def test_reorder_writes_only_moved_stages(monkeypatch):
+    boards, collection, stages = _board(monkeypatch, [1000.0, 2000.0, 3000.0], version=3)
+
+    result = _reorder(_ids(stages, 1, 0, 2), version=3)
+
+    assert result.version == 4 and boards[0]["stagesVersion"] == 4
+    assert [item.id for item in result.items] == _ids(stages, 1, 0, 2)
+    assert [stage["order"] for stage in stages] == [2 * RANK_STEP, RANK_STEP, 3 * RANK_STEP]
+    # Third stage kept its position: not written
+    assert {operation._filter["_id"] for operation in collection.operations} == {stages[0]["_id"], stages[1]["_id"]}
+
+
+# =========================
+# Relative insert
+# =========================
+def test_relative_order_renormalizes_collision_and_retries(monkeypatch):
+    _, _, stages = _board(monkeypatch, [1000.0, 1000.0, 3000.0])
+    renormalized = []
+
+    async def on_renormalize():
+        renormalized.append(True)
+
+    reference = asyncio.run(KanbanStageModel.find_one({"_id": stages[0]["_id"]}))
+    order = asyncio.run(relative_order(
+        KanbanStageModel, {"boardId": BOARD_ID}, reference, "after", on_renormalize
+    ))
+
+    assert renormalized == [True]
+    assert [stage["order"] for stage in stages] == [RANK_STEP, 2 * RANK_STEP, 3 * RANK_STEP]
+    assert order == 1.5 * RANK_STEP
+
+
+def test_relative_insert_deleted_reference_is_not_found(monkeypatch):
+    boards, collection, stages = _board(monkeypatch, [1000.0, 1000.0, 3000.0])
+    reference_id = stages[0]["_id"]
+
+    def delete_reference(documents):
+        documents[:] = [document for document in documents if document["_id"] != reference_id]
+
+    collection.on_bulk_write = delete_reference
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(insert_stage_relative_service.insert_stage_relative(
+            BOARD_ID, "New stage", str(reference_id), "after", "u1"
+        ))
+
+    assert error.value.status_code == 404
+    # The renormalization itself changed the stage order version
+    assert boards[0]["stagesVersion"] == 4
@@ -0,0 +1,226 @@
+# =========================
+# Membership cache
+# =========================
+
+# Imports
+from collections import OrderedDict
+from typing import Optional
+from dotenv import load_dotenv
+from pymongo.errors import PyMongoError
+import asyncio
+import logging
+import time
+import os
+# Models
+from app.models import KanbanBoardMemberModel, WorkspaceProjectMemberModel
+
+'''
+Shared membership resolver for authorization checks.
+
+Almost every kanban / workspace service starts by reading the current user's
+member document (board or project + user). Results are cached in process
+(TTL + LRU) by (kind, container ID, user ID), also "not a member" results.
+
+Consistency:
+- member add / update / delete, board / project create and delete invalidate
+  the entries they change (this worker)
+- other workers: MEMBERSHIP_CACHE_SYNC=true watches the member collections
+  (MongoDB change streams, needs a replica set) and invalidates on every change;
+  without it entries of other workers expire after MEMBERSHIP_CACHE_TTL seconds
+
+Returned members are copies, changes to them are not saved in the cache.
+'''
+
+load_dotenv()
+
+MEMBERSHIP_CACHE_TTL = float(os.getenv("MEMBERSHIP_CACHE_TTL", "30"))
+MEMBERSHIP_CACHE_SIZE = int(os.getenv("MEMBERSHIP_CACHE_SIZE", "10000"))
+MEMBERSHIP_CACHE_SYNC = os.getenv("MEMBERSHIP_CACHE_SYNC", "false").lower() == "true"
+
+BOARD = "board"
+PROJECT = "project"
+
+# kind -> (member model, container field)
+_SOURCES = {
+    BOARD: (KanbanBoardMemberModel, "boardId"),
+    PROJECT: (WorkspaceProjectMemberModel, "projectId"),
+}
+
+_MISS = object()
+
+logger = logging.getLogger(__name__)
+
+
+# =========================
+# TTL / LRU cache
+# =========================
+class MembershipCache:
+    """
+    Members by (kind, container ID, user ID), least recently used dropped first.
+
+    Attributes:
+    - ttl (float): Seconds an entry is valid
+    - max_size (int): Max entries
+    - hits / misses (int): Lookups served from / not found in the cache
+    - generation (int): Grows on every invalidation; a lookup started before
+      an invalidation does not store its (maybe old) result
+    """
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: tuple) -> object:
+        """
+        Returns cached member (None = not a member) or _MISS.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return _MISS
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: tuple, member, generation: int) -> None:
+        if generation != self.generation or self.ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, member)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, container_id: str, user_id: Optional[str] = None) -> None:
+        """
+        Drops one member, or every member of the container when user_id is None.
+        """
+        self.generation += 1
+
+        if user_id is not None:
+            self._entries.pop((kind, container_id, user_id), None)
+            return
+
+        for key in [key for key in self._entries if key[0] == kind and key[1] == container_id]:
+            del self._entries[key]
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        self.generation += 1
+
+        if kind is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == kind]:
+            del self._entries[key]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+membership_cache = MembershipCache(MEMBERSHIP_CACHE_TTL, MEMBERSHIP_CACHE_SIZE)
+
+
+# =========================
+# Resolvers
+# =========================
+async def _get_member(kind: str, container_id: str, user_id: str):
+    key = (kind, container_id, user_id)
+
+    member = membership_cache.get(key)
+
+    if member is _MISS:
+        generation = membership_cache.generation
+        model, field = _SOURCES[kind]
+
+        member = await model.find_one({field: container_id, "userId": user_id})
+        membership_cache.set(key, member, generation)
+
+    return member.model_copy() if member else None
+
+
+async def get_board_member(board_id: str, user_id: str) -> Optional[KanbanBoardMemberModel]:
+    """
+    Board member of the user, None when the user is not a member.
+    """
+    return await _get_member(BOARD, board_id, user_id)
+
+
+async def get_project_member(project_id: str, user_id: str) -> Optional[WorkspaceProjectMemberModel]:
+    """
+    Project member of the user, None when the user is not a member.
+    """
+    return await _get_member(PROJECT, project_id, user_id)
+
+
+def invalidate_board_member(board_id: str, user_id: Optional[str] = None) -> None:
+    """
+    Call after a board member (user_id) or the whole board changed.
+    """
+    membership_cache.invalidate(BOARD, board_id, user_id)
+
+
+def invalidate_project_member(project_id: str, user_id: Optional[str] = None) -> None:
+    """
+    Call after a project member (user_id) or the whole project changed.
+    """
+    membership_cache.invalidate(PROJECT, project_id, user_id)
+
+
+def membership_cache_stats() -> dict:
+    return membership_cache.stats()
+
+
+# =========================
+# Sync between workers (change streams)
+# =========================
+async def _watch_members(kind: str) -> None:
+    """
+    Invalidates members changed by any worker. Deleted documents carry only
+    their _id, so a delete clears all cached members of that kind.
+    """
+    model, field = _SOURCES[kind]
+    collection = model.get_pymongo_collection()
+
+    while True:
+        try:
+            async with await collection.watch(full_document="updateLookup") as stream:
+                async for change in stream:
+                    document = change.get("fullDocument")
+
+                    if document:
+                        membership_cache.invalidate(kind, document.get(field), document.get("userId"))
+                    else:
+                        membership_cache.clear(kind)
+
+        except asyncio.CancelledError:
+            raise
+
+        except PyMongoError:
+            # Changes may be missed while disconnected
+            logger.exception("Membership change stream failed, retrying")
+            membership_cache.clear(kind)
+            await asyncio.sleep(5)
+
+
+def start_membership_sync() -> list[asyncio.Task]:
+    """
+    Starts change stream watchers when MEMBERSHIP_CACHE_SYNC is enabled.
+    """
+    if not MEMBERSHIP_CACHE_SYNC:
+        return []
+
+    return [asyncio.create_task(_watch_members(kind)) for kind in _SOURCES]
@@ -0,0 +1,47 @@
+# Imports
+import asyncio
+# Database
+from app.dependencies.database import init_db
+# Models
+from app.models import KanbanTaskModel
+# Services
+from app.services.kanban.tasks.rebalance_tasks_service import rebalance_stage_tasks
+
+'''
+One-off migration of existing kanban tasks to fractional ranks.
+
+Older task moves stored small integer orders (0, 1, 2 ... after a move between
+stages) mixed with 1000.0 steps. Every stage is re-spaced to RANK_STEP, keeping
+the current task order, so midpoint inserts have room. Safe to run again.
+
+    python -m app.utils.migrate_task_ranks
+'''
+
+
+# ==================================
+# Migrate all stages
+# Returns:
+# - (stages, tasks) re-spaced
+# ==================================
+async def migrate_task_ranks() -> tuple[int, int]:
+
+    await init_db()
+
+    collection = KanbanTaskModel.get_pymongo_collection()
+
+    # Every (board, stage) pair that has tasks
+    cursor = await collection.aggregate([
+        {"$group": {"_id": {"boardId": "$boardId", "stageId": "$stageId"}}}
+    ])
+    stages = [document["_id"] async for document in cursor]
+
+    tasks = 0
+    for stage in stages:
+        tasks += await rebalance_stage_tasks(stage["boardId"], stage["stageId"])
+
+    return len(stages), tasks
+
+
+if __name__ == "__main__":
+    stages, tasks = asyncio.run(migrate_task_ranks())
+    print(f"Task ranks migrated: {tasks} tasks in {stages} stages")
@@ -0,0 +1,62 @@
+# Imports
+from typing import Optional
+
+'''
+Fractional order ranks
+
+Items (kanban tasks) are sorted by a float "order". A new or moved item gets
+a rank between its neighbours, so only that one document is written:
+
+- first item in an empty list: RANK_STEP
+- after the last item: last + RANK_STEP
+- before the first item: first - RANK_STEP
+- between two items: midpoint
+
+Each midpoint halves the gap. Once a gap is smaller than REBALANCE_GAP the list
+should be re-spaced (RANK_STEP apart) in the background; below MIN_RANK_GAP a
+midpoint is no longer reliable and the list must be re-spaced first.
+'''
+
+RANK_STEP = 1000.0      # Gap between neighbours after create / rebalance
+REBALANCE_GAP = 1e-3    # ~20 inserts into the same gap: rebalance in background
+MIN_RANK_GAP = 1e-9     # Float precision limit (ranks up to ~1e6): rebalance first
+
+
+# ==================================
+# Rank between two neighbours
+# Parameters:
+# - before: rank of the previous item (None = new first item)
+# - after: rank of the next item (None = new last item)
+# Returns:
+# - rank between them
+# ==================================
+def rank_between(
+    before: Optional[float],
+    after: Optional[float]
+) -> float:
+
+    if before is None and after is None:
+        return RANK_STEP
+
+    if before is None:
+        return after - RANK_STEP
+
+    if after is None:
+        return before + RANK_STEP
+
+    return (before + after) / 2
+
+
+# ==================================
+# Gap checks
+# ==================================
+def gap_too_small(
+    before: Optional[float],
+    after: Optional[float],
+    limit: float = MIN_RANK_GAP
+) -> bool:
+
+    if before is None or after is None:
+        return False
+
+    return after - before < limit
@@ -0,0 +1,149 @@
+# Imports
+from typing import Awaitable, Callable, Optional, Type
+from beanie import Document
+from pymongo import UpdateOne
+# Utils
+from app.utils.order_rank import RANK_STEP, REBALANCE_GAP, rank_between, gap_too_small
+
+'''
+Order renormalization
+
+Stages / tasks inserted between two neighbours get the midpoint of their orders.
+Repeated inserts at the same spot halve the gap until float precision runs out
+and orders collide (same value = undefined sort). Before that happens the list
+is renormalized: orders rewritten to RANK_STEP, RANK_STEP * 2, ... in current
+order (ties by _id), with one bulk write.
+
+Each update only matches while the item still has the order that was read and
+still belongs to the list: items moved meanwhile keep their new position.
+'''
+
+
+class ReferenceNotFoundError(LookupError):
+    """
+    Reference item was removed from the list while it was renormalized
+    (services answer 404).
+    """
+
+
+# ==================================
+# Renormalize orders of a list
+# Parameters:
+# - model: Document model with "order" field
+# - query: Filter of the list (e.g. {"boardId": ...})
+# Returns:
+# - new order by document ID (str), only for items that hold it
+#   (items moved meanwhile are left out)
+# ==================================
+async def renormalize_orders(
+    model: Type[Document],
+    query: dict
+) -> dict[str, float]:
+
+    collection = model.get_pymongo_collection()
+
+    # IDs and current orders, read in current order
+    cursor = collection.find(query, {"_id": 1, "order": 1}).sort([("order", 1), ("_id", 1)])
+    documents = [document async for document in cursor]
+
+    if not documents:
+        return {}
+
+    orders = {}
+    operations = []
+
+    for index, document in enumerate(documents):
+        order = (index + 1) * RANK_STEP
+        orders[str(document["_id"])] = order
+
+        if document.get("order") != order:
+            # Skipped when the item was moved or removed from the list after the read
+            operations.append(UpdateOne(
+                {**query, "_id": document["_id"], "order": document.get("order")},
+                {"$set": {"order": order}}
+            ))
+
+    if operations:
+        await collection.bulk_write(operations, ordered=False)
+
+        # Skipped updates are not reported per item: read back what the list holds now
+        cursor = collection.find(
+            {**query, "_id": {"$in": [document["_id"] for document in documents]}},
+            {"_id": 1, "order": 1}
+        )
+        stored = {str(document["_id"]): document.get("order") async for document in cursor}
+
+        orders = {
+            document_id: order for document_id, order in orders.items()
+            if stored.get(document_id) == order
+        }
+
+    return orders
+
+
+# ==================================
+# Order next to a reference item
+# Parameters:
+# - model: Document model with "order" field
+# - query: Filter of the list
+# - reference: Item to insert next to
+# - position: "before" or "after"
+# - on_renormalize: Called after the list was renormalized (optional)
+# Returns:
+# - order for the new item
+# Raises:
+# - ReferenceNotFoundError: reference removed from the list meanwhile
+# ==================================
+async def relative_order(
+    model: Type[Document],
+    query: dict,
+    reference: Document,
+    position: str,
+    on_renormalize: Optional[Callable[[], Awaitable]] = None
+) -> float:
+
+    for attempt in range(2):
+        # Nearest neighbour on that side, equal order included (collision)
+        if position == "after":
+            neighbour = await model.find({
+                **query,
+                "_id": {"$ne": reference.id},
+                "order": {"$gte": reference.order}
+            }).sort([("order", 1), ("_id", 1)]).first_or_none()
+
+            before = reference.order
+            after = neighbour.order if neighbour else None
+        else:
+            neighbour = await model.find({
+                **query,
+                "_id": {"$ne": reference.id},
+                "order": {"$lte": reference.order}
+            }).sort([("order", -1), ("_id", -1)]).first_or_none()
+
+            before = neighbour.order if neighbour else None
+            after = reference.order
+
+        # Collision or gap too small: renormalize list inline, then retry once
+        if attempt == 0 and gap_too_small(before, after, REBALANCE_GAP):
+            orders = await renormalize_orders(model, query)
+
+            if on_renormalize:
+                await on_renormalize()
+
+            if str(reference.id) in orders:
+                reference.order = orders[str(reference.id)]
+                continue
+
+            # Reference moved or deleted by another request meanwhile
+            current = await model.get_pymongo_collection().find_one(
+                {**query, "_id": reference.id},
+                {"order": 1}
+            )
+
+            if current is None:
+                raise ReferenceNotFoundError(str(reference.id))
+
+            reference.order = current.get("order")
+            continue
+
+        return rank_between(before, after)
@@ -0,0 +1,103 @@
+# Imports
+import argparse
+import asyncio
+# Database
+from app.dependencies.database import init_db
+# Models
+from app.models import KanbanStageModel, WorkspaceStageModel
+# Utils
+from app.utils.order_rank import REBALANCE_GAP
+from app.utils.order_renormalize import renormalize_orders
+from app.utils.stages_version import bump_stages_version
+
+'''
+Maintenance: renormalize stage orders of all kanban boards and workspace projects.
+
+By default only boards / projects with colliding orders or gaps below REBALANCE_GAP
+are rewritten (one bulk write each), --all rewrites every one of them.
+Rewritten kanban boards get a new stage order version.
+
+    python -m app.utils.renormalize_stage_orders
+    python -m app.utils.renormalize_stage_orders --all
+'''
+
+# model -> (container field, called with the container ID after it was renormalized)
+STAGE_LISTS = {
+    KanbanStageModel: ("boardId", bump_stages_version),
+    WorkspaceStageModel: ("projectId", None),
+}
+
+
+# ==================================
+# Containers that need renormalization
+# Parameters:
+# - model: Stage model
+# - field: Container field (boardId / projectId)
+# - rewrite_all: Return every container
+# Returns:
+# - container IDs
+# ==================================
+async def find_dense_containers(
+    model,
+    field: str,
+    rewrite_all: bool = False
+) -> list[str]:
+
+    # One pass over all stages sorted by container and order
+    cursor = model.get_pymongo_collection().find(
+        {},
+        {field: 1, "order": 1}
+    ).sort([(field, 1), ("order", 1)])
+
+    containers = []
+    previous_container = previous_order = None
+
+    async for stage in cursor:
+        container = stage.get(field)
+        order = stage.get("order")
+
+        if container != previous_container:
+            if rewrite_all:
+                containers.append(container)
+
+        elif order is None or previous_order is None or order - previous_order < REBALANCE_GAP:
+            if not containers or containers[-1] != container:
+                containers.append(container)
+
+        previous_container, previous_order = container, order
+
+    return containers
+
+
+# ==================================
+# Renormalize all stage lists
+# Returns:
+# - containers rewritten per model
+# ==================================
+async def renormalize_stage_orders(rewrite_all: bool = False) -> dict[str, int]:
+
+    await init_db()
+
+    result = {}
+
+    for model, (field, on_renormalize) in STAGE_LISTS.items():
+        containers = await find_dense_containers(model, field, rewrite_all)
+
+        for container in containers:
+            await renormalize_orders(model, {field: container})
+
+            if on_renormalize:
+                await on_renormalize(container)
+
+        result[model.Settings.name] = len(containers)
+
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Renormalize stage orders")
+    parser.add_argument("--all", action="store_true", help="Rewrite every board / project")
+    args = parser.parse_args()
+
+    for collection, containers in asyncio.run(renormalize_stage_orders(args.all)).items():
+        print(f"{collection}: {containers} renormalized")
@@ -0,0 +1,43 @@
+# Imports
+from bson import ObjectId
+from typing import Optional
+from pymongo import ReturnDocument
+# Models
+from app.models import KanbanBoardModel
+
+'''
+Stage order version
+
+KanbanBoardModel.stagesVersion grows by one on every change of the board's
+stage list or order (create, insert, move, delete, reorder, renormalize).
+Clients send the version they have with a reorder, a stale version gets 409.
+'''
+
+
+# ====================================
+# Increase stage order version
+# Parameters:
+# - board_id: The ID of the board
+# - expected: Current version required for the change (None = any)
+# Returns:
+# - new version, None when the board does not exist or version does not match
+# ====================================
+async def bump_stages_version(
+    board_id: str,
+    expected: Optional[int] = None
+) -> Optional[int]:
+
+    query = {"_id": ObjectId(board_id)}
+
+    if expected is not None:
+        # Boards created before versioning have no field (= version 0)
+        query["stagesVersion"] = expected if expected else {"$in": [0, None]}
+
+    board = await KanbanBoardModel.get_pymongo_collection().find_one_and_update(
+        query,
+        {"$inc": {"stagesVersion": 1}},
+        projection={"stagesVersion": 1},
+        return_document=ReturnDocument.AFTER
+    )
+
+    return board["stagesVersion"] if board else None
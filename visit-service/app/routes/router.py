@@ -3,9 +3,8 @@
 # =========================
 from fastapi import APIRouter, HTTPException, status, Depends
 from typing import Optional
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Utilities
-from app.utils.check_access_token import check_access_token
+from app.dependencies.user_dependency import get_current_user_id
 # Services
 from app.services.session_end_service import end_session
 from app.services.session_start_service import start_session
@@ -20,15 +19,12 @@ router = APIRouter(
     tags=["Visit management service"]
 )
 
-# Authentication dependency using HTTP Bearer token
-security = HTTPBearer()
-
 # =========================
 # ROUTES
 # =========================
 @router.post("/register")
 async def register_visit_route(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Register a visit for the current user.
@@ -37,15 +33,12 @@ async def register_visit_route(
     - Validates user via access token
     - Uses `register_visit` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await register_visit(user_id=user_id)
 
 
 @router.post("/start")
 async def start_session_route(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Start a new session for the current user.
@@ -54,15 +47,12 @@ async def start_session_route(
     - Validates user via access token
     - Uses `start_session` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await start_session(user_id=user_id)
 
 
 @router.post("/end")
 async def end_session_route(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     End the current user's session.
@@ -71,15 +61,12 @@ async def end_session_route(
     - Validates user via access token
     - Uses `end_session` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await end_session(user_id=user_id)
 
 
 @router.get("/stats")
 async def get_week_stats_route(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
+    user_id: str = Depends(get_current_user_id)
 ):
     """
     Get weekly statistics for the current user.
@@ -88,7 +75,4 @@ async def get_week_stats_route(
     - Validates user via access token
     - Uses `get_week_stats` service
     """
-    access_token = credentials.credentials
-    user_id = await check_access_token(access_token)
-
     return await get_week_stats(user_id=user_id)
\ No newline at end of file